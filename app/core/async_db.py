@@ -0,0 +1,152 @@
+# async_db.py
+"""
+모듈 설명:
+    - 비동기 DB 파사드
+주요 기능:
+    - 블로킹 SQLite 작업을 이벤트 루프 밖(고정 크기 워커 스레드)에서 실행
+    - await 가능한 fetch_one / fetch_all / fetch_value / execute / run 제공
+    - 워커 수는 커넥션 풀 크기와 같아서 워커가 커넥션을 기다리지 않는다
+
+작성자: 김도영
+작성일: 2026-10-18
+버전: 1.0
+"""
+import asyncio
+import functools
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from app.core.db_pool import ConnectionPool, get_pool
+from app.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class ExecuteResult:
+    """execute() 결과"""
+    lastrowid: Optional[int]
+    rowcount: int
+
+
+class AsyncDB:
+    """
+    커넥션 풀 위에서 동작하는 비동기 DB 파사드
+
+    - run(fn, *args): fn(conn, *args)를 워커 스레드에서 실행 (여러 쿼리를 묶을 때)
+    - transaction(fn, *args): run과 같지만 성공 시 commit, 예외 시 rollback
+    - fetch_one / fetch_all / fetch_value: 단일 SELECT
+    - execute: 단일 쓰기 + commit
+    """
+
+    def __init__(self, pool: ConnectionPool, max_workers: Optional[int] = None):
+        self.pool = pool
+        self.max_workers = max_workers or pool.size
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="async-db"
+        )
+        self._lock = threading.Lock()
+        self._submitted = 0
+        self._in_flight = 0
+        self._max_in_flight = 0
+
+    def _call(self, fn: Callable[..., Any], args: tuple, kwargs: dict) -> Any:
+        with self._lock:
+            self._in_flight += 1
+            self._max_in_flight = max(self._max_in_flight, self._in_flight)
+        try:
+            with self.pool.connection() as conn:
+                return fn(conn, *args, **kwargs)
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+
+    async def run(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """fn(conn, *args, **kwargs)를 워커 스레드에서 실행"""
+        with self._lock:
+            self._submitted += 1
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, functools.partial(self._call, fn, args, kwargs)
+        )
+
+    async def transaction(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """fn을 하나의 트랜잭션으로 실행 (성공 commit / 실패 rollback)"""
+        def _tx(conn: sqlite3.Connection) -> Any:
+            try:
+                result = fn(conn, *args, **kwargs)
+                conn.commit()
+                return result
+            except Exception:
+                conn.rollback()
+                raise
+
+        return await self.run(_tx)
+
+    async def fetch_one(self, sql: str, params: Sequence[Any] = ()) -> Optional[Dict[str, Any]]:
+        def _fetch(conn: sqlite3.Connection) -> Optional[Dict[str, Any]]:
+            row = conn.execute(sql, params).fetchone()
+            return dict(row) if row else None
+
+        return await self.run(_fetch)
+
+    async def fetch_all(self, sql: str, params: Sequence[Any] = ()) -> List[Dict[str, Any]]:
+        def _fetch(conn: sqlite3.Connection) -> List[Dict[str, Any]]:
+            return [dict(row) for row in conn.execute(sql, params).fetchall()]
+
+        return await self.run(_fetch)
+
+    async def fetch_value(self, sql: str, params: Sequence[Any] = ()) -> Any:
+        """첫 행 첫 컬럼 값 (COUNT 등)"""
+        def _fetch(conn: sqlite3.Connection) -> Any:
+            row = conn.execute(sql, params).fetchone()
+            return row[0] if row else None
+
+        return await self.run(_fetch)
+
+    async def execute(self, sql: str, params: Sequence[Any] = ()) -> ExecuteResult:
+        """단일 쓰기 문장 실행 후 commit"""
+        def _execute(conn: sqlite3.Connection) -> ExecuteResult:
+            cursor = conn.execute(sql, params)
+            return ExecuteResult(lastrowid=cursor.lastrowid, rowcount=cursor.rowcount)
+
+        return await self.transaction(_execute)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "max_workers": self.max_workers,
+                "submitted": self._submitted,
+                "in_flight": self._in_flight,
+                "max_in_flight": self._max_in_flight,
+            }
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=True)
+
+
+# 전역 인스턴스 (최초 사용 시 생성)
+_async_db: Optional[AsyncDB] = None
+_async_db_lock = threading.Lock()
+
+
+def get_async_db() -> AsyncDB:
+    global _async_db
+    if _async_db:
+        return _async_db
+    with _async_db_lock:
+        if _async_db is None:
+            _async_db = AsyncDB(get_pool())
+    return _async_db
+
+
+def close_async_db() -> None:
+    global _async_db
+    with _async_db_lock:
+        if _async_db is not None:
+            _async_db.shutdown()
+            logger.info(f"[ASYNC-DB] 종료: {_async_db.stats()}")
+            _async_db = None
@@ -0,0 +1,122 @@
+# auth_cache.py
+"""
+모듈 설명:
+    - 인증 캐시
+주요 기능:
+    - 검증된 JWT 결과 캐시 (토큰의 exp 까지 유효)
+    - 인증된 사용자(User) 캐시 (짧은 TTL, username 기준)
+    - 관리자 계정이 바뀌면 invalidate_user()로 사용자/토큰 캐시 제거
+
+작성자: 김도영
+작성일: 2026-10-18
+버전: 1.0
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+import jwt
+
+from app.core.config import settings
+from app.core.logger import get_logger
+from app.schemas.user import User
+
+logger = get_logger(__name__)
+
+
+class AuthCache:
+    """토큰 검증 결과 + 사용자 캐시"""
+
+    def __init__(self, user_ttl: float = 60.0, max_tokens: int = 1024):
+        self.user_ttl = user_ttl
+        self.max_tokens = max_tokens
+        # token -> (username, exp epoch)
+        self._tokens: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+        # username -> (User, 만료 monotonic)
+        self._users: Dict[str, Tuple[User, float]] = {}
+        self._lock = threading.Lock()
+        self._token_hits = 0
+        self._token_misses = 0
+        self._user_hits = 0
+        self._user_misses = 0
+
+    def verify_token(self, token: str) -> Optional[str]:
+        """토큰 검증 후 subject(username) 반환, 유효하지 않으면 None"""
+        now = time.time()
+        with self._lock:
+            cached = self._tokens.get(token)
+            if cached is not None:
+                username, exp = cached
+                if exp > now:
+                    self._tokens.move_to_end(token)
+                    self._token_hits += 1
+                    return username
+                del self._tokens[token]
+            self._token_misses += 1
+
+        try:
+            payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+        except jwt.PyJWTError:
+            return None
+
+        username = payload.get("sub")
+        if username is None:
+            return None
+
+        # exp가 없는 토큰은 캐시하지 않음 (매번 검증)
+        exp = payload.get("exp")
+        if exp is not None:
+            with self._lock:
+                self._tokens[token] = (username, float(exp))
+                while len(self._tokens) > self.max_tokens:
+                    self._tokens.popitem(last=False)
+        return username
+
+    def forget_token(self, token: str) -> None:
+        with self._lock:
+            self._tokens.pop(token, None)
+
+    def get_user(self, username: str) -> Optional[User]:
+        with self._lock:
+            cached = self._users.get(username)
+            if cached is not None and cached[1] > time.monotonic():
+                self._user_hits += 1
+                return cached[0]
+            self._users.pop(username, None)
+            self._user_misses += 1
+            return None
+
+    def put_user(self, user: User) -> None:
+        with self._lock:
+            self._users[user.username] = (user, time.monotonic() + self.user_ttl)
+
+    def invalidate_user(self, username: str) -> None:
+        """관리자 계정 변경 시 호출 - 사용자 캐시와 해당 사용자의 토큰 캐시 제거"""
+        with self._lock:
+            self._users.pop(username, None)
+            for token in [t for t, (sub, _) in self._tokens.items() if sub == username]:
+                del self._tokens[token]
+        logger.info(f"[AUTH-CACHE] invalidate: username={username}")
+
+    def clear(self) -> None:
+        with self._lock:
+            self._users.clear()
+            self._tokens.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "tokens": len(self._tokens),
+                "users": len(self._users),
+                "token_hits": self._token_hits,
+                "token_misses": self._token_misses,
+                "user_hits": self._user_hits,
+                "user_misses": self._user_misses,
+            }
+
+
+auth_cache = AuthCache(
+    user_ttl=settings.AUTH_USER_CACHE_TTL,
+    max_tokens=settings.AUTH_TOKEN_CACHE_SIZE,
+)
@@ -0,0 +1,173 @@
+# board_registry.py
+"""
+모듈 설명:
+    - 보드 메타데이터 레지스트리 (프로세스 내 캐시)
+주요 기능:
+    - 보드 정보 + 파싱된 table/list/create_edit/view 메타데이터를 불변 객체로 보관
+    - 최초 조회 시 로드(lazy), save_metadata / 위저드 저장 / 보드 삭제 시 invalidate
+    - hit/miss 카운터 제공
+
+작성자: 김도영
+작성일: 2026-10-18
+버전: 1.0
+"""
+import json
+import sqlite3
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+from app.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+META_NAMES = ("table", "list", "create_edit", "view")
+
+
+class FrozenDict(dict):
+    """수정 불가능한 dict (json 직렬화 / Jinja2 접근은 일반 dict와 동일)"""
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("FrozenDict is read-only")
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def __reduce__(self):
+        # copy / deepcopy / pickle 지원
+        return (FrozenDict, (dict(self),))
+
+
+def freeze(value: Any) -> Any:
+    """dict → FrozenDict, list → tuple (재귀)"""
+    if isinstance(value, dict):
+        return FrozenDict((k, freeze(v)) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(v) for v in value)
+    return value
+
+
+@dataclass(frozen=True)
+class BoardEntry:
+    """보드 1개의 캐시 항목"""
+    info: FrozenDict
+    table_meta: Optional[FrozenDict] = None
+    list_meta: Optional[FrozenDict] = None
+    create_edit_meta: Optional[FrozenDict] = None
+    view_meta: Optional[FrozenDict] = None
+
+    @property
+    def board_id(self) -> int:
+        return self.info["id"]
+
+    @property
+    def physical_table_name(self) -> str:
+        return self.info["physical_table_name"]
+
+    @property
+    def columns(self) -> Tuple[FrozenDict, ...]:
+        """table 메타데이터의 컬럼 정의"""
+        return (self.table_meta or {}).get("columns", ())
+
+    def meta(self, name: str) -> Optional[FrozenDict]:
+        return getattr(self, f"{name}_meta", None)
+
+
+def load_board_entry(conn: sqlite3.Connection, board_id: int) -> Optional[BoardEntry]:
+    """DB에서 보드 정보 + 메타데이터를 읽어 BoardEntry 생성"""
+    cursor = conn.cursor()
+    cursor.execute(
+        "SELECT id, name, physical_table_name, note, created_at, updated_at FROM boards WHERE id = ?",
+        (board_id,)
+    )
+    row = cursor.fetchone()
+    if not row:
+        return None
+
+    info = {
+        "id": row[0],
+        "name": row[1],
+        "physical_table_name": row[2],
+        "note": row[3],
+        "created_at": row[4],
+        "updated_at": row[5]
+    }
+
+    cursor.execute("SELECT name, meta FROM meta_data WHERE board_id = ?", (board_id,))
+    metas: Dict[str, Any] = {}
+    for name, meta_json in cursor.fetchall():
+        if name not in META_NAMES:
+            continue
+        try:
+            metas[f"{name}_meta"] = freeze(json.loads(meta_json))
+        except json.JSONDecodeError:
+            raise ValueError("Invalid JSON in metadata")
+
+    return BoardEntry(info=freeze(info), **metas)
+
+
+class BoardRegistry:
+    """board_id → BoardEntry 캐시"""
+
+    def __init__(self):
+        self._entries: Dict[int, BoardEntry] = {}
+        # invalidate 도중 로드된 오래된 항목이 저장되지 않도록 보드별 세대 번호 관리
+        self._generations: Dict[int, int] = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._invalidations = 0
+
+    def peek(self, board_id: int) -> Optional[BoardEntry]:
+        """캐시에 있으면 반환 (DB 접근 없음)"""
+        with self._lock:
+            entry = self._entries.get(board_id)
+            if entry is not None:
+                self._hits += 1
+            return entry
+
+    def get(self, conn: sqlite3.Connection, board_id: int) -> Optional[BoardEntry]:
+        """캐시 조회, 없으면 conn으로 로드 (동기 - 워커 스레드에서 사용)"""
+        entry = self.peek(board_id)
+        if entry is not None:
+            return entry
+
+        with self._lock:
+            self._misses += 1
+            generation = self._generations.get(board_id, 0)
+
+        entry = load_board_entry(conn, board_id)
+        if entry is None:
+            return None
+
+        with self._lock:
+            if self._generations.get(board_id, 0) == generation:
+                self._entries[board_id] = entry
+        return entry
+
+    def invalidate(self, board_id: int) -> None:
+        with self._lock:
+            self._entries.pop(board_id, None)
+            self._generations[board_id] = self._generations.get(board_id, 0) + 1
+            self._invalidations += 1
+        logger.info(f"[BOARD-REGISTRY] invalidate: board_id={board_id}")
+
+    def clear(self) -> None:
+        with self._lock:
+            for board_id in list(self._entries):
+                self._generations[board_id] = self._generations.get(board_id, 0) + 1
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            total = self._hits + self._misses
+            return {
+                "boards": len(self._entries),
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": round(self._hits / total, 4) if total else 0.0,
+                "invalidations": self._invalidations,
+            }
+
+
+board_registry = BoardRegistry()
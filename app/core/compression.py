@@ -0,0 +1,35 @@
+# compression.py
+"""
+모듈 설명:
+    - 응답 gzip 압축 미들웨어 (경로 제외 지원)
+주요 기능:
+    - 큰 JSON / HTML 응답은 Starlette GZipMiddleware 로 압축
+    - 제외 경로는 그대로 통과
+        · /static/    : 정적 파일은 사전 압축 변형을 직접 선택 (app.core.static_assets)
+        · /api/files/ : 첨부 파일은 Range / Content-Length / ETag 를 원본 바이트 기준으로 유지
+
+작성자: 김도영
+작성일: 2026-10-18
+버전: 1.0
+"""
+from typing import Sequence
+
+from starlette.middleware.gzip import GZipMiddleware
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+DEFAULT_EXCLUDED_PATHS = ("/static/", "/api/files/")
+
+
+class SelectiveGZipMiddleware(GZipMiddleware):
+    """exclude_paths 로 시작하는 요청은 압축하지 않는 GZipMiddleware"""
+
+    def __init__(self, app: ASGIApp, minimum_size: int = 500, compresslevel: int = 9,
+                 exclude_paths: Sequence[str] = DEFAULT_EXCLUDED_PATHS) -> None:
+        super().__init__(app, minimum_size=minimum_size, compresslevel=compresslevel)
+        self.exclude_paths = tuple(exclude_paths)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and scope["path"].startswith(self.exclude_paths):
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
@@ -34,9 +34,53 @@ class Settings(BaseSettings):
     #---------------------------------------------------------
     BASE_DIR: Path = Path(os.getenv("BASE_DIR", "./data"))
     DB_PATH: str = os.getenv("DB_PATH", "./data/db/autoboard.db")
-    
 
+    #---------------------------------------------------------
+    # DB 커넥션 풀 / SQLite 튜닝
+    #---------------------------------------------------------
+    DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", 5))
+    DB_POOL_TIMEOUT: float = float(os.getenv("DB_POOL_TIMEOUT", 30))
+    DB_POOL_SLOW_WAIT_MS: int = int(os.getenv("DB_POOL_SLOW_WAIT_MS", 50))
+    DB_BUSY_TIMEOUT_MS: int = int(os.getenv("DB_BUSY_TIMEOUT_MS", 5000))
+    DB_CACHE_SIZE_KB: int = int(os.getenv("DB_CACHE_SIZE_KB", 16384))  # 16MB
+    DB_MMAP_SIZE: int = int(os.getenv("DB_MMAP_SIZE", 128 * 1024 * 1024))  # 128MB
+
+    #---------------------------------------------------------
+    # 레코드 쓰기 (단일 writer, group commit)
+    #---------------------------------------------------------
+    DB_WRITE_BATCH_SIZE: int = int(os.getenv("DB_WRITE_BATCH_SIZE", 64))
+    DB_WRITE_COMMIT_LATENCY_MS: float = float(os.getenv("DB_WRITE_COMMIT_LATENCY_MS", 2))
+    DB_WRITE_QUEUE_SIZE: int = int(os.getenv("DB_WRITE_QUEUE_SIZE", 1000))
+    IMPORT_CHUNK_SIZE: int = int(os.getenv("IMPORT_CHUNK_SIZE", 500))  # 가져오기 chunk(트랜잭션)당 행 수
+
+    #---------------------------------------------------------
+    # 렌더링 캐시
+    #---------------------------------------------------------
+    FRAGMENT_CACHE_MAX_BYTES: int = int(os.getenv("FRAGMENT_CACHE_MAX_BYTES", 16 * 1024 * 1024))  # 16MB
+    TEMPLATE_CACHE_DIR: Path = Path(os.getenv("TEMPLATE_CACHE_DIR", "./data/cache/templates"))  # Jinja2 bytecode 캐시
+
+    #---------------------------------------------------------
+    # 정적 파일 / 응답 압축
+    #---------------------------------------------------------
+    GZIP_MIN_SIZE: int = int(os.getenv("GZIP_MIN_SIZE", 1024))  # 이보다 작은 응답/정적 파일은 압축하지 않음
+    STATIC_MAX_AGE: int = int(os.getenv("STATIC_MAX_AGE", 365 * 24 * 3600))  # 지문(hash) 붙은 정적 파일 캐시 기간
+
+    #---------------------------------------------------------
+    # 첨부 파일
+    #---------------------------------------------------------
     FILES_DIR: Path = Path(os.getenv("FILES_DIR", "./data/files"))
+    UPLOAD_MAX_BYTES: int = int(os.getenv("UPLOAD_MAX_BYTES", 100 * 1024 * 1024))  # 파일 1개 최대 크기 (0 = 제한 없음)
+    UPLOAD_CHUNK_SIZE: int = int(os.getenv("UPLOAD_CHUNK_SIZE", 1024 * 1024))  # 업로드 복사 단위 (1MB)
+    FILE_CACHE_MAX_AGE: int = int(os.getenv("FILE_CACHE_MAX_AGE", 365 * 24 * 3600))  # ?v=<hash> 다운로드 URL 캐시 기간
+    THUMB_SIZE: int = int(os.getenv("THUMB_SIZE", 256))  # 목록용 정사각 썸네일 (px)
+    PREVIEW_SIZE: int = int(os.getenv("PREVIEW_SIZE", 1024))  # 상세 보기용 미리보기 최대 변 길이 (px)
+    THUMB_QUALITY: int = int(os.getenv("THUMB_QUALITY", 85))  # JPEG 품질
+    THUMB_QUEUE_SIZE: int = int(os.getenv("THUMB_QUEUE_SIZE", 100))  # 업로드 후 생성 대기열 (가득 차면 요청 시 생성)
+    FILE_GC_INTERVAL_HOURS: float = float(os.getenv("FILE_GC_INTERVAL_HOURS", 0))  # 고아 첨부 정리 주기 (0 = 자동 실행 안 함)
+    FILE_GC_GRACE_HOURS: float = float(os.getenv("FILE_GC_GRACE_HOURS", 24))  # 이보다 최근에 올라온 파일은 정리하지 않음
+    FILE_GC_BATCH_SIZE: int = int(os.getenv("FILE_GC_BATCH_SIZE", 200))  # 트랜잭션 1개당 삭제 건수
+    # file_match 가 없는 files 행도 삭제 (기본 끔 - 아직 file_match 를 쓰는 코드가 없어 모든 업로드가 대상이 됨)
+    FILE_GC_UNMATCHED: bool = False
        
     #---------------------------------------------------------
     # 보안
@@ -44,6 +88,8 @@ class Settings(BaseSettings):
     SECRET_KEY: str = os.getenv("SECRET_KEY", "your-secret-key-change-this")
     ALGORITHM: str = os.getenv("ALGORITHM", "HS256")
     ACCESS_TOKEN_EXPIRE_MINUTES: int = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", 30))
+    AUTH_USER_CACHE_TTL: float = float(os.getenv("AUTH_USER_CACHE_TTL", 60))  # 초
+    AUTH_TOKEN_CACHE_SIZE: int = int(os.getenv("AUTH_TOKEN_CACHE_SIZE", 1024))
     
     #---------------------------------------------------------
     # 실행 
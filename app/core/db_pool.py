@@ -0,0 +1,196 @@
+# db_pool.py
+"""
+모듈 설명:
+    - SQLite 커넥션 풀
+주요 기능:
+    - 요청마다 connect/close 하지 않고 미리 튜닝된 커넥션을 재사용
+    - 커넥션 생성 시 1회 PRAGMA 적용 (WAL, synchronous=NORMAL, cache/mmap, temp_store, foreign_keys)
+    - checkout 대기 시간 통계 제공
+
+작성자: 김도영
+작성일: 2026-10-18
+버전: 1.0
+"""
+import queue
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
+
+from app.core.config import settings
+from app.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def configure_connection(conn: sqlite3.Connection) -> sqlite3.Connection:
+    """커넥션 1회 튜닝 (PRAGMA 적용)"""
+    conn.row_factory = sqlite3.Row
+    cursor = conn.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    # cache_size 음수값은 KiB 단위
+    cursor.execute(f"PRAGMA cache_size=-{int(settings.DB_CACHE_SIZE_KB)}")
+    cursor.execute(f"PRAGMA mmap_size={int(settings.DB_MMAP_SIZE)}")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.execute(f"PRAGMA busy_timeout={int(settings.DB_BUSY_TIMEOUT_MS)}")
+    cursor.close()
+    return conn
+
+
+def create_connection(db_path: Optional[str] = None) -> sqlite3.Connection:
+    """튜닝된 새 커넥션 생성 (풀 외부에서 전용 커넥션이 필요할 때도 사용)"""
+    conn = sqlite3.connect(
+        db_path or settings.DB_PATH,
+        check_same_thread=False,
+        timeout=settings.DB_BUSY_TIMEOUT_MS / 1000,
+    )
+    return configure_connection(conn)
+
+
+class ConnectionPool:
+    """
+    고정 크기 SQLite 커넥션 풀
+
+    - 커넥션은 필요할 때 최대 size 개까지 생성되고, 반납되면 재사용된다.
+    - 모든 커넥션이 사용 중이면 timeout 초까지 대기 후 TimeoutError.
+    """
+
+    def __init__(self, db_path: str, size: int = 5, timeout: float = 30.0):
+        self.db_path = db_path
+        self.size = max(1, size)
+        self.timeout = timeout
+
+        self._idle: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue()
+        self._lock = threading.Lock()
+        self._created = 0
+        self._closed = False
+
+        # 통계
+        self._checkouts = 0
+        self._waits = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+
+    def _try_create(self) -> Optional[sqlite3.Connection]:
+        with self._lock:
+            if self._created >= self.size:
+                return None
+            self._created += 1
+        try:
+            conn = create_connection(self.db_path)
+        except Exception:
+            with self._lock:
+                self._created -= 1
+            raise
+        logger.info(f"[DB-POOL] 커넥션 생성 ({self._created}/{self.size})")
+        return conn
+
+    def acquire(self) -> sqlite3.Connection:
+        """커넥션 checkout"""
+        if self._closed:
+            raise RuntimeError("Connection pool is closed")
+
+        started = time.perf_counter()
+        try:
+            conn = self._idle.get_nowait()
+        except queue.Empty:
+            conn = self._try_create()
+            if conn is None:
+                try:
+                    conn = self._idle.get(timeout=self.timeout)
+                except queue.Empty:
+                    raise TimeoutError(
+                        f"No database connection available within {self.timeout}s"
+                    )
+        waited = time.perf_counter() - started
+
+        with self._lock:
+            self._checkouts += 1
+            self._wait_total += waited
+            if waited > self._wait_max:
+                self._wait_max = waited
+            if waited >= settings.DB_POOL_SLOW_WAIT_MS / 1000:
+                self._waits += 1
+                logger.warning(f"[DB-POOL] checkout 대기 {waited * 1000:.1f}ms")
+        return conn
+
+    def release(self, conn: sqlite3.Connection) -> None:
+        """커넥션 반납 (열린 트랜잭션은 롤백)"""
+        if self._closed:
+            conn.close()
+            return
+        try:
+            if conn.in_transaction:
+                conn.rollback()
+        except sqlite3.Error as e:
+            # 망가진 커넥션은 버리고 다음 checkout 때 새로 생성
+            logger.warning(f"[DB-POOL] 커넥션 폐기: {e}")
+            conn.close()
+            with self._lock:
+                self._created -= 1
+            return
+        self._idle.put(conn)
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        conn = self.acquire()
+        try:
+            yield conn
+        finally:
+            self.release(conn)
+
+    def stats(self) -> Dict[str, Any]:
+        """checkout 대기 시간 등 풀 통계"""
+        with self._lock:
+            avg = self._wait_total / self._checkouts if self._checkouts else 0.0
+            return {
+                "size": self.size,
+                "created": self._created,
+                "idle": self._idle.qsize(),
+                "checkouts": self._checkouts,
+                "slow_waits": self._waits,
+                "wait_avg_ms": round(avg * 1000, 3),
+                "wait_max_ms": round(self._wait_max * 1000, 3),
+                "wait_total_ms": round(self._wait_total * 1000, 3),
+            }
+
+    def close(self) -> None:
+        """풀 종료 (유휴 커넥션 close)"""
+        self._closed = True
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            conn.close()
+        logger.info(f"[DB-POOL] 종료: {self.stats()}")
+
+
+# 전역 풀 (최초 사용 시 생성)
+_pool: Optional[ConnectionPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_pool() -> ConnectionPool:
+    global _pool
+    if _pool:
+        return _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ConnectionPool(
+                settings.DB_PATH,
+                size=settings.DB_POOL_SIZE,
+                timeout=settings.DB_POOL_TIMEOUT,
+            )
+    return _pool
+
+
+def close_pool() -> None:
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.close()
+            _pool = None
@@ -0,0 +1,251 @@
+# db_writer.py
+"""
+모듈 설명:
+    - 단일 writer 큐 (group commit)
+주요 기능:
+    - 레코드 쓰기 요청(write intent)을 큐에 넣으면 전용 writer 태스크가 모아서
+      하나의 트랜잭션으로 commit (요청마다 fsync 하지 않음)
+    - intent마다 SAVEPOINT를 사용하므로 하나가 실패해도 같은 그룹의 나머지는 commit
+    - 각 호출자의 future는 lastrowid/rowcount(또는 함수 결과)로 resolve
+    - commit 직전 hook (예: 검색 색인 대기열 반영) - 같은 트랜잭션, 실패해도 쓰기는 commit
+    - 배치 크기 / commit 대기시간은 Settings에서 설정
+
+작성자: 김도영
+작성일: 2026-10-18
+버전: 1.0
+"""
+import asyncio
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from app.core.async_db import ExecuteResult
+from app.core.config import settings
+from app.core.db_pool import create_connection
+from app.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class WriteIntent:
+    """writer 큐에 들어가는 쓰기 요청 (fn은 writer 커넥션으로 실행됨)"""
+    fn: Callable[[sqlite3.Connection], Any]
+    future: "asyncio.Future[Any]"
+
+
+class DBWriter:
+    """
+    전용 커넥션 1개로 모든 레코드 쓰기를 직렬화하는 writer
+
+    - batch_size: 한 트랜잭션에 묶을 최대 intent 수
+    - commit_latency_ms: 첫 intent 이후 추가 intent를 기다리는 최대 시간
+    """
+
+    def __init__(
+        self,
+        db_path: Optional[str] = None,
+        batch_size: int = 64,
+        commit_latency_ms: float = 2.0,
+        queue_size: int = 1000,
+    ):
+        self.db_path = db_path or settings.DB_PATH
+        self.batch_size = max(1, batch_size)
+        self.commit_latency = max(0.0, commit_latency_ms) / 1000
+        self.queue_size = queue_size
+
+        self._queue: Optional["asyncio.Queue[Optional[WriteIntent]]"] = None
+        self._task: Optional[asyncio.Task] = None
+        self._conn: Optional[sqlite3.Connection] = None
+        self._commit_hooks: List[Callable[[sqlite3.Connection], Any]] = []
+        # sqlite 작업은 항상 같은 스레드 하나에서 실행
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="db-writer")
+
+        # 통계
+        self._lock = threading.Lock()
+        self._intents = 0
+        self._batches = 0
+        self._failed = 0
+        self._max_batch = 0
+        self._commit_total = 0.0
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def start(self) -> None:
+        if self.running:
+            return
+        loop = asyncio.get_running_loop()
+        self._conn = await loop.run_in_executor(self._executor, create_connection, self.db_path)
+        self._queue = asyncio.Queue(maxsize=self.queue_size)
+        self._task = asyncio.create_task(self._run(), name="db-writer")
+        logger.info(
+            f"[DB-WRITER] 시작: batch_size={self.batch_size}, "
+            f"commit_latency={self.commit_latency * 1000:.1f}ms"
+        )
+
+    async def stop(self) -> None:
+        """큐에 남은 intent를 모두 처리한 뒤 종료"""
+        if not self.running:
+            return
+        await self._queue.put(None)
+        await self._task
+        self._task = None
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(self._executor, self._conn.close)
+        self._conn = None
+        logger.info(f"[DB-WRITER] 종료: {self.stats()}")
+
+    def add_commit_hook(self, fn: Callable[[sqlite3.Connection], Any]) -> None:
+        """배치마다 commit 직전에 writer 커넥션으로 실행할 함수 등록"""
+        if fn not in self._commit_hooks:
+            self._commit_hooks.append(fn)
+
+    async def call(self, fn: Callable[[sqlite3.Connection], Any]) -> Any:
+        """fn(conn)을 다음 그룹 트랜잭션 안에서 실행하고 결과를 반환"""
+        if not self.running:
+            raise RuntimeError("DB writer is not running")
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put(WriteIntent(fn=fn, future=future))
+        return await future
+
+    async def execute(self, sql: str, params: Sequence[Any] = ()) -> ExecuteResult:
+        """단일 쓰기 문장을 큐에 넣고 commit 후 결과를 반환"""
+        def _execute(conn: sqlite3.Connection) -> ExecuteResult:
+            cursor = conn.execute(sql, params)
+            return ExecuteResult(lastrowid=cursor.lastrowid, rowcount=cursor.rowcount)
+
+        return await self.call(_execute)
+
+    async def _collect(self, first: WriteIntent) -> Tuple[List[WriteIntent], bool]:
+        """첫 intent 이후 batch_size 또는 commit_latency까지 모으기"""
+        loop = asyncio.get_running_loop()
+        batch = [first]
+        deadline = loop.time() + self.commit_latency
+        while len(batch) < self.batch_size:
+            try:
+                intent = self._queue.get_nowait()
+            except asyncio.QueueEmpty:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    intent = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+            if intent is None:
+                return batch, True
+            batch.append(intent)
+        return batch, False
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        stopping = False
+        while not stopping:
+            first = await self._queue.get()
+            if first is None:
+                break
+            batch, stopping = await self._collect(first)
+
+            try:
+                outcomes = await loop.run_in_executor(self._executor, self._commit_batch, batch)
+            except Exception as e:
+                # commit 자체가 실패하면 그룹 전체 실패
+                logger.error(f"[DB-WRITER] 그룹 commit 실패 ({len(batch)}건): {e}")
+                outcomes = [(False, e)] * len(batch)
+
+            for intent, (ok, value) in zip(batch, outcomes):
+                if intent.future.done():
+                    continue
+                if ok:
+                    intent.future.set_result(value)
+                else:
+                    intent.future.set_exception(value)
+
+    def _commit_batch(self, batch: List[WriteIntent]) -> List[Tuple[bool, Any]]:
+        """writer 스레드: 배치를 하나의 트랜잭션으로 실행"""
+        conn = self._conn
+        started = time.perf_counter()
+        outcomes: List[Tuple[bool, Any]] = []
+        failed = 0
+
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            for intent in batch:
+                conn.execute("SAVEPOINT write_intent")
+                try:
+                    value = intent.fn(conn)
+                    conn.execute("RELEASE write_intent")
+                    outcomes.append((True, value))
+                except Exception as e:
+                    conn.execute("ROLLBACK TO write_intent")
+                    conn.execute("RELEASE write_intent")
+                    outcomes.append((False, e))
+                    failed += 1
+            self._run_commit_hooks(conn)
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+
+        elapsed = time.perf_counter() - started
+        with self._lock:
+            self._intents += len(batch)
+            self._batches += 1
+            self._failed += failed
+            self._max_batch = max(self._max_batch, len(batch))
+            self._commit_total += elapsed
+        return outcomes
+
+    def _run_commit_hooks(self, conn: sqlite3.Connection) -> None:
+        for hook in self._commit_hooks:
+            conn.execute("SAVEPOINT commit_hook")
+            try:
+                hook(conn)
+                conn.execute("RELEASE commit_hook")
+            except Exception as e:
+                # hook 실패는 쓰기 결과에 영향 없음 (다음 배치에서 다시 시도)
+                conn.execute("ROLLBACK TO commit_hook")
+                conn.execute("RELEASE commit_hook")
+                logger.warning(f"[DB-WRITER] commit hook 실패: {getattr(hook, '__name__', hook)}, {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            batches = self._batches or 1
+            return {
+                "running": self.running,
+                "queued": self._queue.qsize() if self._queue else 0,
+                "intents": self._intents,
+                "failed": self._failed,
+                "batches": self._batches,
+                "avg_batch": round(self._intents / batches, 2),
+                "max_batch": self._max_batch,
+                "avg_commit_ms": round(self._commit_total / batches * 1000, 3),
+            }
+
+
+# 전역 writer (startup에서 start, shutdown에서 stop)
+_writer: Optional[DBWriter] = None
+
+
+def get_db_writer() -> DBWriter:
+    global _writer
+    if _writer is None:
+        _writer = DBWriter(
+            settings.DB_PATH,
+            batch_size=settings.DB_WRITE_BATCH_SIZE,
+            commit_latency_ms=settings.DB_WRITE_COMMIT_LATENCY_MS,
+            queue_size=settings.DB_WRITE_QUEUE_SIZE,
+        )
+    return _writer
+
+
+async def close_db_writer() -> None:
+    global _writer
+    if _writer is not None:
+        await _writer.stop()
+        _writer = None
@@ -11,18 +11,28 @@
 """
 from typing import Optional
 from fastapi import Request
-import jwt
-from app.core.config import settings
+from app.core.auth_cache import auth_cache
+from app.core.db_pool import get_pool
+from app.core.async_db import AsyncDB, get_async_db
+from app.core.db_writer import DBWriter, get_db_writer
 from app.schemas.user import User  # Import schema
-import sqlite3
+
+def get_db() -> AsyncDB:
+    # 비동기 DB 파사드 (블로킹 SQLite 작업은 워커 스레드에서 실행)
+    return get_async_db()
+
+def get_writer() -> DBWriter:
+    # 레코드 쓰기 전용 writer (큐 + group commit)
+    return get_db_writer()
 
 def get_db_connection():
-    conn = sqlite3.connect(settings.DB_PATH, check_same_thread=False)
-    conn.row_factory = sqlite3.Row
+    # 풀에서 튜닝된 커넥션을 빌려오고 요청이 끝나면 반납
+    pool = get_pool()
+    conn = pool.acquire()
     try:
         yield conn
     finally:
-        conn.close()
+        pool.release(conn)
 
 async def get_current_user_from_cookie(request: Request) -> Optional[User]:
     token = request.cookies.get("access_token")
@@ -33,29 +43,24 @@ async def get_current_user_from_cookie(request: Request) -> Optional[User]:
     if token.startswith("Bearer "):
         token = token.split(" ")[1]
 
-    try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-        username: str = payload.get("sub")
-        if username is None:
-            return None
-    except jwt.PyJWTError: 
+    # 토큰 검증 (캐시: 토큰 만료 시각까지)
+    username = auth_cache.verify_token(token)
+    if username is None:
         return None
 
-    # DB에서 유저 확인
-    conn = sqlite3.connect(settings.DB_PATH)
-    conn.row_factory = sqlite3.Row
-    cursor = conn.cursor()
-    cursor.execute("SELECT * FROM admin_users WHERE username = ?", (username,))
-    row = cursor.fetchone()
-    conn.close()
+    # 유저 확인 (캐시: 짧은 TTL, miss일 때만 풀 커넥션으로 조회)
+    user = auth_cache.get_user(username)
+    if user:
+        return user
 
+    row = await get_async_db().fetch_one("SELECT * FROM admin_users WHERE username = ?", (username,))
     if row:
-        # Convert row to dict, then to User model
-        user_dict = dict(row)
         # SQLite's timestamp might need parsing if Pydantic complains, but typically it works.
         # However, to be safe, let Pydantic handle it.
         try:
-            return User(**user_dict)
+            user = User(**row)
         except Exception:
             return None # Validation error fallback
+        auth_cache.put_user(user)
+        return user
     return None
@@ -0,0 +1,113 @@
+# fragment_cache.py
+"""
+모듈 설명:
+    - 렌더링된 HTML 조각 캐시 (크기 제한 LRU)
+주요 기능:
+    - 키 = (템플릿, board_id, 보드 데이터 버전, 요청 파라미터) → 사용자와 무관한 본문 HTML
+    - 레코드 쓰기 / 메타데이터 저장은 데이터 버전을 올리므로 이전 버전 항목은 더 이상 hit 되지 않음
+    - 새 버전 항목이 들어오면 같은 보드의 이전 버전 항목을 즉시 제거, 보드 삭제 시 invalidate_board()
+    - 적중률 / 보유 바이트 통계
+
+작성자: 김도영
+작성일: 2026-10-18
+버전: 1.0
+"""
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+from app.core.config import settings
+from app.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+# (템플릿, board_id, data_version, 파라미터)
+FragmentKey = Tuple[str, int, int, Hashable]
+
+
+class FragmentCache:
+    """board 데이터 버전으로 무효화되는 HTML 조각 LRU"""
+
+    def __init__(self, max_bytes: int = 16 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[FragmentKey, str]" = OrderedDict()
+        # board_id -> 캐시에 들어 있는 최신 데이터 버전
+        self._versions: Dict[int, int] = {}
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @staticmethod
+    def _size(html: str) -> int:
+        return len(html.encode("utf-8"))
+
+    def get(self, key: FragmentKey) -> Optional[str]:
+        with self._lock:
+            html = self._entries.get(key)
+            if html is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return html
+
+    def put(self, key: FragmentKey, html: str) -> None:
+        size = self._size(html)
+        if size > self.max_bytes:
+            return
+        _, board_id, version, _ = key
+        with self._lock:
+            latest = self._versions.get(board_id)
+            if latest is not None and version < latest:
+                # 느린 요청이 이전 버전을 렌더링한 경우 - 저장하지 않음
+                return
+            if latest is not None and version > latest:
+                self._drop_board(board_id)
+            self._versions[board_id] = version
+
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= self._size(old)
+            self._entries[key] = html
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= self._size(evicted)
+                self._evictions += 1
+
+    def _drop_board(self, board_id: int) -> int:
+        keys = [key for key in self._entries if key[1] == board_id]
+        for key in keys:
+            self._bytes -= self._size(self._entries.pop(key))
+        return len(keys)
+
+    def invalidate_board(self, board_id: int) -> None:
+        with self._lock:
+            dropped = self._drop_board(board_id)
+            self._versions.pop(board_id, None)
+        if dropped:
+            logger.info(f"[FRAGMENT-CACHE] invalidate: board_id={board_id}, entries={dropped}")
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._versions.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            total = self._hits + self._misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": round(self._hits / total, 4) if total else None,
+                "evictions": self._evictions,
+            }
+
+
+fragment_cache = FragmentCache(max_bytes=settings.FRAGMENT_CACHE_MAX_BYTES)
@@ -0,0 +1,208 @@
+# static_assets.py
+"""
+모듈 설명:
+    - 정적 파일 지문(fingerprint) + 사전 압축 서빙
+주요 기능:
+    - 시작 시 static 디렉토리를 스캔해 논리 이름 → 내용 해시 파일명 manifest 작성 (js/records.js → js/records.1a2b3c4d5e.js)
+    - 해시 파일명은 Cache-Control: immutable (내용이 바뀌면 URL 이 바뀜), 논리 이름은 매번 재검증
+    - css/js 등 텍스트 파일은 gzip 변형을 미리 만들어 두고 Accept-Encoding 에 따라 선택
+    - 템플릿 전역 static_url('js/records.js') 로 해시 URL 출력
+    - DEBUG 모드에서는 파일 수정 시각/크기가 바뀌면 해당 항목만 다시 계산
+
+작성자: 김도영
+작성일: 2026-10-18
+버전: 1.0
+"""
+import gzip
+import hashlib
+import mimetypes
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from starlette.responses import Response
+from starlette.staticfiles import StaticFiles
+from starlette.types import Scope
+
+from app.core.config import settings
+from app.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+HASH_LENGTH = 10
+COMPRESSIBLE_SUFFIXES = (".css", ".js", ".mjs", ".json", ".map", ".svg", ".txt", ".html")
+REVALIDATE = "no-cache"
+
+
+def _accepts_gzip(header: str) -> bool:
+    """Accept-Encoding 에 gzip 이 있고 q=0 이 아닌지"""
+    for item in header.split(","):
+        coding, _, params = item.strip().partition(";")
+        if coding.strip().lower() not in ("gzip", "*"):
+            continue
+        params = params.strip().replace(" ", "")
+        if params.startswith("q="):
+            try:
+                return float(params[2:]) > 0
+            except ValueError:
+                return False
+        return True
+    return False
+
+
+class StaticAsset:
+    """manifest 항목 (논리 이름 1개)"""
+
+    __slots__ = ("logical", "hashed", "digest", "mtime_ns", "size", "media_type", "gzip_body")
+
+    def __init__(self, logical: str, data: bytes, mtime_ns: int, gzip_min_size: int):
+        self.logical = logical
+        self.digest = hashlib.sha256(data).hexdigest()[:HASH_LENGTH]
+        stem, dot, suffix = logical.rpartition(".")
+        self.hashed = f"{stem}.{self.digest}.{suffix}" if dot and "/" not in suffix else f"{logical}.{self.digest}"
+        self.mtime_ns = mtime_ns
+        self.size = len(data)
+        self.media_type = mimetypes.guess_type(logical)[0] or "application/octet-stream"
+        self.gzip_body: Optional[bytes] = None
+        if logical.endswith(COMPRESSIBLE_SUFFIXES) and self.size >= gzip_min_size:
+            # mtime=0 → 같은 내용이면 같은 바이트 (재시작해도 ETag 동일)
+            body = gzip.compress(data, compresslevel=9, mtime=0)
+            if len(body) < self.size:
+                self.gzip_body = body
+
+    def etag(self, encoded: bool) -> str:
+        return f'"{self.digest}-gz"' if encoded else f'"{self.digest}"'
+
+
+class StaticAssetManifest:
+    """논리 이름 ↔ 해시 파일명 매핑"""
+
+    def __init__(self, directory: Path, url_prefix: str = "/static", gzip_min_size: int = 1024,
+                 auto_refresh: bool = False):
+        self.directory = Path(directory)
+        self.url_prefix = url_prefix.rstrip("/")
+        self.gzip_min_size = gzip_min_size
+        self.auto_refresh = auto_refresh
+        self._assets: Dict[str, StaticAsset] = {}
+        # 해시 파일명 → 논리 이름 (DEBUG 재계산 후에도 이전 해시 URL 은 현재 내용으로 응답)
+        self._hashed: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        self._missing: set = set()
+
+    def _load(self, logical: str) -> Optional[StaticAsset]:
+        path = self.directory / logical
+        try:
+            stat = path.stat()
+            asset = StaticAsset(logical, path.read_bytes(), stat.st_mtime_ns, self.gzip_min_size)
+        except OSError as e:
+            logger.warning(f"[STATIC] 파일 읽기 실패: {logical}, {e}")
+            return None
+        self._assets[logical] = asset
+        self._hashed[asset.hashed] = logical
+        return asset
+
+    def build(self) -> "StaticAssetManifest":
+        with self._lock:
+            self._assets.clear()
+            self._hashed.clear()
+            if self.directory.is_dir():
+                for path in sorted(self.directory.rglob("*")):
+                    relative = path.relative_to(self.directory)
+                    if path.is_file() and not any(part.startswith(".") for part in relative.parts):
+                        self._load(relative.as_posix())
+        stats = self.stats()
+        logger.info(
+            f"[STATIC] manifest: {stats['files']}개, {stats['bytes']}B, "
+            f"gzip {stats['gzip_files']}개 ({stats['gzip_bytes']}B)"
+        )
+        return self
+
+    def get(self, logical: str) -> Optional[StaticAsset]:
+        logical = logical.lstrip("/")
+        with self._lock:
+            asset = self._assets.get(logical)
+            if asset is not None and self.auto_refresh:
+                try:
+                    stat = (self.directory / logical).stat()
+                except OSError:
+                    return None
+                if (stat.st_mtime_ns, stat.st_size) != (asset.mtime_ns, asset.size):
+                    asset = self._load(logical)
+            elif asset is None and self.auto_refresh and ".." not in Path(logical).parts \
+                    and (self.directory / logical).is_file():
+                # DEBUG 중 새로 추가된 파일 (static 디렉토리 밖 경로는 제외)
+                asset = self._load(logical)
+            return asset
+
+    def resolve(self, path: str) -> Tuple[Optional[StaticAsset], bool]:
+        """요청 경로 → (항목, 해시 파일명 여부)"""
+        path = path.lstrip("/")
+        with self._lock:
+            logical = self._hashed.get(path)
+        if logical is not None:
+            return self.get(logical), True
+        return self.get(path), False
+
+    def url(self, logical: str) -> str:
+        """템플릿 helper: 논리 이름 → 해시 URL (manifest 에 없으면 원래 경로)"""
+        asset = self.get(logical)
+        if asset is None:
+            logical = logical.lstrip("/")
+            if logical not in self._missing:
+                self._missing.add(logical)
+                logger.warning(f"[STATIC] manifest 에 없는 정적 파일: {logical}")
+            return f"{self.url_prefix}/{logical}"
+        return f"{self.url_prefix}/{asset.hashed}"
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            assets = list(self._assets.values())
+        compressed = [asset for asset in assets if asset.gzip_body is not None]
+        return {
+            "files": len(assets),
+            "bytes": sum(asset.size for asset in assets),
+            "gzip_files": len(compressed),
+            "gzip_bytes": sum(len(asset.gzip_body) for asset in compressed),
+            "gzip_source_bytes": sum(asset.size for asset in compressed),
+            "auto_refresh": self.auto_refresh,
+        }
+
+
+class FingerprintedStaticFiles(StaticFiles):
+    """manifest 를 사용하는 StaticFiles (해시 파일명 → immutable, gzip 변형 선택)"""
+
+    def __init__(self, *, manifest: StaticAssetManifest, max_age: Optional[int] = None, **kwargs):
+        super().__init__(directory=str(manifest.directory), **kwargs)
+        self.manifest = manifest
+        self.max_age = settings.STATIC_MAX_AGE if max_age is None else max_age
+
+    def _cache_control(self, fingerprinted: bool) -> str:
+        return f"public, max-age={self.max_age}, immutable" if fingerprinted else REVALIDATE
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        asset, fingerprinted = self.manifest.resolve(Path(path).as_posix())
+        if asset is None or scope["method"] not in ("GET", "HEAD"):
+            return await super().get_response(path, scope)
+
+        headers = {k.decode("latin-1").lower(): v.decode("latin-1") for k, v in scope.get("headers", [])}
+        encoded = asset.gzip_body is not None and _accepts_gzip(headers.get("accept-encoding", ""))
+        etag = asset.etag(encoded)
+        response_headers = {"ETag": etag, "Cache-Control": self._cache_control(fingerprinted)}
+        if asset.gzip_body is not None:
+            response_headers["Vary"] = "Accept-Encoding"
+
+        if_none_match = headers.get("if-none-match")
+        if if_none_match and (
+            if_none_match.strip() == "*"
+            or etag in [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+        ):
+            return Response(status_code=304, headers=response_headers)
+
+        if encoded:
+            response_headers["Content-Encoding"] = "gzip"
+            return Response(asset.gzip_body, media_type=asset.media_type, headers=response_headers)
+
+        # 비압축 본문은 파일에서 직접 (FileResponse 의 Range / HEAD 처리 유지)
+        response = await super().get_response(asset.logical, scope)
+        response.headers.update(response_headers)
+        return response
@@ -0,0 +1,103 @@
+# template_env.py
+"""
+모듈 설명:
+    - Jinja2 템플릿 환경 (bytecode 캐시 + 시작 시 사전 컴파일)
+주요 기능:
+    - FileSystemBytecodeCache 로 컴파일 결과를 디스크에 유지 → 재시작 후 첫 요청도 파싱/컴파일 없음
+    - DEBUG 가 꺼져 있으면 auto_reload 끔 (렌더링마다 템플릿 파일 stat 하지 않음)
+    - 시작 시 templates 아래 모든 템플릿을 미리 로드하고 템플릿별 컴파일 시간 기록
+
+작성자: 김도영
+작성일: 2026-10-18
+버전: 1.0
+"""
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
+
+from app.core.config import settings
+from app.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+TEMPLATE_SUFFIXES = (".html",)
+SLOWEST_REPORTED = 5
+
+
+def create_environment(template_dir: Path, cache_dir: Optional[Path] = None, auto_reload: Optional[bool] = None) -> Environment:
+    """bytecode 캐시를 쓰는 Jinja2 Environment (Jinja2Templates(env=...) 에 전달)"""
+    cache_dir = Path(cache_dir or settings.TEMPLATE_CACHE_DIR)
+    bytecode_cache = None
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        bytecode_cache = FileSystemBytecodeCache(directory=str(cache_dir))
+    except OSError as e:
+        # 읽기 전용 위치(번들 등)면 메모리 캐시만 사용
+        logger.warning(f"[TEMPLATE] bytecode 캐시 디렉토리 사용 불가: {cache_dir}, {e}")
+
+    return Environment(
+        loader=FileSystemLoader(str(template_dir)),
+        autoescape=True,
+        auto_reload=settings.DEBUG if auto_reload is None else auto_reload,
+        bytecode_cache=bytecode_cache,
+        # 템플릿 수가 많지 않으므로 컴파일된 템플릿을 모두 메모리에 유지
+        cache_size=-1,
+    )
+
+
+class TemplateCompileReport:
+    """사전 컴파일 결과 (checker 통계용)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._timings: Dict[str, float] = {}
+        self._errors: Dict[str, str] = {}
+        self._auto_reload: Optional[bool] = None
+
+    def record(self, timings: Dict[str, float], errors: Dict[str, str], auto_reload: bool) -> None:
+        with self._lock:
+            self._timings = dict(timings)
+            self._errors = dict(errors)
+            self._auto_reload = auto_reload
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            slowest = sorted(self._timings.items(), key=lambda item: item[1], reverse=True)[:SLOWEST_REPORTED]
+            return {
+                "templates": len(self._timings),
+                "total_ms": round(sum(self._timings.values()), 3),
+                "slowest": [{"name": name, "ms": ms} for name, ms in slowest],
+                "errors": dict(self._errors),
+                "auto_reload": self._auto_reload,
+            }
+
+
+compile_report = TemplateCompileReport()
+
+
+def precompile_templates(env: Environment) -> Dict[str, float]:
+    """모든 템플릿 로드 (bytecode 캐시에 없으면 컴파일 후 저장). {템플릿: ms}"""
+    timings: Dict[str, float] = {}
+    errors: Dict[str, str] = {}
+    names: List[str] = env.list_templates(filter_func=lambda name: name.endswith(TEMPLATE_SUFFIXES))
+
+    for name in names:
+        started = time.perf_counter()
+        try:
+            env.get_template(name)
+        except Exception as e:
+            errors[name] = str(e)
+            logger.error(f"[TEMPLATE] 컴파일 실패: {name}, {e}")
+            continue
+        timings[name] = round((time.perf_counter() - started) * 1000, 3)
+
+    compile_report.record(timings, errors, env.auto_reload)
+    stats = compile_report.stats()
+    logger.info(
+        f"[TEMPLATE] precompile: {stats['templates']}개, {stats['total_ms']}ms, "
+        f"auto_reload={env.auto_reload}, slowest={stats['slowest'][:3]}"
+    )
+    return timings
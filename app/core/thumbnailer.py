@@ -0,0 +1,248 @@
+# thumbnailer.py
+"""
+모듈 설명:
+    - 이미지 첨부 파일 썸네일 / 미리보기 생성 (백그라운드 워커)
+주요 기능:
+    - 업로드 후 이미지 MIME 이면 큐에 등록 → 전용 스레드 1개에서 생성 (요청 처리 스레드풀을 쓰지 않음)
+    - 큐가 가득 차면 등록하지 않고, 첫 썸네일 요청 때 생성 (lazy)
+    - 같은 원본에 대한 동시 요청은 생성 작업 1개를 공유
+    - thumb: THUMB_SIZE 정사각 (가운데 자르기), preview: PREVIEW_SIZE 이내로 축소, 모두 JPEG
+    - 원본 옆(FILES_DIR)에 임시 파일 → rename 으로 저장
+    - 디코딩 실패는 원본 옆 표시 파일(.thumb-failed)로 기억 → 같은 원본을 요청마다 다시 디코딩하지 않음
+    - Pillow 는 선택 의존성 (없으면 available=False, 썸네일 API 는 원본으로 redirect)
+
+작성자: 김도영
+작성일: 2026-10-18
+버전: 1.0
+"""
+import asyncio
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from app.core.config import settings
+from app.core.logger import get_logger
+from app.utils.file_store import derivative_path, failure_marker_path
+
+try:
+    from PIL import Image, ImageOps
+except ImportError:  # pip install pillow
+    Image = None
+    ImageOps = None
+
+logger = get_logger(__name__)
+
+# Pillow 로 읽을 수 있는 이미지 MIME (svg 등 벡터는 제외)
+IMAGE_MIME_TYPES = {"image/jpeg", "image/png", "image/gif", "image/webp", "image/bmp", "image/tiff"}
+VARIANTS = ("thumb", "preview")
+MEDIA_TYPE = "image/jpeg"
+
+
+def is_image(mime: Optional[str]) -> bool:
+    return (mime or "").lower() in IMAGE_MIME_TYPES
+
+
+def _mark_failed(original: Path) -> None:
+    try:
+        failure_marker_path(original).touch()
+    except OSError as e:
+        logger.warning(f"[THUMB] 실패 표시 저장 실패: {original}, {e}")
+
+
+def render_variants(original: Path, thumb_size: int, preview_size: int, quality: int) -> Dict[str, int]:
+    """원본 → 썸네일 / 미리보기 JPEG 생성 (스레드에서 실행). {variant: 바이트}"""
+    written: Dict[str, int] = {}
+    try:
+        with Image.open(original) as image:
+            # JPEG 는 디코딩 단계에서 축소 (큰 사진도 메모리 / 시간 절약)
+            image.draft("RGB", (preview_size, preview_size))
+            image = ImageOps.exif_transpose(image)
+            if image.mode in ("RGBA", "LA", "P"):
+                # 투명 배경은 흰색으로 (JPEG 는 알파 없음)
+                rgba = image.convert("RGBA")
+                background = Image.new("RGB", rgba.size, (255, 255, 255))
+                background.paste(rgba, mask=rgba.getchannel("A"))
+                image = background
+            elif image.mode != "RGB":
+                image = image.convert("RGB")
+
+            preview = image.copy()
+            preview.thumbnail((preview_size, preview_size))
+            thumb = ImageOps.fit(preview, (thumb_size, thumb_size))
+    except FileNotFoundError:
+        raise
+    except Exception:
+        # 디코딩 실패 → 표시 (원본은 바뀌지 않으므로 다음 요청 때 다시 디코딩하지 않음)
+        _mark_failed(original)
+        raise
+
+    for variant, output in (("thumb", thumb), ("preview", preview)):
+        dest = derivative_path(original, variant)
+        tmp = dest.with_name(f".{dest.name}.{uuid.uuid4().hex[:8]}.part")
+        try:
+            output.save(tmp, "JPEG", quality=quality, optimize=True)
+            os.replace(tmp, dest)
+        except BaseException:
+            tmp.unlink(missing_ok=True)
+            raise
+        written[variant] = dest.stat().st_size
+    return written
+
+
+class Thumbnailer:
+    """bounded 큐 + 전용 스레드로 파생 이미지를 만드는 워커"""
+
+    def __init__(self, thumb_size: int = 256, preview_size: int = 1024, quality: int = 85, queue_size: int = 100):
+        self.thumb_size = thumb_size
+        self.preview_size = preview_size
+        self.quality = quality
+        self.queue_size = queue_size
+
+        self._queue: Optional["asyncio.Queue[Optional[Path]]"] = None
+        self._task: Optional[asyncio.Task] = None
+        # 이미지 디코딩은 CPU 를 쓰므로 스레드 1개로 제한 (요청 처리와 경쟁하지 않도록)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="thumbnailer")
+        # 원본 경로 -> 진행 중인 생성 작업
+        self._inflight: Dict[Path, "asyncio.Future[bool]"] = {}
+
+        self._lock = threading.Lock()
+        self._generated = 0
+        self._lazy = 0
+        self._dropped = 0
+        self._failed = 0
+        self._skipped = 0
+        self._total_ms = 0.0
+
+    @property
+    def available(self) -> bool:
+        return Image is not None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def start(self) -> None:
+        if self.running or not self.available:
+            if not self.available:
+                logger.info("[THUMB] Pillow 미설치 - 썸네일 생성 안 함")
+            return
+        self._queue = asyncio.Queue(maxsize=self.queue_size)
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if not self.running:
+            self._executor.shutdown(wait=False)
+            return
+        # 남은 작업은 버림 (다음 요청 때 lazy 생성)
+        while not self._queue.empty():
+            self._queue.get_nowait()
+        await self._queue.put(None)
+        await self._task
+        self._task = None
+        self._executor.shutdown(wait=True)
+
+    def enqueue(self, original: Path) -> bool:
+        """업로드 직후 생성 예약 (큐가 가득 차면 False - 요청 시 생성)"""
+        if not self.running:
+            return False
+        try:
+            self._queue.put_nowait(original)
+            return True
+        except asyncio.QueueFull:
+            with self._lock:
+                self._dropped += 1
+            return False
+
+    async def _run(self) -> None:
+        while True:
+            original = await self._queue.get()
+            if original is None:
+                return
+            if not derivative_path(original, VARIANTS[0]).exists() and not failure_marker_path(original).exists():
+                await self._generate(original)
+
+    async def ensure(self, original: Path, variant: str) -> Optional[Path]:
+        """파생 파일 경로 (없으면 생성), 생성할 수 없으면 None"""
+        dest = derivative_path(original, variant)
+        if dest.exists():
+            return dest
+        if not self.available:
+            return None
+        if failure_marker_path(original).exists():
+            # 이전에 디코딩 실패 - 원본으로 대체
+            with self._lock:
+                self._skipped += 1
+            return None
+        with self._lock:
+            self._lazy += 1
+        return dest if await self._generate(original) else None
+
+    async def _generate(self, original: Path) -> bool:
+        future = self._inflight.get(original)
+        if future is not None:
+            return await asyncio.shield(future)
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._inflight[original] = future
+        started = time.perf_counter()
+        ok = False
+        try:
+            await loop.run_in_executor(
+                self._executor, render_variants, original, self.thumb_size, self.preview_size, self.quality
+            )
+            ok = True
+        except Exception as e:
+            with self._lock:
+                self._failed += 1
+            logger.warning(f"[THUMB] 생성 실패: {original}, {e}")
+        finally:
+            elapsed = (time.perf_counter() - started) * 1000
+            if ok:
+                with self._lock:
+                    self._generated += 1
+                    self._total_ms += elapsed
+            del self._inflight[original]
+            future.set_result(ok)
+        return ok
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "available": self.available,
+                "running": self.running,
+                "queued": self._queue.qsize() if self._queue else 0,
+                "generated": self._generated,
+                "lazy": self._lazy,
+                "dropped": self._dropped,
+                "failed": self._failed,
+                "skipped": self._skipped,
+                "avg_ms": round(self._total_ms / self._generated, 3) if self._generated else None,
+            }
+
+
+# 전역 워커 (startup에서 start, shutdown에서 stop)
+_thumbnailer: Optional[Thumbnailer] = None
+
+
+def get_thumbnailer() -> Thumbnailer:
+    global _thumbnailer
+    if _thumbnailer is None:
+        _thumbnailer = Thumbnailer(
+            thumb_size=settings.THUMB_SIZE,
+            preview_size=settings.PREVIEW_SIZE,
+            quality=settings.THUMB_QUALITY,
+            queue_size=settings.THUMB_QUEUE_SIZE,
+        )
+    return _thumbnailer
+
+
+async def close_thumbnailer() -> None:
+    global _thumbnailer
+    if _thumbnailer is not None:
+        await _thumbnailer.stop()
+        _thumbnailer = None
@@ -2,6 +2,7 @@
 Auto-Board: 개인용 기록물 관리
 """
 
+import asyncio
 import signal
 import sys
 import sqlite3
@@ -14,11 +15,21 @@ if str(project_root) not in sys.path:
 
 import uvicorn
 from fastapi import FastAPI
-from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 
 from app.core.config import settings
 from app.core.logger import get_logger
+from app.core.db_pool import get_pool, close_pool
+from app.core.async_db import close_async_db
+from app.core.db_writer import get_db_writer, close_db_writer
+from app.core.thumbnailer import get_thumbnailer, close_thumbnailer
+from app.core.template_env import create_environment, precompile_templates
+from app.core.static_assets import FingerprintedStaticFiles, StaticAssetManifest
+from app.core.compression import SelectiveGZipMiddleware
+from app.utils.board_stats import backfill_counters
+from app.utils.file_store import ensure_schema as ensure_files_schema
+from app.utils.file_gc import run_periodically as run_file_gc
+from app.utils.global_search import reconcile_all as reconcile_search, sync_pending as sync_search_pending
 
 logger = get_logger(__name__)
 
@@ -34,6 +45,9 @@ def create_app() -> FastAPI:
         openapi_url="/openapi.json" if settings.DEBUG else None,
     )
     
+    # 큰 JSON / HTML 응답 압축 (정적 파일은 사전 압축, 첨부 파일은 Range 유지를 위해 제외)
+    app.add_middleware(SelectiveGZipMiddleware, minimum_size=settings.GZIP_MIN_SIZE)
+
     # 라우터, 정적파일, 이벤트 핸들러 등록
     add_routes(app)
     add_statics(app)
@@ -65,7 +79,12 @@ def add_statics(app: FastAPI):
         static_dir.mkdir(parents=True, exist_ok=True)
     
     logger.info(f"📁 Static 디렉토리: {static_dir}")
-    app.mount("/static", StaticFiles(directory=str(static_dir)), name="static")
+    # 내용 해시 파일명(immutable) + 사전 gzip, DEBUG 에서는 파일 변경 시 manifest 갱신
+    manifest = StaticAssetManifest(
+        static_dir, url_prefix="/static", gzip_min_size=settings.GZIP_MIN_SIZE, auto_refresh=settings.DEBUG
+    ).build()
+    app.state.static_assets = manifest
+    app.mount("/static", FingerprintedStaticFiles(manifest=manifest), name="static")
 
 
 def add_templates(app: FastAPI):
@@ -77,7 +96,10 @@ def add_templates(app: FastAPI):
         template_dir.mkdir(parents=True, exist_ok=True)
     
     logger.info(f"📁 Template 디렉토리: {template_dir}")
-    templates = Jinja2Templates(directory=str(template_dir))
+    # bytecode 캐시 + (DEBUG 가 아니면) auto_reload 끔, 컴파일은 startup 에서 미리 수행
+    templates = Jinja2Templates(env=create_environment(template_dir))
+    # {{ static_url('js/records.js') }} → /static/js/records.<hash>.js
+    templates.env.globals["static_url"] = app.state.static_assets.url
     
     # App state에 저장
     app.state.templates = templates
@@ -91,12 +113,14 @@ def add_routes(app: FastAPI):
     from app.routes.records import router as records_router
     from app.routes.checker import router as checker_router
     from app.routes.files import router as files_router
+    from app.routes.search import router as search_router
 
     app.include_router(home_router)
     app.include_router(board_router) # prefix is defined in board.py
     app.include_router(records_router) # prefix is defined in records.py
     app.include_router(checker_router)
     app.include_router(files_router)
+    app.include_router(search_router)
 
 
 def add_events(app: FastAPI):
@@ -123,6 +147,28 @@ def add_events(app: FastAPI):
         
         # DB 초기화
         init_db()
+
+        # 템플릿 사전 컴파일 (bytecode 캐시에 저장, 템플릿별 시간 기록)
+        precompile_templates(app.state.templates.env)
+
+        # 커넥션 풀 준비 (첫 커넥션을 미리 만들어 PRAGMA 적용)
+        pool = get_pool()
+        pool.release(pool.acquire())
+        logger.info(f"🔌 DB Pool: size={pool.size}, timeout={pool.timeout}s")
+
+        # 레코드 쓰기 writer 시작 (group commit) - commit 직전에 검색 색인 대기열 반영
+        writer = get_db_writer()
+        writer.add_commit_hook(sync_search_pending)
+        await writer.start()
+
+        # 이미지 썸네일 워커 시작 (Pillow 가 없으면 시작하지 않음)
+        await get_thumbnailer().start()
+
+        # 고아 첨부 파일 정리 주기 실행 (FILE_GC_INTERVAL_HOURS > 0 일 때만)
+        app.state.file_gc_task = None
+        if settings.FILE_GC_INTERVAL_HOURS > 0:
+            app.state.file_gc_task = asyncio.create_task(run_file_gc(settings.FILE_GC_INTERVAL_HOURS * 3600))
+            logger.info(f"🧹 File GC: every {settings.FILE_GC_INTERVAL_HOURS}h")
         
         logger.info("=" * 60)
         logger.info("✅ 초기화 완료")
@@ -132,6 +178,12 @@ def add_events(app: FastAPI):
         """애플리케이션 종료 시 정리 작업"""
         logger.info("=" * 60)
         logger.info(f"🛑 {settings.APP_NAME} 종료")
+        if getattr(app.state, "file_gc_task", None) is not None:
+            app.state.file_gc_task.cancel()
+        await close_thumbnailer()
+        await close_db_writer()
+        close_async_db()
+        close_pool()
         logger.info("=" * 60)
 
 
@@ -161,6 +213,13 @@ def init_db():
             schema_ddl = f.read()
             cursor.executescript(schema_ddl)
             logger.info(f"✅ 스키마 초기화 완료 ({sql_path.name})")
+
+        # 기존 보드 레코드 카운터 backfill (트리거가 없는 보드만)
+        backfill_counters(conn)
+        # files 내용 해시 컬럼 (이전 DDL 로 만든 DB)
+        ensure_files_schema(conn)
+        # 검색 트리거를 현재 형식으로 맞추고, 앱 밖에서 쓴 레코드 색인
+        reconcile_search(conn)
         
 
         
@@ -41,6 +41,7 @@ create table if not exists files(
     logical_name text not null,
     size integer not null,
     mime text not null,
+    content_hash text,                       -- sha256 (같은 내용의 업로드는 물리 파일 1개를 공유)
     created_at timestamp not null default current_timestamp,
     updated_at timestamp not null default current_timestamp
 );
@@ -54,4 +55,42 @@ create table if not exists file_match(
     created_at timestamp not null default current_timestamp,
     updated_at timestamp not null default current_timestamp
 );
-    
\ No newline at end of file
+    
+-- board_stats (보드별 레코드 카운터 + 데이터 버전, 물리 테이블 트리거로 유지)
+create table if not exists board_stats(
+    board_id integer primary key,
+    row_count integer not null default 0,
+    last_insert_at timestamp,
+    last_update_at timestamp,
+    data_version integer not null default 0
+);
+
+-- 메타데이터 / 보드 정보가 바뀌면 데이터 버전 증가 (ETag 무효화)
+create trigger if not exists meta_data_version_ai after insert on meta_data begin
+    update board_stats set data_version = data_version + 1 where board_id = new.board_id;
+end;
+create trigger if not exists meta_data_version_au after update on meta_data begin
+    update board_stats set data_version = data_version + 1 where board_id in (old.board_id, new.board_id);
+end;
+create trigger if not exists meta_data_version_ad after delete on meta_data begin
+    update board_stats set data_version = data_version + 1 where board_id = old.board_id;
+end;
+create trigger if not exists boards_version_au after update on boards begin
+    update board_stats set data_version = data_version + 1 where board_id = new.id;
+end;
+
+-- search_index (전체 보드 통합 검색, rowid = board_id << 32 | record_id)
+create virtual table if not exists search_index using fts5(
+    title,
+    body,
+    board_id unindexed,
+    record_id unindexed,
+    tokenize = 'unicode61 remove_diacritics 2'
+);
+
+-- search_pending (색인 대기 레코드, 물리 테이블 트리거가 기록 → 앱이 HTML 평문화 후 search_index / 보드 FTS 에 반영)
+create table if not exists search_pending(
+    board_id integer not null,
+    record_id integer not null,
+    primary key (board_id, record_id)
+) without rowid;
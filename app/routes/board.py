@@ -1,13 +1,21 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Request
+from fastapi import APIRouter, Depends, HTTPException, status, Request, Response
 from fastapi.responses import HTMLResponse, RedirectResponse
 import sqlite3
 from typing import Optional
 
 from app.core.logger import get_logger
-from app.core.deps import get_db_connection, get_current_user_from_cookie
+from app.core.deps import get_db, get_current_user_from_cookie
+from app.core.async_db import AsyncDB
+from app.core.board_registry import board_registry
+from app.core.fragment_cache import fragment_cache
 from app.schemas.board import BoardCreate, BoardResponse
 from app.schemas.user import User
-from app.utils.db_manager import DBManager
+from app.utils.db_manager import DBManager, AsyncDBManager
+from app.utils.board_fts import drop_fts
+from app.utils.global_search import remove_board as remove_board_from_search
+from app.utils.record_stats import drop_summary
+from app.utils.board_stats import install_counters, record_count as board_record_count, remove_counters
+from app.utils.conditional import board_etag, etag_matches, not_modified, set_etag
 from app.constants.data_type import get_data_types_config
 
 logger = get_logger(__name__)
@@ -22,17 +30,18 @@ router = APIRouter(prefix="/boards", tags=["boards"])
 async def list_boards(
     request: Request,
     user: User = Depends(get_current_user_from_cookie),
-    conn: sqlite3.Connection = Depends(get_db_connection)
+    db: AsyncDB = Depends(get_db)
 ):
     """보드 목록 조회"""
     if not user:
         return RedirectResponse(url="/login", status_code=status.HTTP_302_FOUND)
 
-    cursor = conn.cursor()
-
     # boards 테이블에서 모든 보드 조회
-    cursor.execute("SELECT id, name, note, physical_table_name, created_at FROM boards ORDER BY created_at DESC")
-    boards = [dict(row) for row in cursor.fetchall()]
+    # 레코드 수는 board_stats 카운터 (보드별 COUNT(*) 없음)
+    boards = await db.fetch_all(
+        "SELECT b.id, b.name, b.note, b.physical_table_name, b.created_at, s.row_count, s.last_insert_at "
+        "FROM boards b LEFT JOIN board_stats s ON s.board_id = b.id ORDER BY b.created_at DESC"
+    )
 
     logger.info(f"[LIST] ✓ 보드 목록 조회 완료: {len(boards)}개 보드")
 
@@ -56,7 +65,7 @@ async def list_boards_paginated(
     page_size: int = 10,
     search: Optional[str] = None,
     user: User = Depends(get_current_user_from_cookie),
-    conn: sqlite3.Connection = Depends(get_db_connection)
+    db: AsyncDB = Depends(get_db)
 ):
     """보드 목록 조회 (페이징, 검색 포함)"""
     if not user:
@@ -69,8 +78,6 @@ async def list_boards_paginated(
 
     logger.info(f"[LIST-PAGINATED] page={page}, page_size={page_size}, search={search}")
 
-    cursor = conn.cursor()
-
     # 검색 쿼리 빌드
     where_clause = ""
     params = []
@@ -82,8 +89,7 @@ async def list_boards_paginated(
 
     # 전체 개수 조회
     count_sql = f"SELECT COUNT(*) FROM boards {where_clause}"
-    cursor.execute(count_sql, params)
-    total_count = cursor.fetchone()[0]
+    total_count = await db.fetch_value(count_sql, params)
     logger.info(f"[LIST-PAGINATED] 총 보드 수: {total_count}")
 
     # 페이징 계산
@@ -92,14 +98,14 @@ async def list_boards_paginated(
 
     # 데이터 조회
     sql = f"""
-        SELECT id, name, note, physical_table_name, created_at, updated_at 
-        FROM boards 
+        SELECT b.id, b.name, b.note, b.physical_table_name, b.created_at, b.updated_at,
+               s.row_count, s.last_insert_at, s.last_update_at
+        FROM boards b LEFT JOIN board_stats s ON s.board_id = b.id
         {where_clause}
-        ORDER BY updated_at DESC 
+        ORDER BY b.updated_at DESC 
         LIMIT ? OFFSET ?
     """
-    cursor.execute(sql, params + [page_size, offset])
-    boards = [dict(row) for row in cursor.fetchall()]
+    boards = await db.fetch_all(sql, params + [page_size, offset])
 
     logger.info(f"[LIST-PAGINATED] ✓ {len(boards)}개 보드 조회 완료")
 
@@ -129,7 +135,7 @@ async def wizard_step1_form(
     request: Request,
     board_id: Optional[int] = None,
     user: User = Depends(get_current_user_from_cookie),
-    conn: sqlite3.Connection = Depends(get_db_connection)
+    db: AsyncDB = Depends(get_db)
 ):
     """Step 1: 기본 정보 및 컬럼 정의 페이지 (신규 생성 또는 기존 수정)"""
     logger.info(f"[GET] GET /boards/new/step1 요청 받음")
@@ -146,8 +152,8 @@ async def wizard_step1_form(
     # board_id가 있으면 기존 데이터 조회
     if board_id:
         logger.info(f"[GET] board_id={board_id}로 기존 데이터 조회 시작...")
-        db_manager = DBManager(conn)
-        board_info = db_manager.get_board_info(board_id)
+        db_manager = AsyncDBManager(db)
+        board_info = await db_manager.get_board_info(board_id)
 
         if not board_info:
             logger.error(f"[GET] ✗ 보드를 찾을 수 없음 - board_id={board_id}")
@@ -155,7 +161,7 @@ async def wizard_step1_form(
 
         logger.info(f"[GET] ✓ 보드 정보 찾음: {board_info['name']}")
 
-        board_meta = db_manager.get_metadata(board_id, "table") or {}
+        board_meta = await db_manager.get_metadata(board_id, "table") or {}
         logger.info(f"[GET] ✓ 메타데이터 조회 완료")
         logger.info(f"[GET] 메타데이터: {board_meta}")
 
@@ -166,9 +172,7 @@ async def wizard_step1_form(
 
         # 물리 테이블에 레코드 존재 여부 확인
         physical_table_name = board_info["physical_table_name"]
-        cursor = conn.cursor()
-        cursor.execute(f"SELECT COUNT(*) FROM {physical_table_name}")
-        record_count = cursor.fetchone()[0]
+        record_count = await db.run(board_record_count, board_id, physical_table_name)
         record_exist = record_count > 0
         logger.info(f"[GET] 레코드 존재 여부: {record_exist} (총 {record_count}개)")
     else:
@@ -189,16 +193,9 @@ async def wizard_step1_form(
         }
     )
 
-@router.post("/new/step1")
-async def wizard_step1_submit(
-    request: Request,
-    conn: sqlite3.Connection = Depends(get_db_connection)
-):
-    """Step 1: Board 생성 및 컬럼 메타데이터 저장 (신규 생성 또는 기존 수정)"""
+def _save_step1(conn: sqlite3.Connection, form_data: dict) -> int:
+    """Step 1 저장 트랜잭션 (워커 스레드에서 하나의 커넥션으로 실행)"""
     try:
-        form_data = await request.json()
-        logger.info(f"[1] POST /boards/new/step1 요청 받음")
-
         board_id = form_data.get("board_id")  # 수정 모드인지 신규 모드인지 판단
         board_name = form_data.get("name")
         board_note = form_data.get("note", "")
@@ -250,20 +247,8 @@ async def wizard_step1_submit(
                 logger.info(f"     → {col_name}: {col_data['label']} ({col_data['data_type']})")
             logger.info(f"[9] ✓ 메타데이터 준비 완료: {len(columns_with_names)}개 컬럼")
 
-            columns_meta = {
-                "name": board_name,
-                "note": board_note,
-                "is_file_attach": is_file_attach,
-                "physical_table_name": physical_table_name,
-                "id": board_id,
-                "columns": columns_with_names
-            }
-            logger.info(f"[10] meta_data 테이블에 메타데이터 저장 중...")
-            db_manager.save_metadata(board_id, "table", columns_meta)
-            logger.info(f"[11] ✓ 메타데이터 저장 완료")
-
             # 4. 물리 테이블 생성
-            logger.info(f"[12] 물리 테이블 생성 중...")
+            logger.info(f"[10] 물리 테이블 생성 중...")
             from app.utils.db_manager import map_sqlite_type
             ddl_columns = ["id INTEGER PRIMARY KEY AUTOINCREMENT"]
             for field in columns_with_names:
@@ -276,12 +261,26 @@ async def wizard_step1_submit(
             ddl_columns.append("updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP")
 
             create_table_sql = f"CREATE TABLE {physical_table_name} ({', '.join(ddl_columns)})"
-            logger.info(f"[13] SQL 실행: {create_table_sql}")
-            logger.info(f"[14] '{physical_table_name}' 물리 테이블 생성 실행 중...")
+            logger.info(f"[11] SQL 실행: {create_table_sql}")
+            logger.info(f"[12] '{physical_table_name}' 물리 테이블 생성 실행 중...")
             cursor.execute(create_table_sql)
-            logger.info(f"[15] ✓ 물리 테이블 생성 성공")
+            install_counters(conn, board_id, physical_table_name)
+            logger.info(f"[13] ✓ 물리 테이블 생성 성공")
+
+            # 5. 메타데이터 저장 (테이블 생성 후 → 검색 트리거 / 색인도 함께 설치)
+            columns_meta = {
+                "name": board_name,
+                "note": board_note,
+                "is_file_attach": is_file_attach,
+                "physical_table_name": physical_table_name,
+                "id": board_id,
+                "columns": columns_with_names
+            }
+            logger.info(f"[14] meta_data 테이블에 메타데이터 저장 중...")
+            db_manager.save_metadata(board_id, "table", columns_meta)
+            logger.info(f"[15] ✓ 메타데이터 저장 완료")
 
-            # 5. 테이블 검증 로깅
+            # 6. 테이블 검증 로깅
             logger.info(f"[16] 테이블 구조 검증 중...")
             cursor.execute(f"PRAGMA table_info({physical_table_name})")
             table_info = cursor.fetchall()
@@ -322,8 +321,7 @@ async def wizard_step1_submit(
 
             # 3. 물리 테이블의 레코드 존재 여부 확인
             logger.info(f"[8] 물리 테이블 레코드 존재 여부 확인 중...")
-            cursor.execute(f"SELECT COUNT(*) FROM {physical_table_name}")
-            record_count = cursor.fetchone()[0]
+            record_count = board_record_count(conn, board_id, physical_table_name)
             record_exist = record_count > 0
             logger.info(f"[9] 레코드 존재: {record_exist} (총 {record_count}개)")
 
@@ -373,6 +371,7 @@ async def wizard_step1_submit(
                 create_table_sql = f"CREATE TABLE {physical_table_name} ({', '.join(ddl_columns)})"
                 logger.info(f"[17] SQL 실행: {create_table_sql}")
                 cursor.execute(create_table_sql)
+                install_counters(conn, board_id, physical_table_name)
                 logger.info(f"[18] ✓ 테이블 재생성 완료: {physical_table_name}")
 
                 # 4. 메타데이터 업데이트
@@ -516,8 +515,9 @@ async def wizard_step1_submit(
                 logger.info(f"     - Physical Table: {physical_table_name}")
                 logger.info(f"     - 기존 컬럼: {existing_column_count}개, 새 컬럼: {len(new_columns_to_add)}개, 총: {len(all_columns)}개")
 
-        logger.info(f"[25] ✓ 응답 반환: board_id={board_id}")
-        return {"board_id": board_id, "redirect": f"/boards/new/step2/{board_id}"}
+        # 보드 정보/테이블 구조가 바뀌었으므로 캐시 무효화
+        board_registry.invalidate(board_id)
+        return board_id
 
     except HTTPException as he:
         logger.error(f"[ERROR] HTTP 예외 발생 - Status={he.status_code}, Detail={he.detail}")
@@ -531,27 +531,41 @@ async def wizard_step1_submit(
         conn.rollback()
         raise HTTPException(status_code=500, detail=str(e))
 
+@router.post("/new/step1")
+async def wizard_step1_submit(
+    request: Request,
+    db: AsyncDB = Depends(get_db)
+):
+    """Step 1: Board 생성 및 컬럼 메타데이터 저장 (신규 생성 또는 기존 수정)"""
+    form_data = await request.json()
+    logger.info(f"[1] POST /boards/new/step1 요청 받음")
+
+    board_id = await db.run(_save_step1, form_data)
+
+    logger.info(f"[25] ✓ 응답 반환: board_id={board_id}")
+    return {"board_id": board_id, "redirect": f"/boards/new/step2/{board_id}"}
+
 # Step 2: 목록 설정
 @router.get("/new/step2/{board_id}", response_class=HTMLResponse)
 async def wizard_step2_form(
     request: Request,
     board_id: int,
     user: User = Depends(get_current_user_from_cookie),
-    conn: sqlite3.Connection = Depends(get_db_connection)
+    db: AsyncDB = Depends(get_db)
 ):
     """Step 2: 목록 화면 설정"""
     if not user:
         return RedirectResponse(url="/login", status_code=status.HTTP_302_FOUND)
 
-    db_manager = DBManager(conn)
-    board_info = db_manager.get_board_info(board_id)
+    db_manager = AsyncDBManager(db)
+    board_info = await db_manager.get_board_info(board_id)
 
     if not board_info:
         return RedirectResponse(url="/boards/new/step1", status_code=status.HTTP_302_FOUND)
 
-    table_meta = db_manager.get_metadata(board_id, "table") or {}
+    table_meta = await db_manager.get_metadata(board_id, "table") or {}
     columns_data = table_meta.get("columns", [])
-    list_meta = db_manager.get_metadata(board_id, "list")
+    list_meta = await db_manager.get_metadata(board_id, "list")
 
     return request.app.state.templates.TemplateResponse(
         "board/wizard/step2.html",
@@ -568,7 +582,7 @@ async def wizard_step2_form(
 async def wizard_step2_submit(
     board_id: int,
     request: Request,
-    conn: sqlite3.Connection = Depends(get_db_connection)
+    db: AsyncDB = Depends(get_db)
 ):
     """Step 2: 목록 설정 저장"""
     try:
@@ -604,14 +618,14 @@ async def wizard_step2_submit(
         import json
         logger.info(f"[STEP2-5] 저장할 JSON (pretty):\n{json.dumps(list_config, indent=2, ensure_ascii=False)}")
 
-        db_manager = DBManager(conn)
-        db_manager.save_metadata(board_id, "list", list_config)
+        db_manager = AsyncDBManager(db)
+        await db_manager.save_metadata(board_id, "list", list_config)
 
         logger.info(f"[STEP2-6] ✓ 데이터베이스에 저장 완료")
         logger.info(f"[STEP2-7] 메타데이터 검증: board_id={board_id}, type='list'")
 
         # 저장된 데이터 재확인
-        saved_data = db_manager.get_metadata(board_id, "list")
+        saved_data = await db_manager.get_metadata(board_id, "list")
         if saved_data:
             saved_columns = saved_data.get('columns') or saved_data.get('display_columns', [])
             logger.info(f"[STEP2-8] ✅ 저장된 데이터 검증 완료: {len(saved_columns)}개 컬럼")
@@ -622,7 +636,6 @@ async def wizard_step2_submit(
         return {"redirect": f"/boards/new/step3/{board_id}"}
 
     except Exception as e:
-        conn.rollback()
         logger.error(f"[STEP2-ERROR] 예외 발생: {type(e).__name__}")
         logger.error(f"[STEP2-ERROR] 메시지: {str(e)}")
         import traceback
@@ -635,21 +648,21 @@ async def wizard_step3_form(
     request: Request,
     board_id: int,
     user: User = Depends(get_current_user_from_cookie),
-    conn: sqlite3.Connection = Depends(get_db_connection)
+    db: AsyncDB = Depends(get_db)
 ):
     """Step 3: 입력 화면 설정"""
     if not user:
         return RedirectResponse(url="/login", status_code=status.HTTP_302_FOUND)
 
-    db_manager = DBManager(conn)
-    board_info = db_manager.get_board_info(board_id)
+    db_manager = AsyncDBManager(db)
+    board_info = await db_manager.get_board_info(board_id)
 
     if not board_info:
         return RedirectResponse(url="/boards/new/step1", status_code=status.HTTP_302_FOUND)
 
-    table_meta = db_manager.get_metadata(board_id, "table") or {}
+    table_meta = await db_manager.get_metadata(board_id, "table") or {}
     columns_data = table_meta.get("columns", [])
-    create_edit_meta = db_manager.get_metadata(board_id, "create_edit")
+    create_edit_meta = await db_manager.get_metadata(board_id, "create_edit")
 
     return request.app.state.templates.TemplateResponse(
         "board/wizard/step3.html",
@@ -666,7 +679,7 @@ async def wizard_step3_form(
 async def wizard_step3_submit(
     board_id: int,
     request: Request,
-    conn: sqlite3.Connection = Depends(get_db_connection)
+    db: AsyncDB = Depends(get_db)
 ):
     """Step 3: 입력 설정 저장"""
     try:
@@ -713,14 +726,14 @@ async def wizard_step3_submit(
         import json
         logger.info(f"[STEP3-5] 저장할 JSON (pretty):\n{json.dumps(create_edit, indent=2, ensure_ascii=False)}")
 
-        db_manager = DBManager(conn)
-        db_manager.save_metadata(board_id, "create_edit", create_edit)
+        db_manager = AsyncDBManager(db)
+        await db_manager.save_metadata(board_id, "create_edit", create_edit)
 
         logger.info(f"[STEP3-6] ✓ 데이터베이스에 저장 완료")
         logger.info(f"[STEP3-7] 메타데이터 검증: board_id={board_id}, type='create_edit'")
 
         # 저장된 데이터 재확인
-        saved_data = db_manager.get_metadata(board_id, "create_edit")
+        saved_data = await db_manager.get_metadata(board_id, "create_edit")
         if saved_data:
             saved_columns = saved_data.get("columns") or saved_data.get("fields", [])
             logger.info(f"[STEP3-8] ✅ 저장된 데이터 검증 완료: {len(saved_columns)}개 필드")
@@ -733,7 +746,6 @@ async def wizard_step3_submit(
         return {"redirect": f"/boards/new/step4/{board_id}"}
 
     except Exception as e:
-        conn.rollback()
         logger.error(f"[STEP3-ERROR] 예외 발생: {type(e).__name__}")
         logger.error(f"[STEP3-ERROR] 메시지: {str(e)}")
         import traceback
@@ -746,22 +758,22 @@ async def wizard_step4_form(
     request: Request,
     board_id: int,
     user: User = Depends(get_current_user_from_cookie),
-    conn: sqlite3.Connection = Depends(get_db_connection)
+    db: AsyncDB = Depends(get_db)
 ):
     """Step 4: 상세보기(View) 설정"""
     if not user:
         return RedirectResponse(url="/login", status_code=status.HTTP_302_FOUND)
 
-    db_manager = DBManager(conn)
-    board_info = db_manager.get_board_info(board_id)
+    db_manager = AsyncDBManager(db)
+    board_info = await db_manager.get_board_info(board_id)
 
     if not board_info:
         return RedirectResponse(url="/boards/new/step1", status_code=status.HTTP_302_FOUND)
 
-    table_meta = db_manager.get_metadata(board_id, "table") or {}
+    table_meta = await db_manager.get_metadata(board_id, "table") or {}
     columns_data = table_meta.get("columns", [])
-    create_config = db_manager.get_metadata(board_id, "create_edit")
-    view_meta = db_manager.get_metadata(board_id, "view")
+    create_config = await db_manager.get_metadata(board_id, "create_edit")
+    view_meta = await db_manager.get_metadata(board_id, "view")
 
     return request.app.state.templates.TemplateResponse(
         "board/wizard/step4.html",
@@ -779,7 +791,7 @@ async def wizard_step4_form(
 async def wizard_step4_submit(
     board_id: int,
     request: Request,
-    conn: sqlite3.Connection = Depends(get_db_connection)
+    db: AsyncDB = Depends(get_db)
 ):
     """Step 4: 상세보기(View) 설정 저장"""
     try:
@@ -858,14 +870,14 @@ async def wizard_step4_submit(
         import json
         logger.info(f"[STEP4-5] 저장할 JSON (pretty):\n{json.dumps(view_config, indent=2, ensure_ascii=False)}")
 
-        db_manager = DBManager(conn)
-        db_manager.save_metadata(board_id, "view", view_config)
+        db_manager = AsyncDBManager(db)
+        await db_manager.save_metadata(board_id, "view", view_config)
 
         logger.info(f"[STEP4-6] ✓ 데이터베이스에 저장 완료")
         logger.info(f"[STEP4-7] 메타데이터 검증: board_id={board_id}, type='view'")
 
         # 저장된 데이터 재확인
-        saved_data = db_manager.get_metadata(board_id, "view")
+        saved_data = await db_manager.get_metadata(board_id, "view")
         if saved_data:
             saved_columns = saved_data.get("columns") or saved_data.get("display_fields", [])
             logger.info(f"[STEP4-8] ✅ 저장된 데이터 검증 완료: {len(saved_columns)}개 필드")
@@ -878,7 +890,6 @@ async def wizard_step4_submit(
         return {"redirect": f"/boards/new/finish/{board_id}"}
 
     except Exception as e:
-        conn.rollback()
         logger.error(f"[STEP4-ERROR] 예외 발생: {type(e).__name__}")
         logger.error(f"[STEP4-ERROR] 메시지: {str(e)}")
         import traceback
@@ -891,14 +902,14 @@ async def wizard_finish(
     request: Request,
     board_id: int,
     user: User = Depends(get_current_user_from_cookie),
-    conn: sqlite3.Connection = Depends(get_db_connection)
+    db: AsyncDB = Depends(get_db)
 ):
     """보드 생성 완료 페이지"""
     if not user:
         return RedirectResponse(url="/login", status_code=status.HTTP_302_FOUND)
 
-    db_manager = DBManager(conn)
-    board_info = db_manager.get_board_info(board_id)
+    db_manager = AsyncDBManager(db)
+    board_info = await db_manager.get_board_info(board_id)
 
     if not board_info:
         return RedirectResponse(url="/boards/new/step1", status_code=status.HTTP_302_FOUND)
@@ -941,19 +952,27 @@ async def create_board_page(user: User = Depends(get_current_user_from_cookie)):
 #         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/{board_id}/columns")
-def get_board_columns(
+async def get_board_columns(
+    request: Request,
+    response: Response,
     board_id: int,
-    conn: sqlite3.Connection = Depends(get_db_connection)
+    db: AsyncDB = Depends(get_db)
 ):
     """
     게시판 컬럼 메타데이터 조회 (Delegates to DBManager)
+    If-None-Match 가 현재 ETag 와 같으면 304
     """
-    db_manager = DBManager(conn)
-    result = db_manager.get_board_columns(board_id)
+    etag = await board_etag(db, request, board_id)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+
+    db_manager = AsyncDBManager(db)
+    result = await db_manager.get_board_columns(board_id)
 
     if result is None:
         raise HTTPException(status_code=404, detail="Columns metadata not found")
 
+    set_etag(response, etag)
     return result
 
 # ============================================================================
@@ -964,7 +983,7 @@ def get_board_columns(
 async def get_delete_info(
     board_id: int,
     user: User = Depends(get_current_user_from_cookie),
-    conn: sqlite3.Connection = Depends(get_db_connection)
+    db: AsyncDB = Depends(get_db)
 ):
     """게시판 삭제 전 필요한 정보 조회: 테이블 존재 여부, 레코드 수"""
     if not user:
@@ -973,8 +992,8 @@ async def get_delete_info(
     logger.info(f"[DELETE-INFO] board_id={board_id} 삭제 정보 조회 시작")
 
     try:
-        db_manager = DBManager(conn)
-        board_info = db_manager.get_board_info(board_id)
+        db_manager = AsyncDBManager(db)
+        board_info = await db_manager.get_board_info(board_id)
 
         if not board_info:
             logger.error(f"[DELETE-INFO] 보드를 찾을 수 없음: board_id={board_id}")
@@ -984,19 +1003,16 @@ async def get_delete_info(
         logger.info(f"[DELETE-INFO] 테이블명: {physical_table_name}")
 
         # 1. 테이블 존재 여부 확인
-        cursor = conn.cursor()
-        cursor.execute(
+        table_exists = await db.fetch_one(
             "SELECT name FROM sqlite_master WHERE type='table' AND name=?",
             (physical_table_name,)
-        )
-        table_exists = cursor.fetchone() is not None
+        ) is not None
         logger.info(f"[DELETE-INFO] 테이블 존재: {table_exists}")
 
         # 2. 레코드 수 조회
         record_count = 0
         if table_exists:
-            cursor.execute(f"SELECT COUNT(*) FROM {physical_table_name}")
-            record_count = cursor.fetchone()[0]
+            record_count = await db.run(board_record_count, board_id, physical_table_name)
             logger.info(f"[DELETE-INFO] 레코드 수: {record_count}")
 
         return {
@@ -1015,7 +1031,7 @@ async def delete_confirm_page(
     request: Request,
     board_id: int,
     user: User = Depends(get_current_user_from_cookie),
-    conn: sqlite3.Connection = Depends(get_db_connection)
+    db: AsyncDB = Depends(get_db)
 ):
     """삭제 확인 페이지 (레코드가 있을 때만)"""
     if not user:
@@ -1024,8 +1040,8 @@ async def delete_confirm_page(
     logger.info(f"[DELETE-CONFIRM] board_id={board_id} 삭제 확인 페이지 로드")
 
     try:
-        db_manager = DBManager(conn)
-        board_info = db_manager.get_board_info(board_id)
+        db_manager = AsyncDBManager(db)
+        board_info = await db_manager.get_board_info(board_id)
 
         if not board_info:
             logger.error(f"[DELETE-CONFIRM] 보드를 찾을 수 없음: board_id={board_id}")
@@ -1034,9 +1050,7 @@ async def delete_confirm_page(
         physical_table_name = board_info["physical_table_name"]
 
         # 레코드 수 조회
-        cursor = conn.cursor()
-        cursor.execute(f"SELECT COUNT(*) FROM {physical_table_name}")
-        record_count = cursor.fetchone()[0]
+        record_count = await db.run(board_record_count, board_id, physical_table_name)
         logger.info(f"[DELETE-CONFIRM] 레코드 수: {record_count}")
 
         return request.app.state.templates.TemplateResponse(
@@ -1053,11 +1067,36 @@ async def delete_confirm_page(
         logger.error(f"[DELETE-CONFIRM] 오류: {e}")
         return RedirectResponse(url="/", status_code=status.HTTP_302_FOUND)
 
+def _delete_board_rows(conn: sqlite3.Connection, board_id: int, physical_table_name: str) -> None:
+    """보드 삭제 트랜잭션 본문 (워커 스레드에서 실행)"""
+    cursor = conn.cursor()
+
+    # 1. 물리 테이블 삭제
+    try:
+        cursor.execute(f"DROP TABLE IF EXISTS {physical_table_name}")
+        logger.info(f"[DELETE] ✓ 물리 테이블 삭제: {physical_table_name}")
+    except Exception as e:
+        logger.warning(f"[DELETE] 테이블 삭제 실패 (무시됨): {e}")
+
+    # 검색 색인 / 집계 요약 정리 (보드 FTS 테이블 + 통합 검색 색인 + 요약 테이블)
+    drop_fts(conn, physical_table_name)
+    remove_board_from_search(conn, board_id)
+    drop_summary(conn, physical_table_name)
+    remove_counters(conn, board_id)
+
+    # 2. meta_data 테이블에서 해당 보드의 모든 메타데이터 삭제
+    cursor.execute("DELETE FROM meta_data WHERE board_id = ?", (board_id,))
+    logger.info(f"[DELETE] ✓ meta_data 레코드 삭제")
+
+    # 3. boards 테이블에서 해당 보드 삭제
+    cursor.execute("DELETE FROM boards WHERE id = ?", (board_id,))
+    logger.info(f"[DELETE] ✓ boards 레코드 삭제")
+
 @router.delete("/{board_id}")
 async def delete_board(
     board_id: int,
     user: User = Depends(get_current_user_from_cookie),
-    conn: sqlite3.Connection = Depends(get_db_connection)
+    db: AsyncDB = Depends(get_db)
 ):
     """게시판 삭제 API"""
     if not user:
@@ -1066,8 +1105,8 @@ async def delete_board(
     logger.info(f"[DELETE] board_id={board_id} 삭제 시작")
 
     try:
-        db_manager = DBManager(conn)
-        board_info = db_manager.get_board_info(board_id)
+        db_manager = AsyncDBManager(db)
+        board_info = await db_manager.get_board_info(board_id)
 
         if not board_info:
             logger.error(f"[DELETE] 보드를 찾을 수 없음: board_id={board_id}")
@@ -1076,30 +1115,16 @@ async def delete_board(
         physical_table_name = board_info["physical_table_name"]
         logger.info(f"[DELETE] 물리 테이블명: {physical_table_name}")
 
-        cursor = conn.cursor()
-
-        # 1. 물리 테이블 삭제
-        try:
-            cursor.execute(f"DROP TABLE IF EXISTS {physical_table_name}")
-            logger.info(f"[DELETE] ✓ 물리 테이블 삭제: {physical_table_name}")
-        except Exception as e:
-            logger.warning(f"[DELETE] 테이블 삭제 실패 (무시됨): {e}")
-
-        # 2. meta_data 테이블에서 해당 보드의 모든 메타데이터 삭제
-        cursor.execute("DELETE FROM meta_data WHERE board_id = ?", (board_id,))
-        logger.info(f"[DELETE] ✓ meta_data 레코드 삭제")
-
-        # 3. boards 테이블에서 해당 보드 삭제
-        cursor.execute("DELETE FROM boards WHERE id = ?", (board_id,))
-        logger.info(f"[DELETE] ✓ boards 레코드 삭제")
-
-        # 4. 커밋
-        conn.commit()
+        # 물리 테이블 + 메타데이터 + 보드 삭제 (한 트랜잭션)
+        await db.transaction(_delete_board_rows, board_id, physical_table_name)
+        board_registry.invalidate(board_id)
+        fragment_cache.invalidate_board(board_id)
         logger.info(f"[DELETE] ✓ 트랜잭션 커밋 - 게시판 삭제 완료: board_id={board_id}")
 
         return {"message": "Board deleted successfully", "board_id": board_id}
 
+    except HTTPException:
+        raise
     except Exception as e:
-        conn.rollback()
         logger.error(f"[DELETE] 오류: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -1,23 +1,70 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Request
 from fastapi.responses import HTMLResponse, RedirectResponse
-import sqlite3
 import json
 
 from app.core.logger import get_logger
-from app.core.deps import get_db_connection, get_current_user_from_cookie
+from app.core.deps import get_db, get_current_user_from_cookie
+from app.core.async_db import AsyncDB, get_async_db
+from app.core.db_pool import get_pool
+from app.core.db_writer import get_db_writer
+from app.core.board_registry import board_registry
+from app.core.auth_cache import auth_cache
+from app.core.fragment_cache import fragment_cache
+from app.core.template_env import compile_report
+from app.core.thumbnailer import get_thumbnailer
 from app.schemas.user import User
-from app.utils.db_manager import DBManager
+from app.utils.db_manager import AsyncDBManager
+from app.utils.global_search import rebuild_job
+from app.utils.file_gc import file_gc_job
+from app.utils.board_indexes import desired_index_columns, explain_list_query, list_managed_indexes
 
 logger = get_logger(__name__)
 
 router = APIRouter(prefix="/checker", tags=["checker"])
 
+
+def _index_report(conn, board_id: int):
+    """관리 인덱스 + 목록 쿼리 실행 계획 (워커 스레드에서 실행)"""
+    board = board_registry.get(conn, board_id)
+    if board is None:
+        return None
+    try:
+        explain = explain_list_query(conn, board)
+    except Exception as e:
+        # 물리 테이블이 아직 없거나 메타데이터가 잘못된 경우
+        explain = {"sql": "", "plan": [f"EXPLAIN 실패: {e}"]}
+    return {
+        "indexes": list_managed_indexes(conn, board.physical_table_name),
+        "desired": desired_index_columns(board),
+        "explain": explain
+    }
+
+@router.get("/api/stats")
+async def runtime_stats(request: Request, user: User = Depends(get_current_user_from_cookie)):
+    """런타임 통계 (모니터링용 JSON)"""
+    if not user:
+        raise HTTPException(status_code=401, detail="Unauthorized")
+
+    return {
+        "db_pool": get_pool().stats(),
+        "async_db": get_async_db().stats(),
+        "db_writer": get_db_writer().stats(),
+        "board_registry": board_registry.stats(),
+        "auth_cache": auth_cache.stats(),
+        "fragment_cache": fragment_cache.stats(),
+        "templates": compile_report.stats(),
+        "static_assets": request.app.state.static_assets.stats(),
+        "thumbnails": get_thumbnailer().stats(),
+        "file_gc": file_gc_job.stats(),
+        "search_rebuild": rebuild_job.stats()
+    }
+
 @router.get("/{board_id}", response_class=HTMLResponse)
 async def check_board(
     request: Request,
     board_id: int,
     user: User = Depends(get_current_user_from_cookie),
-    conn: sqlite3.Connection = Depends(get_db_connection)
+    db: AsyncDB = Depends(get_db)
 ):
     """보드 상태 확인 (Metadata & Info)"""
     if not user:
@@ -25,8 +72,8 @@ async def check_board(
 
     logger.info(f"[CHECKER] board_id={board_id} 상태 확인")
 
-    db_manager = DBManager(conn)
-    board_info = db_manager.get_board_info(board_id)
+    db_manager = AsyncDBManager(db)
+    board_info = await db_manager.get_board_info(board_id)
 
     if not board_info:
         raise HTTPException(status_code=404, detail="Board not found")
@@ -34,14 +81,15 @@ async def check_board(
     # 1. Board Info (Already fetched)
     
     # 2. Meta Data (All rows for this board)
-    cursor = conn.cursor()
-    cursor.execute("SELECT name, meta, created_at, updated_at FROM meta_data WHERE board_id = ? ORDER BY name", (board_id,))
-    meta_rows = cursor.fetchall()
+    meta_rows = await db.fetch_all(
+        "SELECT name, meta, created_at, updated_at FROM meta_data WHERE board_id = ? ORDER BY name",
+        (board_id,)
+    )
 
     meta_data_list = []
     for row in meta_rows:
-        name = row[0]
-        meta_str = row[1]
+        name = row["name"]
+        meta_str = row["meta"]
         try:
             # Try to parse JSON for pretty printing
             meta_json = json.loads(meta_str)
@@ -52,20 +100,24 @@ async def check_board(
         meta_data_list.append({
             "name": name,
             "meta": meta_pretty,
-            "created_at": row[2],
-            "updated_at": row[3]
+            "created_at": row["created_at"],
+            "updated_at": row["updated_at"]
         })
 
     # 정해진 순서대로 정렬 (table -> list -> create_edit -> view)
     sort_order = {"table": 1, "list": 2, "create_edit": 3, "view": 4}
     meta_data_list.sort(key=lambda x: sort_order.get(x["name"], 99))
 
+    # 3. 관리 인덱스 + 목록 쿼리 EXPLAIN QUERY PLAN
+    index_report = await db.run(_index_report, board_id)
+
     return request.app.state.templates.TemplateResponse(
         "checker.html",
         {
             "request": request,
             "user": user,
             "board": board_info,
-            "meta_data_list": meta_data_list
+            "meta_data_list": meta_data_list,
+            "index_report": index_report
         }
     )
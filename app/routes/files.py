@@ -1,138 +1,215 @@
-from fastapi import APIRouter, UploadFile, File, Depends, HTTPException, status
-from fastapi.responses import FileResponse, JSONResponse
-import shutil
-import uuid
-import os
-from datetime import datetime
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from fastapi.responses import FileResponse, JSONResponse, RedirectResponse
+from email.utils import formatdate
 from pathlib import Path
-from typing import List
-import sqlite3
+from typing import Any, Dict, List, Optional
+
+from starlette.concurrency import run_in_threadpool
 
 from app.core.config import settings
 from app.core.logger import get_logger
-from app.core.deps import get_db_connection
+from app.core.deps import get_db, get_writer
+from app.core.async_db import AsyncDB
+from app.core.db_writer import DBWriter
+from app.core.thumbnailer import MEDIA_TYPE as THUMB_MEDIA_TYPE, VARIANTS as THUMB_VARIANTS, get_thumbnailer, is_image
+from app.utils.conditional import CACHE_CONTROL, etag_matches, not_modified_since
+from app.utils.file_store import INCOMING_DIR, VERSION_LENGTH, UploadTooLargeError, file_etag, file_url, release_file, remove_quietly, store_blobs, unlink_if_unreferenced
+from app.utils.multipart_upload import MultipartUploadError, receive_multipart
 
 logger = get_logger(__name__)
 
 router = APIRouter(prefix="/api/files", tags=["files"])
 
-@router.post("/upload")
+
+def _remove_received(items: List[Dict[str, Any]]) -> None:
+    """업로드 실패 시 남은 임시 파일 정리 (워커 스레드에서 실행)"""
+    for item in items:
+        remove_quietly(item["path"])
+
+
+async def _conditional_file(
+    request: Request,
+    path: Path,
+    content_hash: Optional[str],
+    v: Optional[str],
+    media_type: str,
+    filename: Optional[str] = None,
+    variant: Optional[str] = None
+) -> Response:
+    """ETag / Last-Modified 조건부 GET + Range 를 지원하는 파일 응답"""
+    try:
+        stat_result = await run_in_threadpool(path.stat)
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail="Physical file not found")
+
+    # 업로드된 파일은 바뀌지 않음 - 단, id 는 삭제 후 재사용될 수 있으므로
+    # 내용 해시가 URL 에 있을 때만 immutable, 아니면 매번 재검증
+    if content_hash and v and content_hash.startswith(v) and len(v) >= VERSION_LENGTH:
+        cache_control = f"private, max-age={settings.FILE_CACHE_MAX_AGE}, immutable"
+    else:
+        cache_control = CACHE_CONTROL
+    etag = file_etag(content_hash, stat_result, variant)
+    headers = {
+        "ETag": etag,
+        "Last-Modified": formatdate(stat_result.st_mtime, usegmt=True),
+        "Cache-Control": cache_control,
+    }
+
+    if etag_matches(request, etag) or not_modified_since(request, stat_result.st_mtime):
+        return Response(status_code=304, headers=headers)
+
+    # Range / If-Range 는 FileResponse 가 위 ETag / Last-Modified 기준으로 처리
+    return FileResponse(
+        path=path,
+        filename=filename,
+        media_type=media_type,
+        headers=headers,
+        stat_result=stat_result
+    )
+
+
+@router.post("/upload", openapi_extra={"requestBody": {"required": True, "content": {"multipart/form-data": {
+    "schema": {"type": "object", "required": ["files"], "properties": {
+        "files": {"type": "array", "items": {"type": "string", "format": "binary"}}
+    }}
+}}}})
 async def upload_files(
-    files: List[UploadFile] = File(...),
-    conn: sqlite3.Connection = Depends(get_db_connection)
+    request: Request,
+    writer: DBWriter = Depends(get_writer)
 ):
-    """파일 업로드 API"""
+    """파일 업로드 API (multipart 를 스트림으로 읽으며 저장, 최대 크기를 넘으면 수신 중단)"""
     uploaded_files = []
-    cursor = conn.cursor()
+    received: List[Dict[str, Any]] = []
+    max_bytes = settings.UPLOAD_MAX_BYTES
+    files_dir = settings.FILES_DIR
 
     try:
-        # yyyy/mm 폴더 생성
-        now = datetime.now()
-        base_folder = now.strftime("%Y/%m")
-        save_dir = settings.FILES_DIR / base_folder
-        save_dir.mkdir(parents=True, exist_ok=True)
-
-        for file in files:
-            # UUID 생성 (하이픈 제거)
-            physical_name = str(uuid.uuid4()).replace("-", "")
-            file_path = save_dir / physical_name
-
-            # 파일 저장
-            with open(file_path, "wb") as buffer:
-                shutil.copyfileobj(file.file, buffer)
-            
-            # 파일 정보 저장
-            file_size = os.path.getsize(file_path)
-            logical_name = file.filename
-            mime_type = file.content_type
-
-            cursor.execute(
-                """
-                INSERT INTO files (base_folder, physical_name, logical_name, size, mime)
-                VALUES (?, ?, ?, ?, ?)
-                """,
-                (base_folder, physical_name, logical_name, file_size, mime_type)
-            )
-            file_id = cursor.lastrowid
-            
+        # 본문을 먼저 spool 하지 않고 chunk 단위로 임시 파일에 기록 + SHA-256 / 크기 계산
+        received = await receive_multipart(
+            request, "files", files_dir / INCOMING_DIR, max_bytes, settings.UPLOAD_CHUNK_SIZE
+        )
+        if not received:
+            raise MultipartUploadError("No files uploaded")
+
+        # 내용 해시 위치로 rename (같은 내용이 있으면 공유) + 업로드마다 files 행 추가 (writer 에서 직렬화)
+        stored = await writer.call(lambda conn: store_blobs(conn, files_dir, received))
+
+        # 새 이미지는 썸네일 생성 예약 (큐가 가득 차면 첫 요청 때 생성)
+        thumbnailer = get_thumbnailer()
+        for result, item in zip(stored, received):
+            if not result["deduplicated"] and is_image(item["mime"]):
+                thumbnailer.enqueue(files_dir / result["base_folder"] / result["physical_name"])
+
+        for result, item in zip(stored, received):
             uploaded_files.append({
-                "id": file_id,
-                "logical_name": logical_name,
-                "size": file_size,
-                "mime": mime_type
+                "id": result["id"],
+                "logical_name": item["logical_name"],
+                "size": item["size"],
+                "mime": item["mime"],
+                "sha256": item["sha256"],
+                "url": file_url(result["id"], item["sha256"]),
+                "deduplicated": result["deduplicated"]
             })
-            
-            logger.info(f"[FILE] Uploaded: {logical_name} -> {base_folder}/{physical_name} (ID: {file_id})")
+            logger.info(
+                f"[FILE] Uploaded: {item['logical_name']} -> {item['sha256'][:12]} "
+                f"(ID: {result['id']}, dedup={result['deduplicated']})"
+            )
 
-        conn.commit()
         return JSONResponse(uploaded_files, status_code=201)
 
+    except UploadTooLargeError as e:
+        logger.warning(f"[FILE] Upload rejected: {e}")
+        raise HTTPException(status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail=str(e))
+    except MultipartUploadError as e:
+        await run_in_threadpool(_remove_received, received)
+        logger.warning(f"[FILE] Upload rejected: {e}")
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
-        conn.rollback()
+        # DB 에 기록되지 않은 임시 파일은 남기지 않음
+        await run_in_threadpool(_remove_received, received)
         logger.error(f"[FILE] Upload failed: {e}")
         raise HTTPException(status_code=500, detail="File upload failed")
 
-@router.get("/{file_id}")
+@router.api_route("/{file_id}", methods=["GET", "HEAD"])
 async def download_file(
+    request: Request,
     file_id: int,
-    conn: sqlite3.Connection = Depends(get_db_connection)
+    v: Optional[str] = None,
+    db: AsyncDB = Depends(get_db)
 ):
-    """파일 다운로드 API"""
-    cursor = conn.cursor()
-    cursor.execute(
-        "SELECT base_folder, physical_name, logical_name, mime FROM files WHERE id = ?",
+    """파일 다운로드 API (ETag / Last-Modified 조건부 GET, Range 지원)"""
+    row = await db.fetch_one(
+        "SELECT base_folder, physical_name, logical_name, mime, content_hash FROM files WHERE id = ?",
         (file_id,)
     )
-    row = cursor.fetchone()
 
     if not row:
         raise HTTPException(status_code=404, detail="File not found")
 
-    base_folder, physical_name, logical_name, mime_type = row
-    file_path = settings.FILES_DIR / base_folder / physical_name
-
-    if not file_path.exists():
-        raise HTTPException(status_code=404, detail="Physical file not found")
+    logical_name = row["logical_name"]
+    mime_type = row["mime"]
+    content_hash = row["content_hash"]
+    file_path = settings.FILES_DIR / row["base_folder"] / row["physical_name"]
 
-    return FileResponse(
-        path=file_path,
-        filename=logical_name,
-        media_type=mime_type
+    return await _conditional_file(
+        request, file_path, content_hash, v, media_type=mime_type, filename=logical_name
     )
 
-@router.delete("/{file_id}")
-async def delete_file(
+
+@router.get("/{file_id}/thumb")
+async def file_thumbnail(
+    request: Request,
     file_id: int,
-    conn: sqlite3.Connection = Depends(get_db_connection)
+    size: str = "thumb",
+    v: Optional[str] = None,
+    db: AsyncDB = Depends(get_db)
 ):
-    """파일 삭제 API"""
-    cursor = conn.cursor()
-    cursor.execute(
-        "SELECT base_folder, physical_name FROM files WHERE id = ?", 
-        (file_id,)
+    """이미지 썸네일(thumb) / 미리보기(preview) API (없으면 생성 후 응답)"""
+    if size not in THUMB_VARIANTS:
+        raise HTTPException(status_code=400, detail=f"size must be one of {', '.join(THUMB_VARIANTS)}")
+
+    row = await db.fetch_one(
+        "SELECT base_folder, physical_name, mime, content_hash FROM files WHERE id = ?", (file_id,)
     )
-    row = cursor.fetchone()
-    
     if not row:
         raise HTTPException(status_code=404, detail="File not found")
+    if not is_image(row["mime"]):
+        raise HTTPException(status_code=404, detail="Not an image")
 
-    base_folder, physical_name = row
-    file_path = settings.FILES_DIR / base_folder / physical_name
+    file_path = settings.FILES_DIR / row["base_folder"] / row["physical_name"]
+    thumb_path = await get_thumbnailer().ensure(file_path, size)
+    if thumb_path is None:
+        # Pillow 미설치 / 생성 실패 - 원본으로
+        return RedirectResponse(file_url(file_id, row["content_hash"]), status_code=307)
+
+    return await _conditional_file(
+        request, thumb_path, row["content_hash"], v, media_type=THUMB_MEDIA_TYPE, variant=size
+    )
 
-    try:
-        # DB 삭제 (file_match는 ON DELETE CASCADE가 없으므로 수동 삭제 필요)
-        cursor.execute("DELETE FROM file_match WHERE file_id = ?", (file_id,))
-        cursor.execute("DELETE FROM files WHERE id = ?", (file_id,))
-        conn.commit()
-
-        # 물리 파일 삭제
-        if file_path.exists():
-            os.remove(file_path)
-            logger.info(f"[FILE] Deleted physical file: {file_path}")
-        
-        return JSONResponse({"message": "File deleted"}, status_code=200)
 
+@router.delete("/{file_id}")
+async def delete_file(
+    file_id: int,
+    writer: DBWriter = Depends(get_writer)
+):
+    """파일 삭제 API (행 삭제, 물리 파일은 다른 업로드가 공유하지 않을 때만 삭제)"""
+    try:
+        released = await writer.call(lambda conn: release_file(conn, file_id))
     except Exception as e:
-        conn.rollback()
         logger.error(f"[FILE] Delete failed: {e}")
         raise HTTPException(status_code=500, detail="File delete failed")
+
+    if released is None:
+        raise HTTPException(status_code=404, detail="File not found")
+
+    if released["ref_count"] == 0:
+        try:
+            # 커밋 후 별도 intent 로 → 같은 내용의 업로드와 직렬화
+            await writer.call(lambda conn: unlink_if_unreferenced(
+                conn, settings.FILES_DIR, released["base_folder"], released["physical_name"]
+            ))
+        except Exception as e:
+            # 행은 이미 삭제됨 - 남은 파일은 고아 파일 정리 대상
+            logger.warning(f"[FILE] Physical delete failed: {e}")
+
+    return JSONResponse({"message": "File deleted", "ref_count": released["ref_count"]}, status_code=200)
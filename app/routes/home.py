@@ -7,16 +7,17 @@
 from fastapi import APIRouter, Request, Form, Depends, status
 from fastapi.responses import HTMLResponse, RedirectResponse
 from fastapi.templating import Jinja2Templates
+from starlette.concurrency import run_in_threadpool
 from datetime import timedelta
 from typing import Optional
 
 from app.core.config import settings
 from app.core.logger import get_logger
 from app.core.security import create_access_token, verify_password
-from app.core.deps import get_current_user_from_cookie, get_db_connection
+from app.core.auth_cache import auth_cache
+from app.core.deps import get_current_user_from_cookie, get_db
+from app.core.async_db import AsyncDB
 from app.schemas.user import User
-from app.utils.db_manager import DBManager
-import sqlite3
 
 logger = get_logger(__name__)
 
@@ -30,7 +31,7 @@ def get_templates(request: Request) -> Jinja2Templates:
 async def home(
     request: Request,
     user: Optional[User] = Depends(get_current_user_from_cookie),
-    conn: sqlite3.Connection = Depends(get_db_connection)
+    db: AsyncDB = Depends(get_db)
 ):
     """메인 페이지 - 로그인 상태에 따라 분기"""
     templates = get_templates(request)
@@ -38,9 +39,11 @@ async def home(
     if user:
         # 로그인 상태 -> index.html (Dashboard)
         # 보드 목록 조회
-        cursor = conn.cursor()
-        cursor.execute("SELECT id, name, note, created_at FROM boards ORDER BY id DESC")
-        boards = [dict(row) for row in cursor.fetchall()]
+        # 레코드 수는 board_stats 카운터 (보드별 COUNT(*) 없음)
+        boards = await db.fetch_all(
+            "SELECT b.id, b.name, b.note, b.created_at, s.row_count, s.last_insert_at "
+            "FROM boards b LEFT JOIN board_stats s ON s.board_id = b.id ORDER BY b.id DESC"
+        )
 
         return templates.TemplateResponse(
             "index.html",
@@ -63,25 +66,25 @@ async def login_page(request: Request, user: Optional[User] = Depends(get_curren
 async def login(
     request: Request,
     username: str = Form(...),
-    password: str = Form(...)
+    password: str = Form(...),
+    db: AsyncDB = Depends(get_db)
 ):
     """로그인 처리"""
     templates = get_templates(request)
     
     # DB에서 유저 확인
-    conn = sqlite3.connect(settings.DB_PATH)
-    conn.row_factory = sqlite3.Row
-    cursor = conn.cursor()
-    cursor.execute("SELECT * FROM admin_users WHERE username = ?", (username,))
-    user = cursor.fetchone()
-    conn.close()
+    user = await db.fetch_one("SELECT * FROM admin_users WHERE username = ?", (username,))
     
-    if not user or not verify_password(password, user["password"]):
+    # bcrypt 검증은 CPU를 오래 쓰므로 이벤트 루프 밖에서 실행
+    if not user or not await run_in_threadpool(verify_password, password, user["password"]):
         return templates.TemplateResponse(
             "login.html", 
             {"request": request, "error": "아이디 또는 비밀번호가 올바르지 않습니다."}
         )
     
+    # 로그인 시점의 계정 정보로 다시 캐시하도록 기존 캐시 제거
+    auth_cache.invalidate_user(user["username"])
+
     # 토큰 생성
     access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     access_token = create_access_token(
@@ -102,6 +105,10 @@ async def login(
 @router.get("/logout")
 async def logout(request: Request):
     """로그아웃"""
+    token = request.cookies.get("access_token")
+    if token:
+        auth_cache.forget_token(token.split(" ")[-1])
+
     response = RedirectResponse(url="/", status_code=status.HTTP_302_FOUND)
     response.delete_cookie("access_token")
     return response
@@ -3,14 +3,31 @@ Records API - 기록물(기록 아이템) 순수 CRUD API
 각 보드의 실제 데이터 레코드를 JSON으로 반환
 """
 
-from fastapi import APIRouter, Depends, HTTPException, Request, status
-from fastapi.responses import HTMLResponse, RedirectResponse
-import sqlite3
+import csv
 
+from fastapi import APIRouter, Depends, File, HTTPException, Request, Response, UploadFile, status
+from fastapi.responses import HTMLResponse, RedirectResponse, StreamingResponse
+from typing import Any, Dict, Hashable, Optional
+
+from markupsafe import Markup
+
+from app.core.config import settings
 from app.core.logger import get_logger
-from app.core.deps import get_db_connection, get_current_user_from_cookie
+from app.core.deps import get_db, get_writer, get_current_user_from_cookie
+from app.core.async_db import AsyncDB
+from app.core.db_writer import DBWriter
+from app.core.fragment_cache import fragment_cache
 from app.schemas.user import User
-from app.utils.db_manager import DBManager
+from app.schemas.record import BulkDeleteRequest, BulkUpdateRequest
+from app.utils.db_manager import AsyncDBManager
+from app.utils.record_query import resolve_list_query, fetch_record_page, fetch_record_keyset
+from app.utils.board_fts import fts_enabled, search_fts
+from app.utils.record_import import detect_format, run_import
+from app.utils.record_export import EXPORT_FORMATS, content_disposition, iter_export
+from app.utils.record_bulk import build_set, build_target, bulk_delete, bulk_update
+from app.utils.record_stats import compute_stats
+from app.utils.write_plan import WritePlanError, get_write_plan
+from app.utils.conditional import board_etag, board_version, etag_matches, not_modified, request_etag, set_etag
 
 logger = get_logger(__name__)
 
@@ -21,21 +38,48 @@ router = APIRouter(prefix="/records", tags=["records"])
 # HTML Pages
 # ============================================================================
 
+def _render_body(
+    request: Request,
+    template_name: str,
+    board_id: int,
+    version: Optional[int],
+    params: Hashable,
+    context: Dict[str, Any],
+) -> Markup:
+    """사용자와 무관한 본문 조각 렌더링 (보드 데이터 버전이 있으면 캐시에 저장)"""
+    html = request.app.state.templates.get_template(template_name).render(context)
+    if version is not None:
+        fragment_cache.put((template_name, board_id, version, params), html)
+    return Markup(html)
+
+
+def _cached_body(template_name: str, board_id: int, version: Optional[int], params: Hashable) -> Optional[Markup]:
+    if version is None:
+        return None
+    html = fragment_cache.get((template_name, board_id, version, params))
+    return Markup(html) if html is not None else None
+
+
 @router.get("/{board_id}/", response_class=HTMLResponse)
 async def get_records_list(
     request: Request,
     board_id: int,
+    page: int = 1,
+    page_size: Optional[int] = None,
+    sort: Optional[str] = None,
+    order: Optional[str] = None,
+    q: Optional[str] = None,
     user: User = Depends(get_current_user_from_cookie),
-    conn: sqlite3.Connection = Depends(get_db_connection)
+    db: AsyncDB = Depends(get_db)
 ):
-    """기록물 list  조회 (HTML)"""
+    """기록물 list  조회 (HTML) - list 메타데이터 기반 페이징/정렬/검색"""
     if not user:
         return RedirectResponse(url="/login", status_code=status.HTTP_302_FOUND)
 
     logger.info(f"[RECORDS-LIST-1] board_id={board_id} 기록물 목록 조회 시작")
 
-    db_manager = DBManager(conn)
-    board_info = db_manager.get_board_info(board_id)
+    board = await AsyncDBManager(db).get_board(board_id)
+    board_info = board.info if board else None
 
     if not board_info:
         logger.error(f"[RECORDS-LIST-ERROR] 보드를 찾을 수 없음: board_id={board_id}")
@@ -43,32 +87,47 @@ async def get_records_list(
 
     logger.info(f"[RECORDS-LIST-2] ✓ 보드 찾음: {board_info['name']}")
 
-    # 컬럼 정보 조회
-    table_meta = db_manager.get_metadata(board_id, "table") or {}
-    columns = table_meta.get("columns", [])
-
-    # 실제 레코드 조회
-    physical_table_name = board_info["physical_table_name"]
-    cursor = conn.cursor()
-
-    try:
-        cursor.execute(f"SELECT * FROM {physical_table_name} ORDER BY id DESC")
-        records = [dict(row) for row in cursor.fetchall()]
-        logger.info(f"[RECORDS-LIST-3] ✓ 레코드 조회 완료: {len(records)}개")
-    except Exception as e:
-        logger.error(f"[RECORDS-LIST-ERROR] 레코드 조회 실패: {e}")
-        records = []
+    version = await board_version(db, board_id)
+    etag = request_etag(request, board_id, version, user.username)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+
+    # 실제 레코드 조회 (현재 페이지만) - 같은 데이터 버전/조건의 본문은 캐시에서
+    list_query = resolve_list_query(board, page, page_size, sort, order, q)
+    params = (list_query.page, list_query.page_size, list_query.sort, list_query.search)
+    body = _cached_body("record/_list_body.html", board_id, version, params)
+
+    if body is None:
+        try:
+            result = await db.run(fetch_record_page, board, list_query)
+            logger.info(f"[RECORDS-LIST-3] ✓ 레코드 조회 완료: {len(result['records'])}개 / 전체 {result['total_count']}개")
+        except Exception as e:
+            logger.error(f"[RECORDS-LIST-ERROR] 레코드 조회 실패: {e}")
+            result = {
+                "records": [], "total_count": 0, "total_pages": 1, "page": 1,
+                "page_size": list_query.page_size, "sort": list_query.sort_column,
+                "order": list_query.sort_order, "q": list_query.search or "",
+                "search_fields": list(list_query.search_fields)
+            }
+            # 실패한 결과는 캐시하지 않음
+            version = None
+
+        # 컬럼 정보 (레지스트리 캐시)
+        body = _render_body(request, "record/_list_body.html", board_id, version, params, {
+            "board": board_info,
+            "columns": board.columns,
+            **result
+        })
 
-    return request.app.state.templates.TemplateResponse(
+    return set_etag(request.app.state.templates.TemplateResponse(
         "record/list.html",
         {
             "request": request,
             "user": user,
             "board": board_info,
-            "records": records,
-            "columns": columns
+            "body": body
         }
-    )
+    ), etag)
 
 
 @router.get("/{board_id}/create", response_class=HTMLResponse)
@@ -76,23 +135,27 @@ async def record_create_page(
     request: Request,
     board_id: int,
     user: User = Depends(get_current_user_from_cookie),
-    conn: sqlite3.Connection = Depends(get_db_connection)
+    db: AsyncDB = Depends(get_db)
 ):
     """기록 생성 페이지"""
     if not user:
         return RedirectResponse(url="/login", status_code=status.HTTP_302_FOUND)
 
-    db_manager = DBManager(conn)
-    board_info = db_manager.get_board_info(board_id)
+    board = await AsyncDBManager(db).get_board(board_id)
+    board_info = board.info if board else None
 
     if not board_info:
         return RedirectResponse(url="/boards", status_code=status.HTTP_302_FOUND)
 
-    table_meta = db_manager.get_metadata(board_id, "table") or {}
-    columns_data = table_meta.get("columns", [])
-    create_edit_config = db_manager.get_metadata(board_id, "create_edit")
+    etag = await board_etag(db, request, board_id, user.username)
+    if etag_matches(request, etag):
+        return not_modified(etag)
 
-    return request.app.state.templates.TemplateResponse(
+    table_meta = board.table_meta or {}
+    columns_data = board.columns
+    create_edit_config = board.create_edit_meta
+
+    return set_etag(request.app.state.templates.TemplateResponse(
         "record/create.html",
         {
             "request": request,
@@ -102,7 +165,7 @@ async def record_create_page(
             "table_meta": table_meta,
             "create_edit_config": create_edit_config
         }
-    )
+    ), etag)
 
 
 @router.get("/{board_id}/view/{record_id}", response_class=HTMLResponse)
@@ -111,44 +174,49 @@ async def record_view_page(
     board_id: int,
     record_id: int,
     user: User = Depends(get_current_user_from_cookie),
-    conn: sqlite3.Connection = Depends(get_db_connection)
+    db: AsyncDB = Depends(get_db)
 ):
     """기록 상세보기 페이지"""
     if not user:
         return RedirectResponse(url="/login", status_code=status.HTTP_302_FOUND)
 
-    db_manager = DBManager(conn)
-    board_info = db_manager.get_board_info(board_id)
+    board = await AsyncDBManager(db).get_board(board_id)
+    board_info = board.info if board else None
 
     if not board_info:
         return RedirectResponse(url="/boards", status_code=status.HTTP_302_FOUND)
 
-    table_meta = db_manager.get_metadata(board_id, "table") or {}
-    columns_data = table_meta.get("columns", [])
-    view_config = db_manager.get_metadata(board_id, "view")
+    version = await board_version(db, board_id)
+    etag = request_etag(request, board_id, version, user.username)
+    if etag_matches(request, etag):
+        return not_modified(etag)
 
-    # 레코드 조회
-    physical_table_name = board_info["physical_table_name"]
-    cursor = conn.cursor()
-    cursor.execute(f"SELECT * FROM {physical_table_name} WHERE id = ?", (record_id,))
-    row = cursor.fetchone()
+    body = _cached_body("record/_view_body.html", board_id, version, record_id)
+    if body is None:
+        # 레코드 조회
+        physical_table_name = board_info["physical_table_name"]
+        record = await db.fetch_one(f"SELECT * FROM {physical_table_name} WHERE id = ?", (record_id,))
 
-    if not row:
-        return RedirectResponse(url=f"/records/{board_id}/", status_code=status.HTTP_302_FOUND)
+        if not record:
+            return RedirectResponse(url=f"/records/{board_id}/", status_code=status.HTTP_302_FOUND)
 
-    record = dict(row)
+        body = _render_body(request, "record/_view_body.html", board_id, version, record_id, {
+            "board": board_info,
+            "record": record,
+            "columns": board.columns,
+            "view_config": board.view_meta
+        })
 
-    return request.app.state.templates.TemplateResponse(
+    return set_etag(request.app.state.templates.TemplateResponse(
         "record/view.html",
         {
             "request": request,
             "user": user,
             "board": board_info,
-            "record": record,
-            "columns": columns_data,
-            "view_config": view_config
+            "record_id": record_id,
+            "body": body
         }
-    )
+    ), etag)
 
 
 @router.get("/{board_id}/edit/{record_id}", response_class=HTMLResponse)
@@ -157,34 +225,34 @@ async def record_edit_page(
     board_id: int,
     record_id: int,
     user: User = Depends(get_current_user_from_cookie),
-    conn: sqlite3.Connection = Depends(get_db_connection)
+    db: AsyncDB = Depends(get_db)
 ):
     """기록 수정 페이지"""
     if not user:
         return RedirectResponse(url="/login", status_code=status.HTTP_302_FOUND)
 
-    db_manager = DBManager(conn)
-    board_info = db_manager.get_board_info(board_id)
+    board = await AsyncDBManager(db).get_board(board_id)
+    board_info = board.info if board else None
 
     if not board_info:
         return RedirectResponse(url="/boards", status_code=status.HTTP_302_FOUND)
 
-    table_meta = db_manager.get_metadata(board_id, "table") or {}
-    columns_data = table_meta.get("columns", [])
-    create_edit_config = db_manager.get_metadata(board_id, "create_edit")
+    etag = await board_etag(db, request, board_id, user.username)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+
+    table_meta = board.table_meta or {}
+    columns_data = board.columns
+    create_edit_config = board.create_edit_meta
 
     # 레코드 조회
     physical_table_name = board_info["physical_table_name"]
-    cursor = conn.cursor()
-    cursor.execute(f"SELECT * FROM {physical_table_name} WHERE id = ?", (record_id,))
-    row = cursor.fetchone()
+    record = await db.fetch_one(f"SELECT * FROM {physical_table_name} WHERE id = ?", (record_id,))
 
-    if not row:
+    if not record:
         return RedirectResponse(url=f"/records/{board_id}/", status_code=status.HTTP_302_FOUND)
 
-    record = dict(row)
-
-    return request.app.state.templates.TemplateResponse(
+    return set_etag(request.app.state.templates.TemplateResponse(
         "record/edit.html",
         {
             "request": request,
@@ -194,18 +262,280 @@ async def record_edit_page(
             "columns": columns_data,
             "create_edit_config": create_edit_config
         }
-    )
+    ), etag)
 
 
 # ============================================================================
 # JSON APIs
 # ============================================================================
 
+@router.get("/api/{board_id}/")
+async def list_records(
+    request: Request,
+    response: Response,
+    board_id: int,
+    page: int = 1,
+    page_size: Optional[int] = None,
+    sort: Optional[str] = None,
+    order: Optional[str] = None,
+    q: Optional[str] = None,
+    after: Optional[str] = None,
+    before: Optional[str] = None,
+    user: User = Depends(get_current_user_from_cookie),
+    db: AsyncDB = Depends(get_db)
+):
+    """기록 목록 조회 (JSON) - HTML 목록과 같은 페이징/정렬/검색 규칙
+
+    after/before cursor 가 주어지면 keyset 페이지로 조회 (OFFSET/COUNT 없음).
+    응답의 next_cursor 를 다음 요청의 after 로 넘기면 된다.
+    """
+    if not user:
+        raise HTTPException(status_code=401, detail="Unauthorized")
+
+    board = await AsyncDBManager(db).get_board(board_id)
+    if not board:
+        logger.error(f"[RECORDS-API-LIST-ERROR] 보드를 찾을 수 없음: board_id={board_id}")
+        raise HTTPException(status_code=404, detail="Board not found")
+
+    etag = await board_etag(db, request, board_id)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+
+    list_query = resolve_list_query(board, page, page_size, sort, order, q)
+    if after or before:
+        try:
+            result = await db.run(fetch_record_keyset, board, list_query, after, before)
+        except ValueError as e:
+            logger.warning(f"[RECORDS-API-LIST-CURSOR] 잘못된 cursor: board_id={board_id}, {e}")
+            raise HTTPException(status_code=400, detail=str(e))
+    else:
+        result = await db.run(fetch_record_page, board, list_query)
+
+    set_etag(response, etag)
+    return {
+        "board_id": board_id,
+        "board_name": board.info["name"],
+        **result
+    }
+
+
+@router.get("/api/{board_id}/search")
+async def search_records(
+    request: Request,
+    response: Response,
+    board_id: int,
+    q: str = "",
+    limit: int = 20,
+    offset: int = 0,
+    user: User = Depends(get_current_user_from_cookie),
+    db: AsyncDB = Depends(get_db)
+):
+    """전문 검색 (FTS5) - 순위순 레코드 id + snippet 하이라이트"""
+    if not user:
+        raise HTTPException(status_code=401, detail="Unauthorized")
+
+    board = await AsyncDBManager(db).get_board(board_id)
+    if not board:
+        logger.error(f"[RECORDS-API-SEARCH-ERROR] 보드를 찾을 수 없음: board_id={board_id}")
+        raise HTTPException(status_code=404, detail="Board not found")
+    if not fts_enabled(board):
+        raise HTTPException(status_code=400, detail="Full-text search is not enabled for this board")
+
+    etag = await board_etag(db, request, board_id)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+
+    limit = max(1, min(limit, 100))
+    results = await db.run(search_fts, board, q, limit, max(0, offset))
+    logger.info(f"[RECORDS-API-SEARCH] board_id={board_id}, q={q!r}, hits={len(results)}")
+
+    set_etag(response, etag)
+    return {
+        "board_id": board_id,
+        "q": q,
+        "results": results
+    }
+
+
+@router.get("/api/{board_id}/stats")
+async def record_stats(
+    request: Request,
+    response: Response,
+    board_id: int,
+    date_column: Optional[str] = None,
+    bucket: str = "day",
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    q: Optional[str] = None,
+    user: User = Depends(get_current_user_from_cookie),
+    db: AsyncDB = Depends(get_db)
+):
+    """수치 컬럼 집계 (count/min/max/avg/sum) + 날짜 컬럼 기준 day/week/month 버킷 집계
+
+    q 는 목록 검색과 같은 조건. 검색어가 없으면 요약 테이블(설정된 경우)에서 계산한다.
+    """
+    if not user:
+        raise HTTPException(status_code=401, detail="Unauthorized")
+
+    board = await AsyncDBManager(db).get_board(board_id)
+    if not board:
+        logger.error(f"[RECORD-STATS-ERROR] 보드를 찾을 수 없음: board_id={board_id}")
+        raise HTTPException(status_code=404, detail="Board not found")
+
+    etag = await board_etag(db, request, board_id)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+
+    list_query = resolve_list_query(board, q=q)
+    try:
+        result = await db.run(compute_stats, board, list_query, date_column, bucket.lower(), start, end)
+    except ValueError as e:
+        logger.warning(f"[RECORD-STATS-1] 잘못된 요청: board_id={board_id}, {e}")
+        raise HTTPException(status_code=400, detail=str(e))
+
+    set_etag(response, etag)
+    return {
+        "board_id": board_id,
+        "board_name": board.info["name"],
+        **result
+    }
+
+
+@router.get("/api/{board_id}/export")
+async def export_records(
+    board_id: int,
+    format: str = "csv",
+    sort: Optional[str] = None,
+    order: Optional[str] = None,
+    q: Optional[str] = None,
+    user: User = Depends(get_current_user_from_cookie),
+    db: AsyncDB = Depends(get_db)
+):
+    """CSV / JSONL 내보내기 (스트리밍) - 목록과 같은 검색/정렬 조건 적용"""
+    if not user:
+        raise HTTPException(status_code=401, detail="Unauthorized")
+
+    fmt = format.lower()
+    if fmt not in EXPORT_FORMATS:
+        raise HTTPException(status_code=400, detail="Unsupported format (csv, jsonl)")
+
+    board = await AsyncDBManager(db).get_board(board_id)
+    if not board:
+        logger.error(f"[RECORD-EXPORT-ERROR] 보드를 찾을 수 없음: board_id={board_id}")
+        raise HTTPException(status_code=404, detail="Board not found")
+
+    list_query = resolve_list_query(board, sort=sort, order=order, q=q)
+    logger.info(f"[RECORD-EXPORT-1] board_id={board_id}, format={fmt}")
+
+    # 동기 generator 는 StreamingResponse 가 워커 스레드에서 순회
+    return StreamingResponse(
+        iter_export(board, list_query, fmt),
+        media_type=EXPORT_FORMATS[fmt],
+        headers={"Content-Disposition": content_disposition(board, fmt)}
+    )
+
+
+@router.post("/api/{board_id}/import")
+async def import_records(
+    board_id: int,
+    file: UploadFile = File(...),
+    format: Optional[str] = None,
+    db: AsyncDB = Depends(get_db),
+    writer: DBWriter = Depends(get_writer),
+    user: User = Depends(get_current_user_from_cookie)
+):
+    """CSV / JSONL 대량 가져오기 - 헤더는 컬럼명 또는 라벨, 값은 data_type 으로 변환"""
+    if not user:
+        raise HTTPException(status_code=401, detail="Unauthorized")
+
+    board = await AsyncDBManager(db).get_board(board_id)
+    if not board:
+        logger.error(f"[RECORD-IMPORT-ERROR] 보드를 찾을 수 없음: board_id={board_id}")
+        raise HTTPException(status_code=404, detail="Board not found")
+
+    fmt = detect_format(file.filename, format)
+    if fmt is None:
+        raise HTTPException(status_code=400, detail="Unsupported format (csv, jsonl)")
+
+    logger.info(f"[RECORD-IMPORT-1] board_id={board_id}, file={file.filename}, format={fmt}")
+    try:
+        result = await run_import(writer, board, file.file, fmt, settings.IMPORT_CHUNK_SIZE)
+    except (UnicodeDecodeError, csv.Error) as e:
+        logger.error(f"[RECORD-IMPORT-ERROR] 파일 읽기 실패: {e}")
+        raise HTTPException(status_code=400, detail=f"Invalid file: {e}")
+    finally:
+        await file.close()
+
+    return {"board_id": board_id, **result}
+
+
+@router.post("/api/{board_id}/bulk/delete")
+async def bulk_delete_records(
+    board_id: int,
+    body: BulkDeleteRequest,
+    db: AsyncDB = Depends(get_db),
+    writer: DBWriter = Depends(get_writer),
+    user: User = Depends(get_current_user_from_cookie)
+):
+    """일괄 삭제 (ids 또는 filter) - DELETE 문 1개"""
+    if not user:
+        raise HTTPException(status_code=401, detail="Unauthorized")
+
+    board = await AsyncDBManager(db).get_board(board_id)
+    if not board:
+        logger.error(f"[RECORD-BULK-DELETE-ERROR] 보드를 찾을 수 없음: board_id={board_id}")
+        raise HTTPException(status_code=404, detail="Board not found")
+
+    try:
+        where, params = build_target(board, body.ids, body.filter)
+    except WritePlanError as e:
+        raise HTTPException(status_code=400, detail=e.errors)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    deleted = await writer.call(lambda conn: bulk_delete(conn, board, where, params))
+    logger.info(f"[RECORD-BULK-DELETE] board_id={board_id}, deleted={deleted}")
+
+    return {"success": True, "board_id": board_id, "deleted": deleted}
+
+
+@router.post("/api/{board_id}/bulk/update")
+async def bulk_update_records(
+    board_id: int,
+    body: BulkUpdateRequest,
+    db: AsyncDB = Depends(get_db),
+    writer: DBWriter = Depends(get_writer),
+    user: User = Depends(get_current_user_from_cookie)
+):
+    """일괄 수정 (ids 또는 filter) - UPDATE 문 1개"""
+    if not user:
+        raise HTTPException(status_code=401, detail="Unauthorized")
+
+    board = await AsyncDBManager(db).get_board(board_id)
+    if not board:
+        logger.error(f"[RECORD-BULK-UPDATE-ERROR] 보드를 찾을 수 없음: board_id={board_id}")
+        raise HTTPException(status_code=404, detail="Board not found")
+
+    try:
+        where, params = build_target(board, body.ids, body.filter)
+        set_sql, set_params = build_set(board, body.set)
+    except WritePlanError as e:
+        raise HTTPException(status_code=400, detail=e.errors)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    updated = await writer.call(lambda conn: bulk_update(conn, board, set_sql, set_params, where, params))
+    logger.info(f"[RECORD-BULK-UPDATE] board_id={board_id}, updated={updated}")
+
+    return {"success": True, "board_id": board_id, "updated": updated}
+
+
 @router.post("/api/{board_id}/")
 async def create_record(
     board_id: int,
     form_data: dict,
-    conn: sqlite3.Connection = Depends(get_db_connection),
+    db: AsyncDB = Depends(get_db),
+    writer: DBWriter = Depends(get_writer),
     user: User = Depends(get_current_user_from_cookie)
 ):
     """새 기록 생성 (JSON)"""
@@ -215,27 +545,23 @@ async def create_record(
     logger.info(f"[RECORD-CREATE-1] board_id={board_id} 새 기록 생성 시작")
 
     try:
-        db_manager = DBManager(conn)
-        board_info = db_manager.get_board_info(board_id)
+        board = await AsyncDBManager(db).get_board(board_id)
+        board_info = board.info if board else None
 
         if not board_info:
             logger.error(f"[RECORD-CREATE-ERROR] 보드를 찾을 수 없음: board_id={board_id}")
             raise HTTPException(status_code=404, detail="Board not found")
 
-        physical_table_name = board_info["physical_table_name"]
-        cursor = conn.cursor()
-
-        # 레코드 생성
-        columns = list(form_data.keys())
-        placeholders = ",".join(["?"] * len(columns))
-        values = [form_data[col] for col in columns]
-
-        insert_sql = f"INSERT INTO {physical_table_name} ({','.join(columns)}) VALUES ({placeholders})"
-        logger.info(f"[RECORD-CREATE-2] SQL 실행: {insert_sql}")
+        # 레코드 생성 (컴파일된 쓰기 계획: 컬럼 검증 + 형 변환 + 고정 INSERT 문)
+        plan = get_write_plan(board)
+        try:
+            values = plan.coerce(form_data)
+        except WritePlanError as e:
+            logger.warning(f"[RECORD-CREATE-2] 입력값 오류: {e}")
+            raise HTTPException(status_code=400, detail=e.errors)
 
-        cursor.execute(insert_sql, values)
-        record_id = cursor.lastrowid
-        conn.commit()
+        result = await writer.execute(plan.insert_sql, plan.insert_params(values))
+        record_id = result.lastrowid
 
         logger.info(f"[RECORD-CREATE-3] ✓ 레코드 생성 완료: record_id={record_id}")
 
@@ -246,8 +572,9 @@ async def create_record(
             "redirect": f"/records/{board_id}/"
         }
 
+    except HTTPException:
+        raise
     except Exception as e:
-        conn.rollback()
         logger.error(f"[RECORD-CREATE-ERROR] 예외 발생: {type(e).__name__}: {str(e)}")
         import traceback
         logger.error(f"[RECORD-CREATE-ERROR] 스택 트레이스:\n{traceback.format_exc()}")
@@ -256,10 +583,12 @@ async def create_record(
 
 @router.get("/api/{board_id}/{record_id}")
 async def get_record(
+    request: Request,
+    response: Response,
     board_id: int,
     record_id: int,
     user: User = Depends(get_current_user_from_cookie),
-    conn: sqlite3.Connection = Depends(get_db_connection)
+    db: AsyncDB = Depends(get_db)
 ):
     """기록 조회 (JSON)"""
     if not user:
@@ -267,27 +596,28 @@ async def get_record(
 
     logger.info(f"[RECORD-VIEW-1] board_id={board_id}, record_id={record_id} 조회 시작")
 
-    db_manager = DBManager(conn)
-    board_info = db_manager.get_board_info(board_id)
+    board = await AsyncDBManager(db).get_board(board_id)
+    board_info = board.info if board else None
 
     if not board_info:
         logger.error(f"[RECORD-VIEW-ERROR] 보드를 찾을 수 없음: board_id={board_id}")
         raise HTTPException(status_code=404, detail="Board not found")
 
+    etag = await board_etag(db, request, board_id)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+
     physical_table_name = board_info["physical_table_name"]
-    cursor = conn.cursor()
 
     try:
-        cursor.execute(f"SELECT * FROM {physical_table_name} WHERE id = ?", (record_id,))
-        row = cursor.fetchone()
+        record = await db.fetch_one(f"SELECT * FROM {physical_table_name} WHERE id = ?", (record_id,))
 
-        if not row:
+        if not record:
             logger.error(f"[RECORD-VIEW-ERROR] 레코드를 찾을 수 없음: record_id={record_id}")
             raise HTTPException(status_code=404, detail="Record not found")
-
-        record = dict(row)
         logger.info(f"[RECORD-VIEW-2] ✓ 레코드 조회 완료: record_id={record_id}")
 
+        set_etag(response, etag)
         return {
             "board_id": board_id,
             "board_name": board_info["name"],
@@ -306,7 +636,8 @@ async def update_record(
     board_id: int,
     record_id: int,
     form_data: dict,
-    conn: sqlite3.Connection = Depends(get_db_connection),
+    db: AsyncDB = Depends(get_db),
+    writer: DBWriter = Depends(get_writer),
     user: User = Depends(get_current_user_from_cookie)
 ):
     """기록 수정 (JSON)"""
@@ -316,31 +647,27 @@ async def update_record(
     logger.info(f"[RECORD-UPDATE-1] board_id={board_id}, record_id={record_id} 기록 수정 시작")
 
     try:
-        db_manager = DBManager(conn)
-        board_info = db_manager.get_board_info(board_id)
+        board = await AsyncDBManager(db).get_board(board_id)
+        board_info = board.info if board else None
 
         if not board_info:
             logger.error(f"[RECORD-UPDATE-ERROR] 보드를 찾을 수 없음: board_id={board_id}")
             raise HTTPException(status_code=404, detail="Board not found")
 
-        physical_table_name = board_info["physical_table_name"]
-        cursor = conn.cursor()
-
-        # id 제외하고 업데이트
-        update_fields = [f"{col} = ?" for col in form_data.keys() if col != "id"]
-        update_values = [form_data[col] for col in form_data.keys() if col != "id"]
-        update_values.append(record_id)
+        # 시스템 컬럼(id 등) 제외하고 업데이트 (고정 UPDATE 문 + CASE 플래그)
+        plan = get_write_plan(board)
+        try:
+            values = plan.coerce(form_data)
+        except WritePlanError as e:
+            logger.warning(f"[RECORD-UPDATE-2] 입력값 오류: {e}")
+            raise HTTPException(status_code=400, detail=e.errors)
 
-        if not update_fields:
+        if not values:
             logger.warning("[RECORD-UPDATE-2] 업데이트할 필드가 없습니다")
             # HTML 리다이렉트 경로 수정
             return {"success": True, "record_id": record_id, "redirect": f"/records/{board_id}/view/{record_id}"}
 
-        update_sql = f"UPDATE {physical_table_name} SET {','.join(update_fields)} WHERE id = ?"
-        logger.info(f"[RECORD-UPDATE-2] SQL 실행: {update_sql}")
-
-        cursor.execute(update_sql, update_values)
-        conn.commit()
+        await writer.execute(plan.update_sql, plan.update_params(values, record_id))
 
         logger.info(f"[RECORD-UPDATE-3] ✓ 기록 수정 완료: record_id={record_id}")
 
@@ -351,8 +678,9 @@ async def update_record(
             "redirect": f"/records/{board_id}/view/{record_id}"
         }
 
+    except HTTPException:
+        raise
     except Exception as e:
-        conn.rollback()
         logger.error(f"[RECORD-UPDATE-ERROR] 예외 발생: {type(e).__name__}: {str(e)}")
         import traceback
         logger.error(f"[RECORD-UPDATE-ERROR] 스택 트레이스:\n{traceback.format_exc()}")
@@ -364,7 +692,8 @@ async def delete_record(
     board_id: int,
     record_id: int,
     user: User = Depends(get_current_user_from_cookie),
-    conn: sqlite3.Connection = Depends(get_db_connection)
+    db: AsyncDB = Depends(get_db),
+    writer: DBWriter = Depends(get_writer)
 ):
     """기록 삭제 (JSON)"""
     if not user:
@@ -373,19 +702,17 @@ async def delete_record(
     logger.info(f"[RECORD-DELETE-1] board_id={board_id}, record_id={record_id} 기록 삭제 시작")
 
     try:
-        db_manager = DBManager(conn)
-        board_info = db_manager.get_board_info(board_id)
+        board = await AsyncDBManager(db).get_board(board_id)
+        board_info = board.info if board else None
 
         if not board_info:
             logger.error(f"[RECORD-DELETE-ERROR] 보드를 찾을 수 없음: board_id={board_id}")
             raise HTTPException(status_code=404, detail="Board not found")
 
         physical_table_name = board_info["physical_table_name"]
-        cursor = conn.cursor()
 
         # 레코드 삭제
-        cursor.execute(f"DELETE FROM {physical_table_name} WHERE id = ?", (record_id,))
-        conn.commit()
+        await writer.execute(f"DELETE FROM {physical_table_name} WHERE id = ?", (record_id,))
 
         logger.info(f"[RECORD-DELETE-2] ✓ 기록 삭제 완료: record_id={record_id}")
 
@@ -395,7 +722,8 @@ async def delete_record(
             "board_id": board_id
         }
 
+    except HTTPException:
+        raise
     except Exception as e:
-        conn.rollback()
         logger.error(f"[RECORD-DELETE-ERROR] 오류: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -0,0 +1,107 @@
+# search.py
+"""
+모듈 설명:
+    - 전체 보드 통합 검색
+주요 기능:
+    - GET /search (HTML), GET /search/api (JSON): search_index 단일 MATCH 쿼리로 보드 구분 없이 순위 검색
+    - POST /search/api/rebuild: 전체 재색인을 백그라운드 스레드에서 실행 (전용 커넥션)
+
+작성자: 김도영
+작성일: 2026-10-18
+버전: 1.0
+"""
+import asyncio
+
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.responses import HTMLResponse, RedirectResponse
+
+from app.core.logger import get_logger
+from app.core.deps import get_db, get_current_user_from_cookie
+from app.core.async_db import AsyncDB
+from app.core.db_pool import create_connection
+from app.schemas.user import User
+from app.utils.global_search import rebuild_job, search_global
+
+logger = get_logger(__name__)
+
+router = APIRouter(prefix="/search", tags=["search"])
+
+PAGE_SIZE = 20
+
+
+def _run_rebuild() -> None:
+    # 재색인은 오래 걸릴 수 있으므로 풀 커넥션 대신 전용 커넥션 사용
+    conn = create_connection()
+    try:
+        rebuild_job.run(conn)
+    finally:
+        conn.close()
+
+
+@router.get("", response_class=HTMLResponse)
+async def search_page(
+    request: Request,
+    q: str = "",
+    page: int = 1,
+    user: User = Depends(get_current_user_from_cookie),
+    db: AsyncDB = Depends(get_db)
+):
+    """통합 검색 (HTML)"""
+    if not user:
+        return RedirectResponse(url="/login", status_code=status.HTTP_302_FOUND)
+
+    page = max(1, page)
+    # 다음 페이지 존재 여부 확인을 위해 1건 더 조회
+    results = await db.run(search_global, q, PAGE_SIZE + 1, (page - 1) * PAGE_SIZE)
+    logger.info(f"[SEARCH] q={q!r}, page={page}, hits={len(results)}")
+
+    return request.app.state.templates.TemplateResponse(
+        "search.html",
+        {
+            "request": request,
+            "user": user,
+            "q": q,
+            "page": page,
+            "results": results[:PAGE_SIZE],
+            "has_next": len(results) > PAGE_SIZE
+        }
+    )
+
+
+@router.get("/api")
+async def search_api(
+    q: str = "",
+    limit: int = PAGE_SIZE,
+    offset: int = 0,
+    user: User = Depends(get_current_user_from_cookie),
+    db: AsyncDB = Depends(get_db)
+):
+    """통합 검색 (JSON)"""
+    if not user:
+        raise HTTPException(status_code=401, detail="Unauthorized")
+
+    limit = max(1, min(limit, 100))
+    results = await db.run(search_global, q, limit, max(0, offset))
+    return {"q": q, "results": results}
+
+
+@router.post("/api/rebuild", status_code=status.HTTP_202_ACCEPTED)
+async def rebuild_index(user: User = Depends(get_current_user_from_cookie)):
+    """통합 검색 색인 전체 재구성 (백그라운드)"""
+    if not user:
+        raise HTTPException(status_code=401, detail="Unauthorized")
+
+    if not rebuild_job.try_start():
+        raise HTTPException(status_code=409, detail="Rebuild already running")
+
+    logger.info("[SEARCH-REBUILD] 백그라운드 재색인 시작")
+    asyncio.get_running_loop().run_in_executor(None, _run_rebuild)
+    return {"started": True}
+
+
+@router.get("/api/rebuild")
+async def rebuild_status(user: User = Depends(get_current_user_from_cookie)):
+    """재색인 진행 상태"""
+    if not user:
+        raise HTTPException(status_code=401, detail="Unauthorized")
+    return rebuild_job.stats()
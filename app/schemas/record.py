@@ -0,0 +1,14 @@
+from pydantic import BaseModel, Field
+from typing import Any, Dict, List, Optional
+
+# --- Bulk Record API Schema ---
+
+class BulkTarget(BaseModel):
+    ids: Optional[List[int]] = Field(None, description="대상 레코드 id 목록")
+    filter: Optional[Dict[str, Any]] = Field(None, description="컬럼 동등 조건 (값이 list면 IN)")
+
+class BulkDeleteRequest(BulkTarget):
+    pass
+
+class BulkUpdateRequest(BulkTarget):
+    set: Dict[str, Any] = Field(..., description="수정할 컬럼과 값")
@@ -40,8 +40,12 @@ const wizardStep2 = {
                     enabled: document.getElementById('searchEnabled').checked,
                     mode: "simple",
                     simple_fields: simpleFields,
+                    fulltext: document.getElementById('searchFulltext').checked,
                     show_toggle: true
                 },
+                stats: {
+                    summary_date_column: document.getElementById('statsDateColumn').value || null
+                },
                 actions: {
                     show_edit: true,
                     show_delete: true,
@@ -141,6 +145,12 @@ document.addEventListener('DOMContentLoaded', () => {
                     checkbox.checked = searchFields.includes(checkbox.value);
                 });
             }
+            document.getElementById('searchFulltext').checked = !!listConfig.search.fulltext;
+        }
+
+        // [6] 집계 요약
+        if (listConfig.stats) {
+            document.getElementById('statsDateColumn').value = listConfig.stats.summary_date_column || '';
         }
 
         // 토글 상태 동기화
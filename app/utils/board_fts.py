@@ -0,0 +1,239 @@
+# board_fts.py
+"""
+모듈 설명:
+    - 보드별 FTS5 전문 검색 (선택 기능, list 메타데이터 search.fulltext = true)
+주요 기능:
+    - 물리 테이블의 string/text 컬럼을 담는 FTS5 shadow 테이블 ({table}_fts, rowid = 레코드 id)
+    - INSERT/UPDATE 트리거는 바뀐 레코드 id 를 search_pending 에 기록, DELETE 트리거는 색인 행 삭제
+      (트리거는 SQLite 내장 SQL 만 사용 → 앱 밖의 커넥션도 물리 테이블에 쓸 수 있음)
+    - 색인은 Python 에서 HTML 을 평문화해 기록 (index_records, global_search.sync_pending 이 호출)
+    - 기존 데이터는 id 구간 단위 batch로 재색인
+    - 순위(bm25) + snippet() 하이라이트 검색
+
+작성자: 김도영
+작성일: 2026-10-18
+버전: 1.0
+"""
+import html
+import sqlite3
+from typing import Any, Dict, List, Optional
+
+from app.core.board_registry import BoardEntry
+from app.core.logger import get_logger
+from app.utils.html_text import strip_html
+
+logger = get_logger(__name__)
+
+FTS_DATA_TYPES = ("string", "text")
+REBUILD_BATCH_SIZE = 500
+# 색인 대기 레코드 (board_id, record_id) - 트리거가 기록, sync_pending 이 소비
+PENDING_TABLE = "search_pending"
+
+# snippet() 하이라이트 구분자 (escape 후 <mark>로 치환)
+MARK_OPEN = "\x02"
+MARK_CLOSE = "\x03"
+
+
+def fts_table_name(table: str) -> str:
+    return f"{table}_fts"
+
+
+def _trigger_names(table: str) -> List[str]:
+    return [f"{table}_fts_ai", f"{table}_fts_au", f"{table}_fts_ad"]
+
+
+def fts_enabled(board: BoardEntry) -> bool:
+    search = (board.list_meta or {}).get("search") or {}
+    return bool(search.get("fulltext")) and search.get("enabled") is not False
+
+
+def fts_columns(board: BoardEntry) -> List[str]:
+    """FTS 대상 컬럼 (data_type 이 string/text 인 컬럼)"""
+    return [
+        col["name"] for col in board.columns
+        if col.get("name") and col.get("data_type") in FTS_DATA_TYPES
+    ]
+
+
+def _table_exists(conn: sqlite3.Connection, name: str) -> bool:
+    cursor = conn.cursor()
+    cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (name,))
+    return cursor.fetchone() is not None
+
+
+def _current_fts_columns(conn: sqlite3.Connection, table: str) -> Optional[List[str]]:
+    fts = fts_table_name(table)
+    if not _table_exists(conn, fts):
+        return None
+    cursor = conn.cursor()
+    cursor.execute(f"PRAGMA table_info({fts})")
+    return [row[1] for row in cursor.fetchall()]
+
+
+def pending_sql(board_id: int) -> str:
+    """트리거 본문: 새 / 수정된 레코드를 색인 대기열에 기록"""
+    return f"INSERT OR IGNORE INTO {PENDING_TABLE} (board_id, record_id) VALUES ({board_id}, new.id);"
+
+
+def _trigger_sql(board_id: int, table: str, columns: List[str]) -> Dict[str, str]:
+    """FTS 동기화 트리거 DDL (이름 → SQL)"""
+    fts = fts_table_name(table)
+    ai, au, ad = _trigger_names(table)
+    return {
+        ai: f"CREATE TRIGGER {ai} AFTER INSERT ON {table} BEGIN {pending_sql(board_id)} END",
+        au: f"CREATE TRIGGER {au} AFTER UPDATE OF {', '.join(columns)} ON {table} BEGIN {pending_sql(board_id)} END",
+        ad: f"CREATE TRIGGER {ad} AFTER DELETE ON {table} BEGIN DELETE FROM {fts} WHERE rowid = old.id; END",
+    }
+
+
+def _triggers_match(conn: sqlite3.Connection, board_id: int, table: str, columns: List[str]) -> bool:
+    expected = _trigger_sql(board_id, table, columns)
+    cursor = conn.cursor()
+    cursor.execute(
+        f"SELECT name, sql FROM sqlite_master WHERE type = 'trigger' AND name IN ({', '.join('?' * len(expected))})",
+        list(expected)
+    )
+    return {name: sql for name, sql in cursor.fetchall()} == expected
+
+
+def drop_fts(conn: sqlite3.Connection, table: str) -> None:
+    cursor = conn.cursor()
+    for name in _trigger_names(table):
+        cursor.execute(f"DROP TRIGGER IF EXISTS {name}")
+    cursor.execute(f"DROP TABLE IF EXISTS {fts_table_name(table)}")
+
+
+def create_fts(conn: sqlite3.Connection, board_id: int, table: str, columns: List[str]) -> None:
+    """FTS5 테이블 + 동기화 트리거 생성 (커밋은 호출자)"""
+    fts = fts_table_name(table)
+    cursor = conn.cursor()
+    # unicode61 + prefix 질의로 한국어 조사 붙은 어절도 검색 ("혈압" → "혈압을")
+    cursor.execute(
+        f"CREATE VIRTUAL TABLE {fts} USING fts5({', '.join(columns)}, tokenize = 'unicode61 remove_diacritics 2')"
+    )
+    for sql in _trigger_sql(board_id, table, columns).values():
+        cursor.execute(sql)
+
+
+def _write_rows(conn: sqlite3.Connection, fts: str, columns: List[str], rows: List[tuple]) -> None:
+    """(id, 값...) 행을 HTML 평문화 후 색인 (같은 rowid 는 REPLACE 로 덮어씀)"""
+    conn.executemany(
+        f"INSERT OR REPLACE INTO {fts} (rowid, {', '.join(columns)}) VALUES ({', '.join('?' * (len(columns) + 1))})",
+        [(row[0], *(strip_html(value) for value in row[1:])) for row in rows]
+    )
+
+
+def index_records(conn: sqlite3.Connection, table: str, record_ids: List[int]) -> None:
+    """레코드 id 들을 다시 색인 (없어진 레코드는 색인에서 삭제). FTS 가 꺼진 보드는 무시"""
+    columns = _current_fts_columns(conn, table)
+    if not columns or not record_ids:
+        return
+    fts = fts_table_name(table)
+    placeholders = ", ".join("?" * len(record_ids))
+    cursor = conn.cursor()
+    cursor.execute(f"SELECT id, {', '.join(columns)} FROM {table} WHERE id IN ({placeholders})", record_ids)
+    rows = cursor.fetchall()
+    found = {row[0] for row in rows}
+    missing = [record_id for record_id in record_ids if record_id not in found]
+    if missing:
+        cursor.execute(f"DELETE FROM {fts} WHERE rowid IN ({', '.join('?' * len(missing))})", missing)
+    _write_rows(conn, fts, columns, rows)
+
+
+def rebuild_fts(conn: sqlite3.Connection, board: BoardEntry, batch_size: int = REBUILD_BATCH_SIZE) -> int:
+    """기존 레코드 재색인 - id 구간별로 커밋해 writer를 오래 막지 않음. 색인한 행 수 반환"""
+    table = board.physical_table_name
+    fts = fts_table_name(table)
+    columns = _current_fts_columns(conn, table) or []
+
+    cursor = conn.cursor()
+    cursor.execute(f"DELETE FROM {fts}")
+    conn.commit()
+
+    last_id, indexed = 0, 0
+    while True:
+        cursor.execute(
+            f"SELECT id, {', '.join(columns)} FROM {table} WHERE id > ? ORDER BY id LIMIT ?",
+            (last_id, batch_size)
+        )
+        rows = cursor.fetchall()
+        if not rows:
+            break
+        # 재색인 도중 먼저 색인된 행은 REPLACE로 덮어씀
+        _write_rows(conn, fts, columns, rows)
+        conn.commit()
+        last_id, indexed = rows[-1][0], indexed + len(rows)
+
+    logger.info(f"[BOARD-FTS] rebuild: board_id={board.board_id}, rows={indexed}")
+    return indexed
+
+
+def reconcile_fts(conn: sqlite3.Connection, board: BoardEntry) -> Dict[str, Any]:
+    """메타데이터에 맞춰 FTS 테이블/트리거 생성·재생성·삭제"""
+    table = board.physical_table_name
+    if not _table_exists(conn, table):
+        return {"action": "none"}
+
+    columns = fts_columns(board) if fts_enabled(board) else []
+    current = _current_fts_columns(conn, table)
+
+    if not columns:
+        if current is None:
+            return {"action": "none"}
+        drop_fts(conn, table)
+        conn.commit()
+        logger.info(f"[BOARD-FTS] dropped: board_id={board.board_id}")
+        return {"action": "dropped"}
+
+    if current == columns and _triggers_match(conn, board.board_id, table, columns):
+        return {"action": "none"}
+
+    # 컬럼 구성이 바뀌었거나 (테이블 재생성으로) 트리거가 사라졌거나 이전 형식이면 새로 만든다
+    try:
+        drop_fts(conn, table)
+        create_fts(conn, board.board_id, table, columns)
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    rows = rebuild_fts(conn, board)
+    return {"action": "rebuilt", "rows": rows}
+
+
+def build_match_query(q: str) -> Optional[str]:
+    """사용자 입력 → FTS5 MATCH 식 (어절별 prefix 검색, AND 결합, 특수문자는 quote로 무력화)"""
+    terms = [term.replace('"', '""') for term in (q or "").split()]
+    if not terms:
+        return None
+    return " ".join(f'"{term}"*' for term in terms)
+
+
+def render_snippet(raw: Optional[str]) -> str:
+    """snippet()/highlight() 결과 → HTML escape 후 구분자를 <mark>로 치환"""
+    escaped = html.escape(raw or "")
+    return escaped.replace(MARK_OPEN, "<mark>").replace(MARK_CLOSE, "</mark>")
+
+
+def search_fts(
+    conn: sqlite3.Connection,
+    board: BoardEntry,
+    q: str,
+    limit: int = 20,
+    offset: int = 0,
+) -> List[Dict[str, Any]]:
+    """순위순 검색 결과 [{id, score, snippet}] (snippet은 HTML escape + <mark> 하이라이트)"""
+    match = build_match_query(q)
+    if match is None:
+        return []
+
+    fts = fts_table_name(board.physical_table_name)
+    cursor = conn.cursor()
+    cursor.execute(
+        f"SELECT rowid, bm25({fts}), snippet({fts}, -1, ?, ?, '…', 16) "
+        f"FROM {fts} WHERE {fts} MATCH ? ORDER BY rank LIMIT ? OFFSET ?",
+        (MARK_OPEN, MARK_CLOSE, match, limit, offset)
+    )
+    return [
+        {"id": rowid, "score": round(-score, 4), "snippet": render_snippet(snippet)}
+        for rowid, score, snippet in cursor.fetchall()
+    ]
@@ -0,0 +1,119 @@
+# board_indexes.py
+"""
+모듈 설명:
+    - 물리 테이블(table_N) 보조 인덱스 관리
+주요 기능:
+    - list 메타데이터에서 필요한 인덱스 도출 (default_sort 첫 컬럼, 동등/범위 필터 필드, 요약 테이블 날짜 컬럼)
+    - 규칙에 따라 이름 붙인 관리 인덱스(ix_{table}_auto_{column})만 생성/삭제 (reconcile)
+    - checker 화면용 인덱스 목록 + 목록 쿼리 EXPLAIN QUERY PLAN
+
+작성자: 김도영
+작성일: 2026-10-18
+버전: 1.0
+"""
+import sqlite3
+from typing import Any, Dict, List
+
+from app.core.board_registry import BoardEntry
+from app.core.logger import get_logger
+from app.utils.record_query import allowed_columns, default_sort, list_query_sql, resolve_list_query
+from app.utils.record_stats import summary_date_column
+
+logger = get_logger(__name__)
+
+# 이 search_type 들은 =, IN, BETWEEN 조건이라 인덱스를 탈 수 있음 (text contains 는 제외)
+INDEXABLE_SEARCH_TYPES = ("select", "boolean", "date_range", "range")
+
+
+def managed_index_prefix(table: str) -> str:
+    return f"ix_{table}_auto_"
+
+
+def managed_index_name(table: str, column: str) -> str:
+    return f"{managed_index_prefix(table)}{column}"
+
+
+def desired_index_columns(board: BoardEntry) -> List[str]:
+    """list 메타데이터 기준으로 인덱스가 필요한 컬럼 (순서 유지, 중복 제거)"""
+    list_meta = board.list_meta or {}
+    allowed = allowed_columns(board) - {"id"}
+    columns: List[str] = []
+
+    sort_column = default_sort(board)[0][0]
+    if sort_column in allowed:
+        columns.append(sort_column)
+
+    search = list_meta.get("search") or {}
+    if search.get("enabled") is not False:
+        for field in search.get("advanced_fields") or ():
+            if not isinstance(field, dict):
+                continue
+            if field.get("search_type") in INDEXABLE_SEARCH_TYPES or field.get("operator") == "equals":
+                name = field.get("name")
+                if name in allowed and name not in columns:
+                    columns.append(name)
+
+    # 요약 테이블 트리거가 하루 구간을 다시 집계할 때 사용
+    stats_column = summary_date_column(board)
+    if stats_column in allowed and stats_column not in columns:
+        columns.append(stats_column)
+    return columns
+
+
+def list_managed_indexes(conn: sqlite3.Connection, table: str) -> List[Dict[str, Any]]:
+    """table에 걸린 관리 인덱스 목록 [{name, column, sql}]"""
+    cursor = conn.cursor()
+    cursor.execute(
+        "SELECT name, sql FROM sqlite_master WHERE type = 'index' AND tbl_name = ? ORDER BY name",
+        (table,)
+    )
+    prefix = managed_index_prefix(table)
+    return [
+        {"name": name, "column": name[len(prefix):], "sql": sql}
+        for name, sql in cursor.fetchall()
+        if name.startswith(prefix)
+    ]
+
+
+def reconcile_indexes(conn: sqlite3.Connection, board: BoardEntry) -> Dict[str, List[str]]:
+    """관리 인덱스를 메타데이터와 일치시킴 (필요한 것 생성, 불필요한 것 삭제)"""
+    table = board.physical_table_name
+    cursor = conn.cursor()
+    cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (table,))
+    if cursor.fetchone() is None:
+        # 위저드 step1 진행 중 (물리 테이블 생성 전)
+        return {"created": [], "dropped": []}
+
+    existing = {idx["column"]: idx["name"] for idx in list_managed_indexes(conn, table)}
+    desired = desired_index_columns(board)
+
+    created, dropped = [], []
+    try:
+        for column, name in existing.items():
+            if column not in desired:
+                cursor.execute(f"DROP INDEX IF EXISTS {name}")
+                dropped.append(name)
+        for column in desired:
+            if column not in existing:
+                name = managed_index_name(table, column)
+                cursor.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {table} ({column})")
+                created.append(name)
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+
+    if created or dropped:
+        logger.info(f"[BOARD-INDEX] board_id={board.board_id} created={created} dropped={dropped}")
+    return {"created": created, "dropped": dropped}
+
+
+def explain_list_query(conn: sqlite3.Connection, board: BoardEntry) -> Dict[str, Any]:
+    """기본 목록 쿼리(1페이지)와 그 EXPLAIN QUERY PLAN"""
+    sql, params = list_query_sql(board, resolve_list_query(board))
+    cursor = conn.cursor()
+    cursor.execute(f"EXPLAIN QUERY PLAN {sql}", params)
+    return {
+        "sql": sql,
+        "plan": [row[-1] for row in cursor.fetchall()],
+    }
@@ -0,0 +1,144 @@
+# board_stats.py
+"""
+모듈 설명:
+    - 보드별 레코드 카운터 (board_stats 테이블)
+주요 기능:
+    - 물리 테이블 생성 시 INSERT/UPDATE/DELETE 트리거 설치 → 행 수, 마지막 등록/수정 시각, 데이터 버전 유지
+    - 데이터 버전은 meta_data / boards 트리거(DDL)로도 증가 → ETag 계산에 사용 (app.utils.conditional)
+    - 건수 조회는 board_stats 1행 조회 (COUNT(*) 전체 스캔 없음)
+    - 앱 시작 시 트리거가 없는 기존 보드 backfill
+
+작성자: 김도영
+작성일: 2026-10-18
+버전: 1.0
+"""
+import sqlite3
+from typing import Any, Dict, List, Optional
+
+from app.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+# 새 board_stats 행의 데이터 버전 시작값 (epoch ms) - 같은 id 로 보드를 다시 만들어도 이전 ETag 와 겹치지 않도록
+INITIAL_VERSION_SQL = "CAST((julianday('now') - 2440587.5) * 86400000 AS INTEGER)"
+
+
+def _trigger_names(table: str) -> List[str]:
+    return [f"{table}_bs_ai", f"{table}_bs_au", f"{table}_bs_ad"]
+
+
+def _trigger_sql(board_id: int, table: str) -> List[str]:
+    ai, au, ad = _trigger_names(table)
+    return [
+        f"CREATE TRIGGER {ai} AFTER INSERT ON {table} BEGIN "
+        f"UPDATE board_stats SET row_count = row_count + 1, last_insert_at = CURRENT_TIMESTAMP, "
+        f"data_version = data_version + 1 WHERE board_id = {board_id}; END",
+        f"CREATE TRIGGER {au} AFTER UPDATE ON {table} BEGIN "
+        f"UPDATE board_stats SET last_update_at = CURRENT_TIMESTAMP, "
+        f"data_version = data_version + 1 WHERE board_id = {board_id}; END",
+        f"CREATE TRIGGER {ad} AFTER DELETE ON {table} BEGIN "
+        f"UPDATE board_stats SET row_count = row_count - 1, "
+        f"data_version = data_version + 1 WHERE board_id = {board_id}; END",
+    ]
+
+
+def _triggers_current(conn: sqlite3.Connection, board_id: int, table: str) -> bool:
+    """설치된 트리거가 현재 정의와 같은지 (이전 버전 트리거는 다시 설치)"""
+    names = _trigger_names(table)
+    cursor = conn.cursor()
+    cursor.execute(
+        f"SELECT sql FROM sqlite_master WHERE type = 'trigger' AND name IN ({', '.join('?' * len(names))}) "
+        f"ORDER BY name",
+        names
+    )
+    return [row[0] for row in cursor.fetchall()] == sorted(_trigger_sql(board_id, table))
+
+
+def _ensure_schema(conn: sqlite3.Connection) -> None:
+    """이전 DDL 로 만든 board_stats 에 data_version 컬럼 추가"""
+    cursor = conn.cursor()
+    cursor.execute("PRAGMA table_info(board_stats)")
+    if "data_version" not in [row[1] for row in cursor.fetchall()]:
+        cursor.execute("ALTER TABLE board_stats ADD COLUMN data_version integer not null default 0")
+
+
+def install_counters(conn: sqlite3.Connection, board_id: int, table: str) -> None:
+    """카운터 트리거 설치 + board_stats 행을 현재 테이블 상태로 초기화 (커밋은 호출자)
+
+    물리 테이블을 (재)생성한 직후, 같은 트랜잭션 안에서 호출한다.
+    """
+    board_id = int(board_id)
+    cursor = conn.cursor()
+    for name in _trigger_names(table):
+        cursor.execute(f"DROP TRIGGER IF EXISTS {name}")
+    for sql in _trigger_sql(board_id, table):
+        cursor.execute(sql)
+    # 기존 행이 있으면 데이터 버전은 이어서 증가 (이전 ETag 무효화)
+    cursor.execute(
+        f"""
+        INSERT INTO board_stats (board_id, row_count, last_insert_at, last_update_at, data_version)
+        SELECT ?, COUNT(*), MAX(created_at), MAX(CASE WHEN updated_at > created_at THEN updated_at END),
+               {INITIAL_VERSION_SQL}
+        FROM {table} WHERE true
+        ON CONFLICT(board_id) DO UPDATE SET
+            row_count = excluded.row_count,
+            last_insert_at = excluded.last_insert_at,
+            last_update_at = excluded.last_update_at,
+            data_version = data_version + 1
+        """,
+        (board_id,)
+    )
+
+
+def remove_counters(conn: sqlite3.Connection, board_id: int) -> None:
+    """board_stats 행 삭제 (트리거는 물리 테이블 DROP 시 함께 삭제됨, 커밋은 호출자)"""
+    conn.execute("DELETE FROM board_stats WHERE board_id = ?", (board_id,))
+
+
+def backfill_counters(conn: sqlite3.Connection) -> List[int]:
+    """트리거 또는 board_stats 행이 없는 기존 보드에 카운터 설치. 처리한 board_id 목록"""
+    _ensure_schema(conn)
+    cursor = conn.cursor()
+    cursor.execute(
+        """
+        SELECT b.id, b.physical_table_name, s.board_id
+        FROM boards b LEFT JOIN board_stats s ON s.board_id = b.id
+        WHERE EXISTS (SELECT 1 FROM sqlite_master m WHERE m.type = 'table' AND m.name = b.physical_table_name)
+        """
+    )
+    installed = []
+    for board_id, table, stats_row in cursor.fetchall():
+        if stats_row is not None and _triggers_current(conn, board_id, table):
+            continue
+        install_counters(conn, board_id, table)
+        installed.append(board_id)
+
+    # 삭제된 보드의 잔여 행 정리
+    cursor.execute("DELETE FROM board_stats WHERE board_id NOT IN (SELECT id FROM boards)")
+    conn.commit()
+    if installed:
+        logger.info(f"[BOARD-STATS] backfill: boards={installed}")
+    return installed
+
+
+def get_board_stats(conn: sqlite3.Connection, board_id: int) -> Optional[Dict[str, Any]]:
+    cursor = conn.cursor()
+    cursor.execute(
+        "SELECT row_count, last_insert_at, last_update_at, data_version FROM board_stats WHERE board_id = ?",
+        (board_id,)
+    )
+    row = cursor.fetchone()
+    if row is None:
+        return None
+    return {"row_count": row[0], "last_insert_at": row[1], "last_update_at": row[2], "data_version": row[3]}
+
+
+def record_count(conn: sqlite3.Connection, board_id: int, table: str) -> int:
+    """보드 레코드 수 (board_stats O(1) 조회, 카운터가 없으면 COUNT(*))"""
+    cursor = conn.cursor()
+    cursor.execute("SELECT row_count FROM board_stats WHERE board_id = ?", (board_id,))
+    row = cursor.fetchone()
+    if row is not None:
+        return row[0]
+    cursor.execute(f"SELECT COUNT(*) FROM {table}")
+    return cursor.fetchone()[0]
@@ -0,0 +1,131 @@
+# coerce.py
+"""
+모듈 설명:
+    - data_type 별 값 변환 (외부 입력 → 물리 테이블 저장값)
+주요 기능:
+    - string/text: 문자열, integer: 정수 (천 단위 쉼표 허용), real: 유한한 실수 (nan / inf 거부)
+    - boolean: 1/0 (true/false, yes/no, y/n, 예/아니오, o/x ...)
+    - ymd: YYYY-MM-DD, datetime: YYYY-MM-DD HH:MM:SS (여러 입력 형식 허용)
+    - 빈 값은 None, 변환 실패 시 ValueError
+
+작성자: 김도영
+작성일: 2026-10-18
+버전: 1.0
+"""
+import math
+from datetime import date, datetime
+from typing import Any, Callable, Dict
+
+from app.constants.data_type import FieldDataType
+
+_TRUE_VALUES = {"1", "true", "t", "yes", "y", "on", "예", "o", "참"}
+_FALSE_VALUES = {"0", "false", "f", "no", "n", "off", "아니오", "x", "거짓"}
+
+_YMD_FORMATS = ("%Y-%m-%d", "%Y/%m/%d", "%Y.%m.%d", "%Y%m%d")
+_DATETIME_FORMATS = (
+    "%Y-%m-%d %H:%M:%S", "%Y-%m-%dT%H:%M:%S", "%Y-%m-%d %H:%M", "%Y-%m-%dT%H:%M",
+    "%Y/%m/%d %H:%M:%S", "%Y/%m/%d %H:%M", "%Y.%m.%d %H:%M:%S", "%Y.%m.%d %H:%M",
+)
+
+
+def _to_str(value: Any) -> str:
+    return value if isinstance(value, str) else str(value)
+
+
+def _to_number(value: Any, text: str) -> float:
+    """text → 유한한 실수 (nan / inf 거부)"""
+    try:
+        number = float(text)
+    except (ValueError, OverflowError):
+        raise ValueError(f"숫자가 아닙니다: {value}") from None
+    if not math.isfinite(number):
+        raise ValueError(f"숫자가 아닙니다: {value}")
+    return number
+
+
+def _to_int(value: Any) -> int:
+    if isinstance(value, bool):
+        return int(value)
+    if isinstance(value, int):
+        return value
+    if isinstance(value, float):
+        if not value.is_integer():
+            raise ValueError(f"정수가 아닙니다: {value}")
+        return int(value)
+    text = str(value).strip().replace(",", "")
+    try:
+        return int(text)
+    except ValueError:
+        number = _to_number(value, text)
+        if not number.is_integer():
+            raise ValueError(f"정수가 아닙니다: {value}")
+        return int(number)
+
+
+def _to_real(value: Any) -> float:
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return _to_number(value, value)
+    return _to_number(value, str(value).strip().replace(",", ""))
+
+
+def _to_bool(value: Any) -> int:
+    if isinstance(value, bool):
+        return int(value)
+    if isinstance(value, (int, float)):
+        return 1 if value else 0
+    text = str(value).strip().lower()
+    if text in _TRUE_VALUES:
+        return 1
+    if text in _FALSE_VALUES:
+        return 0
+    raise ValueError(f"참/거짓 값이 아닙니다: {value}")
+
+
+def _parse(value: Any, formats, kind: str) -> datetime:
+    text = str(value).strip()
+    for fmt in formats:
+        try:
+            return datetime.strptime(text, fmt)
+        except ValueError:
+            continue
+    raise ValueError(f"{kind} 형식이 아닙니다: {value}")
+
+
+def _to_ymd(value: Any) -> str:
+    if isinstance(value, (date, datetime)):
+        return value.strftime("%Y-%m-%d")
+    return _parse(value, _YMD_FORMATS, "날짜").strftime("%Y-%m-%d")
+
+
+def _to_datetime(value: Any) -> str:
+    if isinstance(value, datetime):
+        return value.strftime("%Y-%m-%d %H:%M:%S")
+    try:
+        parsed = _parse(value, _DATETIME_FORMATS, "날짜시간")
+    except ValueError:
+        # 날짜만 있으면 자정으로
+        parsed = _parse(value, _YMD_FORMATS, "날짜시간")
+    return parsed.strftime("%Y-%m-%d %H:%M:%S")
+
+
+COERCERS: Dict[str, Callable[[Any], Any]] = {
+    FieldDataType.STRING.value: _to_str,
+    FieldDataType.TEXT.value: _to_str,
+    FieldDataType.INTEGER.value: _to_int,
+    FieldDataType.REAL.value: _to_real,
+    FieldDataType.BOOLEAN.value: _to_bool,
+    FieldDataType.YMD.value: _to_ymd,
+    FieldDataType.DATETIME.value: _to_datetime,
+}
+
+
+def get_coercer(data_type: str) -> Callable[[Any], Any]:
+    """data_type 변환 함수 (빈 값 → None 처리 포함, 알 수 없는 타입은 문자열)"""
+    convert = COERCERS.get(data_type, _to_str)
+
+    def coerce(value: Any) -> Any:
+        if value is None or (isinstance(value, str) and value.strip() == ""):
+            return None
+        return convert(value)
+
+    return coerce
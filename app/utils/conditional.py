@@ -0,0 +1,84 @@
+# conditional.py
+"""
+모듈 설명:
+    - 보드 데이터 버전 기반 조건부 GET (ETag / If-None-Match → 304)
+주요 기능:
+    - board_stats.data_version (물리 테이블 / meta_data / boards 쓰기마다 트리거로 증가) 로 weak ETag 생성
+    - ETag = 보드 id + 데이터 버전 + (경로, 쿼리 문자열, 앱 버전, 사용자 등) 해시
+    - If-None-Match 가 일치하면 레코드 조회 / 템플릿 렌더링 전에 304 반환
+    - If-Modified-Since 비교 (첨부 파일 다운로드)
+
+작성자: 김도영
+작성일: 2026-10-18
+버전: 1.0
+"""
+import hashlib
+from email.utils import parsedate_to_datetime
+from typing import Any, Optional
+
+from fastapi import Request, Response
+
+from app.core.async_db import AsyncDB
+from app.core.config import settings
+
+# 브라우저가 캐시하되 매번 재검증하도록 (로그인 사용자 전용 데이터)
+CACHE_CONTROL = "private, no-cache"
+
+
+def make_etag(board_id: int, version: int, *parts: Any) -> str:
+    digest = hashlib.sha1(
+        "\x1f".join(str(part) for part in (settings.VERSION,) + parts).encode("utf-8")
+    ).hexdigest()[:16]
+    return f'W/"{board_id}.{version}.{digest}"'
+
+
+async def board_version(db: AsyncDB, board_id: int) -> Optional[int]:
+    """보드 데이터 버전 (카운터가 없는 보드는 None)"""
+    return await db.fetch_value(
+        "SELECT data_version FROM board_stats WHERE board_id = ?", (board_id,)
+    )
+
+
+def request_etag(request: Request, board_id: int, version: Optional[int], *parts: Any) -> Optional[str]:
+    """요청(경로 + 쿼리 문자열)과 보드 데이터 버전으로 ETag 계산"""
+    if version is None:
+        return None
+    return make_etag(board_id, version, request.url.path, request.url.query, *parts)
+
+
+async def board_etag(db: AsyncDB, request: Request, board_id: int, *parts: Any) -> Optional[str]:
+    return request_etag(request, board_id, await board_version(db, board_id), *parts)
+
+
+def etag_matches(request: Request, etag: Optional[str]) -> bool:
+    """If-None-Match 비교 (weak 비교: W/ 접두어 무시, '*' 허용)"""
+    header = request.headers.get("if-none-match")
+    if not etag or not header:
+        return False
+    if header.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque for tag in header.split(","))
+
+
+def not_modified_since(request: Request, mtime: float) -> bool:
+    """If-Modified-Since 이후 변경이 없는지 (초 단위 비교, If-None-Match 가 있으면 무시)"""
+    header = request.headers.get("if-modified-since")
+    if not header or "if-none-match" in request.headers:
+        return False
+    try:
+        since = parsedate_to_datetime(header)
+    except (TypeError, ValueError):
+        return False
+    return int(mtime) <= since.timestamp()
+
+
+def set_etag(response: Response, etag: Optional[str]) -> Response:
+    if etag:
+        response.headers["ETag"] = etag
+        response.headers["Cache-Control"] = CACHE_CONTROL
+    return response
+
+
+def not_modified(etag: str) -> Response:
+    return Response(status_code=304, headers={"ETag": etag, "Cache-Control": CACHE_CONTROL})
@@ -2,10 +2,19 @@
 import sqlite3
 import json
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, TYPE_CHECKING
 
 from app.core.logger import get_logger
+from app.core.board_registry import BoardEntry, board_registry
 from app.schemas.board import BoardCreate, BoardResponse
+from app.utils.board_indexes import reconcile_indexes
+from app.utils.board_fts import reconcile_fts
+from app.utils.global_search import reconcile_global_search
+from app.utils.record_stats import reconcile_summary
+from app.utils.board_stats import install_counters
+
+if TYPE_CHECKING:
+    from app.core.async_db import AsyncDB
 
 logger = get_logger(__name__)
 
@@ -71,6 +80,7 @@ class DBManager:
 
             logger.info(f"🛠 Executing DDL: {create_table_sql}")
             self.cursor.execute(create_table_sql)
+            install_counters(self.conn, board_id, board_data.board.physical_table_name)
 
             # 5. 테이블 검증 로깅
             cursor = self.conn.cursor()
@@ -82,6 +92,9 @@ class DBManager:
                 logger.info(f"   - {col[1]}: {col[2]} (notnull={col[3]}, pk={col[5]})")
 
             self.conn.commit()
+            board_registry.invalidate(board_id)
+            # 물리 테이블 생성 후 → 검색 트리거 / 색인 설치
+            self.sync_table_objects(board_id)
 
             logger.info(f"✅ Board created: {board_data.board.name} (ID: {board_id})")
             return BoardResponse(board_id=board_id, message="success")
@@ -153,12 +166,38 @@ class DBManager:
                 )
 
             self.conn.commit()
+            board_registry.invalidate(board_id)
             logger.info(f"✅ Metadata saved: board_id={board_id}, name={name}")
         except Exception as e:
             self.conn.rollback()
             logger.error(f"❌ Error saving metadata: {e}")
             raise e
 
+        if name in ("table", "list"):
+            self.sync_table_objects(board_id)
+
+    def sync_table_objects(self, board_id: int) -> None:
+        """메타데이터 기준으로 물리 테이블의 관리 인덱스 / FTS 테이블 / 통합 검색 트리거 / 집계 요약 테이블 reconcile (실패해도 메타데이터 저장은 유지)"""
+        board = board_registry.get(self.conn, board_id)
+        if not board:
+            return
+        try:
+            reconcile_indexes(self.conn, board)
+        except Exception as e:
+            logger.warning(f"⚠️ Index reconcile failed: board_id={board_id}, {e}")
+        try:
+            reconcile_fts(self.conn, board)
+        except Exception as e:
+            logger.warning(f"⚠️ FTS reconcile failed: board_id={board_id}, {e}")
+        try:
+            reconcile_global_search(self.conn, board)
+        except Exception as e:
+            logger.warning(f"⚠️ Global search reconcile failed: board_id={board_id}, {e}")
+        try:
+            reconcile_summary(self.conn, board)
+        except Exception as e:
+            logger.warning(f"⚠️ Stats summary reconcile failed: board_id={board_id}, {e}")
+
     def get_metadata(self, board_id: int, name: str) -> Optional[Dict[str, Any]]:
         """메타데이터 조회"""
         self.cursor.execute(
@@ -173,3 +212,35 @@ class DBManager:
             return json.loads(row[0])
         except json.JSONDecodeError:
             raise ValueError("Invalid JSON in metadata")
+
+
+class AsyncDBManager:
+    """
+    DBManager의 비동기 버전
+    - 각 메서드는 AsyncDB 워커 스레드에서 DBManager를 실행한다 (이벤트 루프 블로킹 방지)
+    """
+
+    def __init__(self, db: "AsyncDB"):
+        self.db = db
+
+    async def get_board(self, board_id: int) -> Optional[BoardEntry]:
+        """보드 정보 + 메타데이터 (BoardRegistry 캐시, 캐시 hit이면 DB 접근 없음)"""
+        entry = board_registry.peek(board_id)
+        if entry is not None:
+            return entry
+        return await self.db.run(board_registry.get, board_id)
+
+    async def get_board_info(self, board_id: int) -> Optional[Dict[str, Any]]:
+        return await self.db.run(lambda conn: DBManager(conn).get_board_info(board_id))
+
+    async def get_board_columns(self, board_id: int) -> Optional[Dict[str, Any]]:
+        return await self.db.run(lambda conn: DBManager(conn).get_board_columns(board_id))
+
+    async def get_metadata(self, board_id: int, name: str) -> Optional[Dict[str, Any]]:
+        return await self.db.run(lambda conn: DBManager(conn).get_metadata(board_id, name))
+
+    async def save_metadata(self, board_id: int, name: str, meta: Dict[str, Any]) -> None:
+        await self.db.run(lambda conn: DBManager(conn).save_metadata(board_id, name, meta))
+
+    async def create_board(self, board_data: BoardCreate) -> BoardResponse:
+        return await self.db.run(lambda conn: DBManager(conn).create_board(board_data))
@@ -0,0 +1,278 @@
+# file_gc.py
+"""
+모듈 설명:
+    - 고아 첨부 파일 정리 (GC)
+주요 기능:
+    - file_match: 없는 보드 / 없는 레코드를 가리키는 행 삭제
+    - files: file_match 가 하나도 없는 행 삭제 (opt-in: include_unmatched / FILE_GC_UNMATCHED, 유예 시간보다 오래된 것만)
+    - FILES_DIR: 가리키는 files 행이 없는(참조 수 0) 물리 파일, 원본이 없는 썸네일 / 실패 표시, 오래된 임시 파일(.part) 삭제
+    - 작은 배치마다 BEGIN IMMEDIATE 트랜잭션 → 업로드(writer) 와 직렬화, 서버 실행 중에도 사용 가능
+    - 해제한 바이트 수 보고, dry_run 지원
+    - 주기 실행(FILE_GC_INTERVAL_HOURS) + CLI (tools/file_gc.py)
+
+작성자: 김도영
+작성일: 2026-10-18
+버전: 1.0
+"""
+import asyncio
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+from app.core.config import settings
+from app.core.db_pool import create_connection
+from app.core.logger import get_logger
+from app.utils.file_store import (
+    DERIVATIVE_SUFFIX, DERIVATIVE_VARIANTS, FAILURE_MARKER_SUFFIX, TEMP_SUFFIX, unlink_if_unreferenced,
+)
+
+logger = get_logger(__name__)
+
+
+def _batches(items: List[Any], size: int) -> Iterator[List[Any]]:
+    for start in range(0, len(items), max(1, size)):
+        yield items[start:start + max(1, size)]
+
+
+def _write_batch(conn: sqlite3.Connection, fn, *args) -> Any:
+    """fn 을 짧은 쓰기 트랜잭션 1개로 실행 (쓰기 잠금을 먼저 잡음)"""
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        result = fn(conn, *args)
+        conn.commit()
+        return result
+    except Exception:
+        conn.rollback()
+        raise
+
+
+def orphan_match_ids(conn: sqlite3.Connection) -> List[int]:
+    """없는 보드 / 없는 레코드를 가리키는 file_match id"""
+    cursor = conn.cursor()
+    cursor.execute("SELECT id FROM file_match WHERE board_id NOT IN (SELECT id FROM boards)")
+    ids = [row[0] for row in cursor.fetchall()]
+
+    cursor.execute(
+        """
+        SELECT b.id, b.physical_table_name, m.name
+        FROM boards b LEFT JOIN sqlite_master m ON m.type = 'table' AND m.name = b.physical_table_name
+        WHERE b.id IN (SELECT DISTINCT board_id FROM file_match)
+        """
+    )
+    for board_id, table, existing in cursor.fetchall():
+        if existing is None:
+            # 물리 테이블이 없는 보드 - 모든 연결이 고아
+            cursor.execute("SELECT id FROM file_match WHERE board_id = ?", (board_id,))
+        else:
+            cursor.execute(
+                f"SELECT fm.id FROM file_match fm WHERE fm.board_id = ? "
+                f"AND NOT EXISTS (SELECT 1 FROM {table} t WHERE t.id = fm.table_id)",
+                (board_id,)
+            )
+        ids.extend(row[0] for row in cursor.fetchall())
+    return sorted(ids)
+
+
+def unmatched_file_ids(conn: sqlite3.Connection, grace_seconds: float) -> List[int]:
+    """file_match 가 없고 유예 시간이 지난 files id (마지막 업로드 시각 = updated_at 기준)"""
+    cursor = conn.cursor()
+    cursor.execute(
+        """
+        SELECT f.id FROM files f
+        WHERE NOT EXISTS (SELECT 1 FROM file_match m WHERE m.file_id = f.id)
+          AND f.updated_at <= datetime('now', ?)
+        ORDER BY f.id
+        """,
+        (f"-{int(grace_seconds)} seconds",)
+    )
+    return [row[0] for row in cursor.fetchall()]
+
+
+def _delete_matches(conn: sqlite3.Connection, ids: List[int]) -> int:
+    cursor = conn.cursor()
+    cursor.execute(f"DELETE FROM file_match WHERE id IN ({', '.join('?' * len(ids))})", ids)
+    return cursor.rowcount
+
+
+def _delete_files(conn: sqlite3.Connection, ids: List[int]) -> int:
+    cursor = conn.cursor()
+    # 조회 이후 연결된 파일은 남김
+    cursor.execute(
+        f"DELETE FROM files WHERE id IN ({', '.join('?' * len(ids))}) "
+        f"AND NOT EXISTS (SELECT 1 FROM file_match m WHERE m.file_id = files.id)",
+        ids
+    )
+    return cursor.rowcount
+
+
+def _original_of(path: Path) -> Optional[Path]:
+    """파생 파일(<원본>.<variant>.jpg / <원본>.thumb-failed)이면 원본 경로"""
+    suffixes = [f".{variant}{DERIVATIVE_SUFFIX}" for variant in DERIVATIVE_VARIANTS] + [FAILURE_MARKER_SUFFIX]
+    for suffix in suffixes:
+        if path.name.endswith(suffix):
+            return path.with_name(path.name[:-len(suffix)])
+    return None
+
+
+def scan_physical(conn: sqlite3.Connection, files_dir: Path, grace_seconds: float) -> Dict[str, List[Path]]:
+    """DB 행이 없는 물리 파일 후보 (유예 시간 이내 파일 제외)
+
+    반환: {"blobs": 원본 후보, "derived": 원본 없는 썸네일, "temp": 오래된 임시 파일}
+    """
+    cursor = conn.cursor()
+    cursor.execute("SELECT base_folder, physical_name FROM files")
+    referenced: Set[Tuple[str, str]] = {(row[0], row[1]) for row in cursor.fetchall()}
+    cutoff = time.time() - grace_seconds
+    found: Dict[str, List[Path]] = {"blobs": [], "derived": [], "temp": []}
+    if not files_dir.is_dir():
+        return found
+
+    for path in files_dir.rglob("*"):
+        try:
+            if not path.is_file() or path.stat().st_mtime > cutoff:
+                continue
+        except FileNotFoundError:
+            continue
+        if path.name.endswith(TEMP_SUFFIX):
+            found["temp"].append(path)
+            continue
+        original = _original_of(path)
+        if original is not None:
+            # 원본이 남아 있으면 원본과 함께 처리
+            if not original.exists():
+                found["derived"].append(path)
+            continue
+        relative = path.relative_to(files_dir)
+        key = (relative.parent.as_posix(), relative.name)
+        if key not in referenced:
+            found["blobs"].append(path)
+    return found
+
+
+def collect_garbage(conn: sqlite3.Connection, files_dir: Optional[Path] = None, grace_seconds: Optional[float] = None,
+                    batch_size: Optional[int] = None, dry_run: bool = False,
+                    include_unmatched: Optional[bool] = None) -> Dict[str, Any]:
+    """고아 file_match → (include_unmatched 이면) 연결 없는 files 행 → 물리 파일 순으로 정리. 결과 통계
+
+    물리 파일은 가리키는 files 행이 하나도 없을 때만 삭제한다 (같은 내용을 공유하는 다른 업로드 보호).
+    """
+    files_dir = Path(files_dir or settings.FILES_DIR)
+    include_unmatched = settings.FILE_GC_UNMATCHED if include_unmatched is None else include_unmatched
+    grace_seconds = settings.FILE_GC_GRACE_HOURS * 3600 if grace_seconds is None else grace_seconds
+    batch_size = batch_size or settings.FILE_GC_BATCH_SIZE
+    started = time.perf_counter()
+    result = {
+        "dry_run": dry_run, "include_unmatched": include_unmatched, "matches": 0, "files": 0, "blobs": 0, "derived": 0, "temp": 0,
+        "bytes_freed": 0, "batches": 0,
+    }
+
+    match_ids = orphan_match_ids(conn)
+    if dry_run:
+        result["matches"] = len(match_ids)
+    else:
+        for batch in _batches(match_ids, batch_size):
+            result["matches"] += _write_batch(conn, _delete_matches, batch)
+            result["batches"] += 1
+
+    file_ids = unmatched_file_ids(conn, grace_seconds) if include_unmatched else []
+    if dry_run:
+        result["files"] = len(file_ids)
+    else:
+        for batch in _batches(file_ids, batch_size):
+            result["files"] += _write_batch(conn, _delete_files, batch)
+            result["batches"] += 1
+
+    # files 행 삭제 후 스캔 → 방금 참조가 끊긴 원본도 포함
+    found = scan_physical(conn, files_dir, grace_seconds)
+    for path in found["derived"] + found["temp"]:
+        kind = "temp" if path.name.endswith(TEMP_SUFFIX) else "derived"
+        try:
+            size = path.stat().st_size
+            if not dry_run:
+                path.unlink()
+        except FileNotFoundError:
+            continue
+        result[kind] += 1
+        result["bytes_freed"] += size
+
+    if dry_run:
+        result["blobs"] = len(found["blobs"])
+        result["bytes_freed"] += sum(path.stat().st_size for path in found["blobs"] if path.exists())
+    else:
+        def _unlink(conn: sqlite3.Connection, paths: List[Path]) -> Tuple[int, int]:
+            # 쓰기 잠금 안에서 DB 재확인 후 삭제 (같은 내용의 업로드와 겹치지 않도록)
+            removed = freed = 0
+            for path in paths:
+                relative = path.relative_to(files_dir)
+                size = unlink_if_unreferenced(conn, files_dir, relative.parent.as_posix(), relative.name)
+                if size:
+                    removed += 1
+                    freed += size
+            return removed, freed
+
+        for batch in _batches(found["blobs"], batch_size):
+            removed, freed = _write_batch(conn, _unlink, batch)
+            result["blobs"] += removed
+            result["bytes_freed"] += freed
+            result["batches"] += 1
+
+    result["elapsed_s"] = round(time.perf_counter() - started, 3)
+    logger.info(f"[FILE-GC] {result}")
+    return result
+
+
+class FileGCJob:
+    """GC 실행 상태 (동시에 1개만)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._running = False
+        self._runs = 0
+        self._last: Optional[Dict[str, Any]] = None
+
+    def try_start(self) -> bool:
+        with self._lock:
+            if self._running:
+                return False
+            self._running = True
+            return True
+
+    def run(self, **kwargs: Any) -> Dict[str, Any]:
+        """try_start() 성공 후 워커 스레드에서 호출 (전용 커넥션 사용)"""
+        conn = create_connection()
+        try:
+            last = {"ok": True, **collect_garbage(conn, **kwargs)}
+        except Exception as e:
+            logger.error(f"[FILE-GC] 실패: {e}")
+            last = {"ok": False, "error": str(e)}
+        finally:
+            conn.close()
+        with self._lock:
+            self._running = False
+            self._runs += 1
+            self._last = last
+        return last
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "running": self._running,
+                "runs": self._runs,
+                "interval_hours": settings.FILE_GC_INTERVAL_HOURS,
+                "include_unmatched": settings.FILE_GC_UNMATCHED,
+                "last": self._last,
+            }
+
+
+file_gc_job = FileGCJob()
+
+
+async def run_periodically(interval_seconds: float) -> None:
+    """interval 마다 GC 실행 (startup 에서 task 로 시작, shutdown 에서 cancel)"""
+    loop = asyncio.get_running_loop()
+    while True:
+        await asyncio.sleep(interval_seconds)
+        if file_gc_job.try_start():
+            await loop.run_in_executor(None, file_gc_job.run)
@@ -0,0 +1,341 @@
+# file_store.py
+"""
+모듈 설명:
+    - 첨부 파일 저장 (FILES_DIR)
+주요 기능:
+    - 업로드 스트림을 고정 크기 chunk 로 복사하면서 SHA-256 / 크기 계산 (저장 후 다시 stat 하지 않음)
+    - 최대 크기 초과 시 복사 중단 (UploadTooLargeError)
+    - 같은 디렉토리의 임시 파일(.part)에 쓰고 fsync 후 os.replace → 최종 경로에는 완성된 파일만 존재
+    - 블로킹 I/O 이므로 이벤트 루프 밖(run_in_threadpool)에서 호출
+    - 내용 주소(content-addressed) 저장: 업로드마다 files 행 1개(logical_name / mime), 같은 SHA-256 은 물리 파일 1개 공유
+    - 물리 파일의 참조 수 = 그 파일을 가리키는 files 행 수 → 삭제는 행 삭제, 참조가 0 이 된 물리 파일만 unlink
+    - 기존 파일 해시 계산 + 중복 물리 파일 공유 마이그레이션 (tools/dedup_files.py)
+    - 다운로드 ETag / 버전 URL, 원본 옆 파생 파일(썸네일 / 미리보기) 경로
+
+작성자: 김도영
+작성일: 2026-10-18
+버전: 1.0
+"""
+import hashlib
+import os
+import sqlite3
+import uuid
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple
+
+from app.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+TEMP_SUFFIX = ".part"
+# 업로드 수신 중인 임시 파일 (FILES_DIR 와 같은 파일시스템 → rename 원자적)
+INCOMING_DIR = ".incoming"
+BLOB_DIR = "blobs"
+HASH_CHUNK_SIZE = 1024 * 1024
+# 다운로드 URL 의 ?v= 길이 (내용 해시 앞부분)
+VERSION_LENGTH = 16
+# 원본 옆 파생 파일: <physical_name>.<variant>.jpg
+DERIVATIVE_VARIANTS = ("thumb", "preview")
+DERIVATIVE_SUFFIX = ".jpg"
+# 썸네일 생성 실패 표시: <physical_name>.thumb-failed (내용 주소 저장이라 원본이 바뀌지 않음 → 다시 디코딩하지 않음)
+FAILURE_MARKER_SUFFIX = ".thumb-failed"
+
+
+class UploadTooLargeError(ValueError):
+    """업로드 파일이 최대 크기를 넘음"""
+
+    def __init__(self, max_bytes: int):
+        super().__init__(f"File exceeds maximum size ({max_bytes} bytes)")
+        self.max_bytes = max_bytes
+
+
+class IncomingFile:
+    """수신 중인 업로드 1개: 임시 파일(.part)에 쓰면서 SHA-256 / 크기 계산 (write / finish 는 워커 스레드에서 호출)
+
+    max_bytes 를 넘는 순간 UploadTooLargeError (더 쓰지 않음). 실패 시 discard() 로 임시 파일 삭제.
+    """
+
+    def __init__(self, directory: Path, max_bytes: Optional[int] = None):
+        directory.mkdir(parents=True, exist_ok=True)
+        self.path = directory / f"{uuid.uuid4().hex}{TEMP_SUFFIX}"
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._digest = hashlib.sha256()
+        self._file = open(self.path, "wb")
+
+    def write(self, data: bytes) -> None:
+        self.size += len(data)
+        if self.max_bytes and self.size > self.max_bytes:
+            raise UploadTooLargeError(self.max_bytes)
+        self._digest.update(data)
+        self._file.write(data)
+
+    def finish(self) -> Dict[str, Any]:
+        """fsync 후 닫기. {"path", "size", "sha256"}"""
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._file.close()
+        return {"path": self.path, "size": self.size, "sha256": self._digest.hexdigest()}
+
+    def discard(self) -> None:
+        self._file.close()
+        self.path.unlink(missing_ok=True)
+
+
+def receive_stream(src: BinaryIO, directory: Path, max_bytes: Optional[int] = None,
+                   chunk_size: int = 1024 * 1024) -> Dict[str, Any]:
+    """src 를 directory 의 임시 파일로 복사. {"path", "size", "sha256"} (워커 스레드에서 실행)
+
+    실패하거나 max_bytes 를 넘으면 임시 파일을 지우고 예외를 다시 던진다.
+    """
+    incoming = IncomingFile(directory, max_bytes)
+    try:
+        while True:
+            chunk = src.read(chunk_size)
+            if not chunk:
+                break
+            incoming.write(chunk)
+        return incoming.finish()
+    except BaseException:
+        incoming.discard()
+        raise
+
+
+def store_stream(src: BinaryIO, dest: Path, max_bytes: Optional[int] = None,
+                 chunk_size: int = 1024 * 1024) -> Dict[str, Any]:
+    """src 를 dest 로 저장 (임시 파일 → os.replace). {"size", "sha256"}"""
+    received = receive_stream(src, dest.parent, max_bytes, chunk_size)
+    try:
+        os.replace(received["path"], dest)
+    except BaseException:
+        received["path"].unlink(missing_ok=True)
+        raise
+    return {"size": received["size"], "sha256": received["sha256"]}
+
+
+def hash_file(path: Path, chunk_size: int = HASH_CHUNK_SIZE) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def file_etag(content_hash: Optional[str], stat: os.stat_result, variant: Optional[str] = None) -> str:
+    """다운로드용 strong ETag (내용 해시, 해시가 없는 이전 파일은 크기 + 수정 시각)"""
+    if content_hash:
+        return f'"{content_hash}-{variant}"' if variant else f'"{content_hash}"'
+    return f'"{stat.st_size:x}-{stat.st_mtime_ns:x}"'
+
+
+def file_url(file_id: int, content_hash: Optional[str]) -> str:
+    """다운로드 URL (?v=<내용 해시> 가 붙으면 immutable 캐시)"""
+    if content_hash:
+        return f"/api/files/{file_id}?v={content_hash[:VERSION_LENGTH]}"
+    return f"/api/files/{file_id}"
+
+
+def derivative_path(original: Path, variant: str) -> Path:
+    """원본 옆에 저장하는 파생 파일 경로 (썸네일 / 미리보기)"""
+    return original.with_name(f"{original.name}.{variant}{DERIVATIVE_SUFFIX}")
+
+
+def failure_marker_path(original: Path) -> Path:
+    """썸네일 생성 실패 표시 파일 경로"""
+    return original.with_name(f"{original.name}{FAILURE_MARKER_SUFFIX}")
+
+
+def derivative_paths(original: Path) -> List[Path]:
+    """원본과 함께 삭제할 파생 파일 (썸네일 / 미리보기 / 실패 표시)"""
+    return [derivative_path(original, variant) for variant in DERIVATIVE_VARIANTS] + [failure_marker_path(original)]
+
+
+def blob_location(sha256: str) -> Tuple[str, str]:
+    """내용 해시 → (base_folder, physical_name)"""
+    return f"{BLOB_DIR}/{sha256[:2]}", sha256
+
+
+def ensure_schema(conn: sqlite3.Connection) -> None:
+    """이전 DDL 로 만든 files 에 content_hash 컬럼과 해시 조회 인덱스 추가
+
+    이전 버전의 유니크 인덱스(해시당 행 1개)는 일반 인덱스로 바꾼다. 남아 있는 ref_count 컬럼은 사용하지 않음.
+    """
+    cursor = conn.cursor()
+    cursor.execute("PRAGMA table_info(files)")
+    columns = [row[1] for row in cursor.fetchall()]
+    if "content_hash" not in columns:
+        cursor.execute("ALTER TABLE files ADD COLUMN content_hash text")
+    cursor.execute("PRAGMA index_list(files)")
+    if any(row[1] == "idx_files_content_hash" and row[2] for row in cursor.fetchall()):
+        cursor.execute("DROP INDEX idx_files_content_hash")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_files_content_hash ON files(content_hash)")
+    conn.commit()
+
+
+def count_references(conn: sqlite3.Connection, base_folder: str, physical_name: str) -> int:
+    """물리 파일을 가리키는 files 행 수"""
+    cursor = conn.cursor()
+    cursor.execute(
+        "SELECT COUNT(*) FROM files WHERE base_folder = ? AND physical_name = ?", (base_folder, physical_name)
+    )
+    return cursor.fetchone()[0]
+
+
+def store_blobs(conn: sqlite3.Connection, files_dir: Path, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """수신한 임시 파일을 내용 주소 위치로 옮기고 업로드마다 files 행 추가 (writer 스레드, 커밋은 호출자)
+
+    같은 내용의 물리 파일이 이미 있으면 임시 파일을 버리고 그 위치를 가리키는 새 행만 추가한다.
+    items: receive_stream 결과 + logical_name, mime
+    반환: [{"id", "base_folder", "physical_name", "deduplicated"}]
+    """
+    cursor = conn.cursor()
+    created: List[Path] = []
+    results = []
+    try:
+        for item in items:
+            cursor.execute(
+                "SELECT base_folder, physical_name FROM files WHERE content_hash = ? LIMIT 1", (item["sha256"],)
+            )
+            row = cursor.fetchone()
+            if row is not None:
+                base_folder, physical_name = row[0], row[1]
+                item["path"].unlink(missing_ok=True)
+                deduplicated = True
+            else:
+                base_folder, physical_name = blob_location(item["sha256"])
+                dest = files_dir / base_folder / physical_name
+                if dest.exists():
+                    # 이전에 행 없이 남은 같은 내용의 파일 재사용
+                    item["path"].unlink(missing_ok=True)
+                else:
+                    dest.parent.mkdir(parents=True, exist_ok=True)
+                    os.replace(item["path"], dest)
+                    created.append(dest)
+                deduplicated = False
+            cursor.execute(
+                """
+                INSERT INTO files (base_folder, physical_name, logical_name, size, mime, content_hash)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                (base_folder, physical_name, item["logical_name"], item["size"], item["mime"], item["sha256"])
+            )
+            results.append({
+                "id": cursor.lastrowid, "base_folder": base_folder, "physical_name": physical_name,
+                "deduplicated": deduplicated
+            })
+    except BaseException:
+        # 롤백될 행이 가리키는 새 파일 정리
+        for path in created:
+            remove_quietly(path)
+        raise
+    return results
+
+
+def release_file(conn: sqlite3.Connection, file_id: int) -> Optional[Dict[str, Any]]:
+    """files 행과 그 file_match 행 삭제 (writer 스레드, 커밋은 호출자)
+
+    반환: None(없는 파일) 또는 {"ref_count": 물리 파일에 남은 참조 수, "base_folder", "physical_name"}
+    """
+    cursor = conn.cursor()
+    cursor.execute("SELECT base_folder, physical_name FROM files WHERE id = ?", (file_id,))
+    row = cursor.fetchone()
+    if row is None:
+        return None
+    base_folder, physical_name = row[0], row[1]
+    # file_match는 ON DELETE CASCADE가 없으므로 수동 삭제 필요
+    cursor.execute("DELETE FROM file_match WHERE file_id = ?", (file_id,))
+    cursor.execute("DELETE FROM files WHERE id = ?", (file_id,))
+    remaining = count_references(conn, base_folder, physical_name)
+    return {"ref_count": remaining, "base_folder": base_folder, "physical_name": physical_name}
+
+
+def unlink_if_unreferenced(conn: sqlite3.Connection, files_dir: Path, base_folder: str, physical_name: str) -> int:
+    """참조하는 files 행이 없으면 물리 파일 삭제. 해제한 바이트 수
+
+    release_file 커밋 후 writer 스레드에서 실행 → 같은 내용의 업로드(store_blobs)와 직렬화된다.
+    """
+    if count_references(conn, base_folder, physical_name):
+        return 0
+    path = files_dir / base_folder / physical_name
+    freed = 0
+    # 썸네일 / 미리보기도 함께 삭제
+    for derived in derivative_paths(path):
+        try:
+            freed += derived.stat().st_size
+            derived.unlink()
+        except FileNotFoundError:
+            pass
+    try:
+        size = path.stat().st_size
+        path.unlink()
+    except FileNotFoundError:
+        return freed
+    logger.info(f"[FILE] Deleted physical file: {path}")
+    return freed + size
+
+
+def dedup_existing(conn: sqlite3.Connection, files_dir: Path, dry_run: bool = False) -> Dict[str, Any]:
+    """기존 파일 해시 계산 + 같은 내용의 행이 물리 파일 1개를 공유하도록 변경 (마이그레이션, 해시 그룹마다 커밋)
+
+    files 행(id / logical_name / mime)과 file_match 는 그대로 두고, 그룹마다 이미 해시가 있던 행
+    (없으면 가장 작은 id)의 물리 파일을 가리키도록 바꾼다. 참조가 없어진 물리 파일은 커밋 후 삭제.
+    """
+    ensure_schema(conn)
+    cursor = conn.cursor()
+    cursor.execute("SELECT id, base_folder, physical_name, content_hash FROM files ORDER BY id")
+    # content_hash -> [(id, base_folder, physical_name, 이미 해시가 있던 행)]
+    groups: Dict[str, List[Tuple[int, str, str, bool]]] = {}
+    result = {"hashed": 0, "missing": [], "relinked_rows": 0, "groups": 0, "bytes_freed": 0}
+
+    for file_id, base_folder, physical_name, content_hash in cursor.fetchall():
+        was_hashed = content_hash is not None
+        if not was_hashed:
+            path = files_dir / base_folder / physical_name
+            try:
+                content_hash = hash_file(path)
+            except FileNotFoundError:
+                result["missing"].append(file_id)
+                continue
+            result["hashed"] += 1
+        groups.setdefault(content_hash, []).append((file_id, base_folder, physical_name, was_hashed))
+
+    for content_hash, rows in groups.items():
+        keep = next((row for row in rows if row[3]), rows[0])
+        location = (keep[1], keep[2])
+        relinked = [row for row in rows if (row[1], row[2]) != location]
+        if not relinked and all(row[3] for row in rows):
+            continue
+        if dry_run:
+            if relinked:
+                result["groups"] += 1
+                result["relinked_rows"] += len(relinked)
+            continue
+
+        cursor.executemany(
+            "UPDATE files SET base_folder = ?, physical_name = ?, content_hash = ? WHERE id = ?",
+            [(location[0], location[1], content_hash, row[0]) for row in rows]
+        )
+        conn.commit()
+
+        if relinked:
+            result["groups"] += 1
+            result["relinked_rows"] += len(relinked)
+        for old_location in {(row[1], row[2]) for row in relinked}:
+            result["bytes_freed"] += unlink_if_unreferenced(conn, files_dir, *old_location)
+
+    logger.info(
+        f"[FILE] dedup: hashed={result['hashed']}, groups={result['groups']}, "
+        f"relinked_rows={result['relinked_rows']}, bytes_freed={result['bytes_freed']}, dry_run={dry_run}"
+    )
+    return result
+
+
+def remove_quietly(path: Path) -> None:
+    """정리용 삭제 (실패는 로그만)"""
+    try:
+        path.unlink(missing_ok=True)
+    except OSError as e:
+        logger.warning(f"[FILE] 파일 삭제 실패: {path}, {e}")
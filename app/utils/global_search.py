@@ -0,0 +1,324 @@
+# global_search.py
+"""
+모듈 설명:
+    - 전체 보드 통합 검색 색인 (search_index FTS5 테이블)
+주요 기능:
+    - 보드별 물리 테이블 트리거로 증분 색인 (title = 첫 문자열 컬럼, body = 나머지 string/text 컬럼)
+      트리거는 SQLite 내장 SQL 만 사용: INSERT/UPDATE 는 search_pending 에 기록, DELETE 는 색인 행 삭제
+    - sync_pending: 대기열의 레코드를 Python 에서 HTML 평문화 후 색인 (writer 커밋 직전 hook, 시작 시 1회)
+    - rowid = board_id << 32 | record_id 로 (board_id, record_id) 키를 정수 하나에 담아 삭제/갱신도 rowid 탐색
+    - 보드 단위 / 전체 재색인 (id 구간 batch 커밋), 백그라운드 실행 상태 관리
+    - 여러 보드를 한 번의 MATCH 쿼리로 순위 검색
+
+작성자: 김도영
+작성일: 2026-10-18
+버전: 1.0
+"""
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from app.core.board_registry import BoardEntry, BoardRegistry, board_registry
+from app.core.logger import get_logger
+from app.utils.board_fts import (FTS_DATA_TYPES, MARK_CLOSE, MARK_OPEN, PENDING_TABLE, build_match_query,
+                                 pending_sql, reconcile_fts, render_snippet)
+from app.utils.board_fts import index_records as index_fts_records
+from app.utils.html_text import strip_html
+
+logger = get_logger(__name__)
+
+SEARCH_INDEX = "search_index"
+ROWID_SHIFT = 32
+REBUILD_BATCH_SIZE = 500
+
+
+def index_rowid(board_id: int, record_id: int) -> int:
+    return (board_id << ROWID_SHIFT) | record_id
+
+
+def _board_rowid_range(board_id: int):
+    low = board_id << ROWID_SHIFT
+    return low, low + (1 << ROWID_SHIFT) - 1
+
+
+def _trigger_names(table: str) -> List[str]:
+    return [f"{table}_gs_ai", f"{table}_gs_au", f"{table}_gs_ad"]
+
+
+def index_columns(board: BoardEntry) -> List[str]:
+    return [
+        col["name"] for col in board.columns
+        if col.get("name") and col.get("data_type") in FTS_DATA_TYPES
+    ]
+
+
+def _index_values(board_id: int, row: tuple) -> tuple:
+    """(id, 컬럼 값...) → INSERT 할 (rowid, title, body, board_id, record_id). HTML 은 평문화"""
+    record_id = row[0]
+    texts = [strip_html(value) for value in row[1:]]
+    body = " ".join(text or "" for text in texts[1:])
+    return index_rowid(board_id, record_id), texts[0], body, board_id, record_id
+
+
+def _write_rows(conn: sqlite3.Connection, board_id: int, rows: List[tuple]) -> None:
+    conn.executemany(
+        f"INSERT OR REPLACE INTO {SEARCH_INDEX} (rowid, title, body, board_id, record_id) VALUES (?, ?, ?, ?, ?)",
+        [_index_values(board_id, row) for row in rows]
+    )
+
+
+def _trigger_sql(board: BoardEntry) -> Dict[str, str]:
+    """보드의 통합 검색 트리거 DDL (이름 → SQL). 색인할 컬럼이 없으면 빈 dict"""
+    columns = index_columns(board)
+    if not columns:
+        return {}
+
+    table = board.physical_table_name
+    ai, au, ad = _trigger_names(table)
+    pending = pending_sql(board.board_id)
+    delete = f"DELETE FROM {SEARCH_INDEX} WHERE rowid = ({board.board_id} << {ROWID_SHIFT}) | old.id;"
+    return {
+        ai: f"CREATE TRIGGER {ai} AFTER INSERT ON {table} BEGIN {pending} END",
+        au: f"CREATE TRIGGER {au} AFTER UPDATE OF {', '.join(columns)} ON {table} BEGIN {pending} END",
+        ad: f"CREATE TRIGGER {ad} AFTER DELETE ON {table} BEGIN {delete} END",
+    }
+
+
+def _existing_triggers(conn: sqlite3.Connection, table: str) -> Dict[str, str]:
+    names = _trigger_names(table)
+    cursor = conn.cursor()
+    cursor.execute(
+        f"SELECT name, sql FROM sqlite_master WHERE type = 'trigger' AND name IN ({', '.join('?' * len(names))})",
+        names
+    )
+    return {name: sql for name, sql in cursor.fetchall()}
+
+
+def remove_board(conn: sqlite3.Connection, board_id: int) -> None:
+    """보드의 색인 행 삭제 (커밋은 호출자 - 보드 삭제 트랜잭션 안에서 사용)"""
+    low, high = _board_rowid_range(board_id)
+    conn.execute(f"DELETE FROM {SEARCH_INDEX} WHERE rowid BETWEEN ? AND ?", (low, high))
+
+
+def reindex_board(conn: sqlite3.Connection, board: BoardEntry, batch_size: int = REBUILD_BATCH_SIZE) -> int:
+    """보드 1개 재색인 (id 구간별 커밋). 색인한 행 수 반환"""
+    table = board.physical_table_name
+    columns = index_columns(board)
+
+    remove_board(conn, board.board_id)
+    conn.commit()
+    if not columns:
+        return 0
+
+    cursor = conn.cursor()
+    last_id, indexed = 0, 0
+    while True:
+        cursor.execute(
+            f"SELECT id, {', '.join(columns)} FROM {table} WHERE id > ? ORDER BY id LIMIT ?",
+            (last_id, batch_size)
+        )
+        rows = cursor.fetchall()
+        if not rows:
+            break
+        _write_rows(conn, board.board_id, rows)
+        conn.commit()
+        last_id, indexed = rows[-1][0], indexed + len(rows)
+
+    logger.info(f"[GLOBAL-SEARCH] reindex: board_id={board.board_id}, rows={indexed}")
+    return indexed
+
+
+def reconcile_global_search(conn: sqlite3.Connection, board: BoardEntry, force: bool = False) -> Dict[str, Any]:
+    """트리거를 메타데이터와 일치시키고, 바뀐 경우(또는 force) 보드를 재색인"""
+    table = board.physical_table_name
+    cursor = conn.cursor()
+    cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (table,))
+    if cursor.fetchone() is None:
+        return {"action": "none"}
+
+    expected = _trigger_sql(board)
+    if not force and _existing_triggers(conn, table) == expected:
+        return {"action": "none"}
+
+    try:
+        for name in _trigger_names(table):
+            cursor.execute(f"DROP TRIGGER IF EXISTS {name}")
+        for sql in expected.values():
+            cursor.execute(sql)
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    return {"action": "reindexed", "rows": reindex_board(conn, board)}
+
+
+def index_records(conn: sqlite3.Connection, board: BoardEntry, record_ids: List[int]) -> None:
+    """레코드 id 들을 다시 색인 (없어진 레코드는 색인에서 삭제, 커밋은 호출자)"""
+    columns = index_columns(board)
+    rowids = [index_rowid(board.board_id, record_id) for record_id in record_ids]
+    cursor = conn.cursor()
+    if not columns:
+        cursor.execute(f"DELETE FROM {SEARCH_INDEX} WHERE rowid IN ({', '.join('?' * len(rowids))})", rowids)
+        return
+    cursor.execute(
+        f"SELECT id, {', '.join(columns)} FROM {board.physical_table_name} "
+        f"WHERE id IN ({', '.join('?' * len(record_ids))})",
+        record_ids
+    )
+    rows = cursor.fetchall()
+    found = {row[0] for row in rows}
+    missing = [index_rowid(board.board_id, record_id) for record_id in record_ids if record_id not in found]
+    if missing:
+        cursor.execute(f"DELETE FROM {SEARCH_INDEX} WHERE rowid IN ({', '.join('?' * len(missing))})", missing)
+    _write_rows(conn, board.board_id, rows)
+
+
+def sync_pending(conn: sqlite3.Connection, registry: BoardRegistry = board_registry,
+                 batch_size: int = REBUILD_BATCH_SIZE) -> int:
+    """색인 대기열(search_pending)의 레코드를 통합 검색 / 보드 FTS 에 반영. 처리한 건수 (커밋은 호출자)
+
+    writer 커밋 직전 hook 으로 같은 트랜잭션에서 실행 → 앱의 쓰기는 커밋과 동시에 검색에 반영된다.
+    앱 밖에서 쓴 레코드는 다음 쓰기 또는 다음 시작 때 반영.
+    """
+    cursor = conn.cursor()
+    cursor.execute(f"SELECT board_id, record_id FROM {PENDING_TABLE} ORDER BY board_id, record_id")
+    by_board: Dict[int, List[int]] = {}
+    for board_id, record_id in cursor.fetchall():
+        by_board.setdefault(board_id, []).append(record_id)
+    if not by_board:
+        return 0
+
+    synced = 0
+    for board_id, record_ids in by_board.items():
+        board = registry.get(conn, board_id)
+        if board is not None:
+            cursor.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (board.physical_table_name,)
+            )
+            if cursor.fetchone() is None:
+                board = None
+        for start in range(0, len(record_ids), batch_size):
+            batch = record_ids[start:start + batch_size]
+            if board is not None:
+                index_records(conn, board, batch)
+                index_fts_records(conn, board.physical_table_name, batch)
+            cursor.execute(
+                f"DELETE FROM {PENDING_TABLE} WHERE board_id = ? AND record_id IN ({', '.join('?' * len(batch))})",
+                [board_id, *batch]
+            )
+            synced += len(batch)
+    return synced
+
+
+def reconcile_all(conn: sqlite3.Connection, registry: BoardRegistry = board_registry) -> Dict[int, Dict[str, Any]]:
+    """시작 시 모든 보드의 FTS / 통합 검색 트리거 확인 (이전 형식이면 재생성 + 재색인) 후 대기열 반영"""
+    cursor = conn.cursor()
+    cursor.execute("SELECT id FROM boards ORDER BY id")
+    result = {}
+    for (board_id,) in cursor.fetchall():
+        board = registry.get(conn, board_id)
+        if board is None:
+            continue
+        actions = {"fts": reconcile_fts(conn, board)["action"], "global": reconcile_global_search(conn, board)["action"]}
+        if actions != {"fts": "none", "global": "none"}:
+            result[board_id] = actions
+    synced = sync_pending(conn, registry)
+    conn.commit()
+    logger.info(f"[GLOBAL-SEARCH] reconcile: changed={result}, pending_synced={synced}")
+    return result
+
+
+def rebuild_all(conn: sqlite3.Connection, batch_size: int = REBUILD_BATCH_SIZE) -> Dict[int, int]:
+    """모든 보드의 트리거 재생성 + 재색인. {board_id: 행 수}"""
+    cursor = conn.cursor()
+    cursor.execute("SELECT id FROM boards ORDER BY id")
+    board_ids = [row[0] for row in cursor.fetchall()]
+
+    # 삭제된 보드의 잔여 색인 정리
+    if board_ids:
+        cursor.execute(
+            f"DELETE FROM {SEARCH_INDEX} WHERE board_id NOT IN ({', '.join('?' * len(board_ids))})",
+            board_ids
+        )
+    else:
+        cursor.execute(f"DELETE FROM {SEARCH_INDEX}")
+    conn.commit()
+
+    result = {}
+    for board_id in board_ids:
+        board = board_registry.get(conn, board_id)
+        if board is not None:
+            result[board_id] = reconcile_global_search(conn, board, force=True).get("rows", 0)
+    return result
+
+
+def search_global(conn: sqlite3.Connection, q: str, limit: int = 20, offset: int = 0) -> List[Dict[str, Any]]:
+    """전체 보드 순위 검색 (단일 쿼리) [{board_id, board_name, record_id, title, snippet, score}]"""
+    match = build_match_query(q)
+    if match is None:
+        return []
+
+    cursor = conn.cursor()
+    # title 매치에 가중치 2배
+    cursor.execute(
+        f"SELECT s.board_id, b.name, s.record_id, bm25({SEARCH_INDEX}, 2.0, 1.0) AS score, "
+        f"highlight({SEARCH_INDEX}, 0, ?, ?), snippet({SEARCH_INDEX}, 1, ?, ?, '…', 16) "
+        f"FROM {SEARCH_INDEX} s JOIN boards b ON b.id = s.board_id "
+        f"WHERE {SEARCH_INDEX} MATCH ? ORDER BY score LIMIT ? OFFSET ?",
+        (MARK_OPEN, MARK_CLOSE, MARK_OPEN, MARK_CLOSE, match, limit, offset)
+    )
+    return [
+        {
+            "board_id": board_id,
+            "board_name": board_name,
+            "record_id": record_id,
+            "title": render_snippet(title),
+            "snippet": render_snippet(snippet),
+            "score": round(-score, 4),
+        }
+        for board_id, board_name, record_id, score, title, snippet in cursor.fetchall()
+    ]
+
+
+class RebuildJob:
+    """전체 재색인 백그라운드 실행 상태 (동시에 1개만)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._running = False
+        self._last: Optional[Dict[str, Any]] = None
+
+    def try_start(self) -> bool:
+        with self._lock:
+            if self._running:
+                return False
+            self._running = True
+            return True
+
+    def run(self, conn: sqlite3.Connection) -> Dict[str, Any]:
+        """try_start() 성공 후 워커 스레드에서 호출"""
+        started = time.perf_counter()
+        try:
+            boards = rebuild_all(conn)
+            last = {
+                "ok": True,
+                "boards": len(boards),
+                "rows": sum(boards.values()),
+                "elapsed_s": round(time.perf_counter() - started, 3),
+            }
+        except Exception as e:
+            logger.error(f"[GLOBAL-SEARCH] rebuild 실패: {e}")
+            last = {"ok": False, "error": str(e)}
+        with self._lock:
+            self._running = False
+            self._last = last
+        logger.info(f"[GLOBAL-SEARCH] rebuild 완료: {last}")
+        return last
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"running": self._running, "last": self._last}
+
+
+rebuild_job = RebuildJob()
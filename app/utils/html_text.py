@@ -0,0 +1,29 @@
+# html_text.py
+"""
+모듈 설명:
+    - HTML(Quill 에디터 값) → 검색용 평문 변환
+주요 기능:
+    - 태그 제거, 블록 태그/줄바꿈은 공백으로, HTML 엔티티 해제, 공백 정리
+    - FTS / 통합 검색 색인 시 Python 에서 호출 (DB 트리거는 SQLite 내장 SQL 만 사용)
+
+작성자: 김도영
+작성일: 2026-10-18
+버전: 1.0
+"""
+import html
+import re
+from typing import Any
+
+_BLOCK_TAG_RE = re.compile(r"<\s*(br|/p|/div|/li|/h[1-6]|/blockquote|/pre)\b[^>]*>", re.IGNORECASE)
+_TAG_RE = re.compile(r"<[^>]+>")
+_SPACE_RE = re.compile(r"\s+")
+
+
+def strip_html(value: Any) -> Any:
+    """HTML 문자열을 평문으로 변환 (문자열이 아니거나 태그가 없으면 그대로 반환)"""
+    if not isinstance(value, str) or "<" not in value:
+        return value
+    text = _BLOCK_TAG_RE.sub(" ", value)
+    text = _TAG_RE.sub("", text)
+    text = html.unescape(text)
+    return _SPACE_RE.sub(" ", text).strip()
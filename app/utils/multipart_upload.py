@@ -0,0 +1,156 @@
+# multipart_upload.py
+"""
+모듈 설명:
+    - multipart/form-data 업로드를 요청 스트림에서 직접 파싱해 저장
+주요 기능:
+    - request.stream() 의 chunk 를 python-multipart 파서에 바로 넘김 → 본문 전체를 먼저 spool 하지 않음
+    - 파일 part 는 IncomingFile(임시 파일 + SHA-256)로 바로 기록, 최대 크기를 넘는 순간 수신 중단
+    - 디스크 쓰기는 chunk_size 단위로 모아 이벤트 루프 밖(run_in_threadpool)에서 실행
+    - 실패 시 이 요청이 만든 임시 파일 모두 삭제
+
+작성자: 김도영
+작성일: 2026-10-18
+버전: 1.0
+"""
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from python_multipart.multipart import MultipartParser, parse_options_header
+from starlette.concurrency import run_in_threadpool
+from starlette.requests import Request
+
+from app.utils.file_store import IncomingFile, remove_quietly
+
+
+class MultipartUploadError(ValueError):
+    """multipart 본문 형식 오류"""
+
+
+def _decode(value: bytes, charset: str) -> str:
+    try:
+        return value.decode(charset)
+    except (UnicodeDecodeError, LookupError):
+        return value.decode("latin-1")
+
+
+class _PartCollector:
+    """파서 콜백(동기)을 이벤트 목록으로 모음 → receive_multipart 가 비동기로 처리"""
+
+    def __init__(self, field_name: str, charset: str):
+        self.field_name = field_name
+        self.charset = charset
+        # ("begin", (filename, mime)) / ("data", bytes) / ("end", None)
+        self.events: List[Tuple[str, Any]] = []
+        self._headers: Dict[bytes, bytes] = {}
+        self._header_name = b""
+        self._header_value = b""
+        self._accepting = False
+
+    def on_part_begin(self) -> None:
+        self._headers = {}
+        self._accepting = False
+
+    def on_header_field(self, data: bytes, start: int, end: int) -> None:
+        self._header_name += data[start:end]
+
+    def on_header_value(self, data: bytes, start: int, end: int) -> None:
+        self._header_value += data[start:end]
+
+    def on_header_end(self) -> None:
+        self._headers[self._header_name.lower()] = self._header_value
+        self._header_name = self._header_value = b""
+
+    def on_headers_finished(self) -> None:
+        _, options = parse_options_header(self._headers.get(b"content-disposition", b""))
+        if b"name" not in options:
+            raise MultipartUploadError('Content-Disposition "name" is required')
+        name = _decode(options[b"name"], self.charset)
+        # 대상 필드의 파일 part 만 저장, 나머지 필드는 무시
+        if name != self.field_name or not options.get(b"filename"):
+            return
+        filename = _decode(options[b"filename"], self.charset)
+        mime = _decode(self._headers.get(b"content-type", b"application/octet-stream"), self.charset)
+        self._accepting = True
+        self.events.append(("begin", (filename, mime)))
+
+    def on_part_data(self, data: bytes, start: int, end: int) -> None:
+        if self._accepting:
+            self.events.append(("data", data[start:end]))
+
+    def on_part_end(self) -> None:
+        if self._accepting:
+            self.events.append(("end", None))
+            self._accepting = False
+
+
+def _feed(fn, *args) -> None:
+    """파서 호출 - python-multipart 의 형식 오류는 MultipartUploadError 로"""
+    try:
+        fn(*args)
+    except MultipartUploadError:
+        raise
+    except Exception as e:
+        raise MultipartUploadError(f"Invalid multipart body: {e}") from e
+
+
+async def receive_multipart(request: Request, field_name: str, directory: Path,
+                            max_bytes: Optional[int] = None, chunk_size: int = 1024 * 1024) -> List[Dict[str, Any]]:
+    """field_name 의 파일들을 directory 의 임시 파일로 수신
+
+    반환: [{"path", "size", "sha256", "logical_name", "mime"}]
+    최대 크기 초과(UploadTooLargeError) / 형식 오류(MultipartUploadError) 시 임시 파일을 지우고 예외를 다시 던진다.
+    """
+    content_type, params = parse_options_header(request.headers.get("content-type", ""))
+    if content_type != b"multipart/form-data" or b"boundary" not in params:
+        raise MultipartUploadError("Expected multipart/form-data with a boundary")
+    charset = params.get(b"charset", b"utf-8").decode("latin-1")
+
+    collector = _PartCollector(field_name, charset)
+    parser = MultipartParser(params[b"boundary"], {
+        "on_part_begin": collector.on_part_begin,
+        "on_part_data": collector.on_part_data,
+        "on_part_end": collector.on_part_end,
+        "on_header_field": collector.on_header_field,
+        "on_header_value": collector.on_header_value,
+        "on_header_end": collector.on_header_end,
+        "on_headers_finished": collector.on_headers_finished,
+    })
+
+    received: List[Dict[str, Any]] = []
+    state: Dict[str, Any] = {"file": None, "meta": ("", ""), "buffer": bytearray()}
+
+    async def flush_events() -> None:
+        for kind, value in collector.events:
+            if kind == "begin":
+                state["meta"] = value
+                state["file"] = await run_in_threadpool(IncomingFile, directory, max_bytes)
+            elif kind == "data":
+                state["buffer"] += value
+                if len(state["buffer"]) >= chunk_size:
+                    await run_in_threadpool(state["file"].write, bytes(state["buffer"]))
+                    state["buffer"].clear()
+            else:
+                if state["buffer"]:
+                    await run_in_threadpool(state["file"].write, bytes(state["buffer"]))
+                    state["buffer"].clear()
+                item = await run_in_threadpool(state["file"].finish)
+                item["logical_name"], item["mime"] = state["meta"]
+                received.append(item)
+                state["file"] = None
+        collector.events.clear()
+
+    try:
+        async for chunk in request.stream():
+            _feed(parser.write, chunk)
+            await flush_events()
+        _feed(parser.finalize)
+        await flush_events()
+        if state["file"] is not None:
+            raise MultipartUploadError("Multipart body ended before the file part was complete")
+        return received
+    except BaseException:
+        if state["file"] is not None:
+            await run_in_threadpool(state["file"].discard)
+        for item in received:
+            await run_in_threadpool(remove_quietly, item["path"])
+        raise
@@ -0,0 +1,109 @@
+# record_bulk.py
+"""
+모듈 설명:
+    - 레코드 일괄 수정 / 일괄 삭제
+주요 기능:
+    - 대상 지정: ids 목록 또는 화이트리스트 컬럼 동등 조건(filter)
+    - filter 값은 쓰기 계획과 같은 data_type 변환을 거쳐 저장값과 같은 형태로 비교 ("true" → 1, 날짜 형식 통일)
+    - id 목록은 json_each(?) 파라미터 1개로 전달 (개수와 무관하게 같은 SQL 문)
+    - UPDATE / DELETE 문 1개 = writer 트랜잭션 1개, 영향받은 행 수 반환
+
+작성자: 김도영
+작성일: 2026-10-18
+버전: 1.0
+"""
+import json
+import sqlite3
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.core.board_registry import BoardEntry
+from app.utils.coerce import get_coercer
+from app.utils.record_query import allowed_columns
+from app.utils.write_plan import WritePlanError, get_write_plan
+
+MAX_BULK_IDS = 10000
+# 보드 컬럼이 아닌 시스템 컬럼의 변환
+_SYSTEM_COERCERS = {"id": get_coercer("integer"), "created_at": get_coercer("datetime"),
+                    "updated_at": get_coercer("datetime")}
+
+
+def build_target(
+    board: BoardEntry,
+    ids: Optional[List[Any]] = None,
+    filters: Optional[Dict[str, Any]] = None,
+) -> Tuple[str, List[Any]]:
+    """ids 또는 filter → WHERE 절 + 파라미터
+
+    대상이 비었으면 ValueError, 허용되지 않은 컬럼 / 스칼라가 아닌 값 / 변환 실패는 WritePlanError(errors).
+    """
+    if ids:
+        if len(ids) > MAX_BULK_IDS:
+            raise ValueError(f"Too many ids (max {MAX_BULK_IDS})")
+        try:
+            id_list = [int(i) for i in ids]
+        except (TypeError, ValueError):
+            raise ValueError("ids must be integers")
+        return "WHERE id IN (SELECT value FROM json_each(?))", [json.dumps(id_list)]
+
+    if filters:
+        allowed = allowed_columns(board)
+        coercers = {**_SYSTEM_COERCERS, **get_write_plan(board).coercers}
+        clauses, params, errors = [], [], []
+        for column, value in filters.items():
+            if column not in allowed:
+                errors.append(f"Unknown filter column: {column}")
+                continue
+            try:
+                if isinstance(value, list):
+                    values = [_coerce_filter_value(coercers[column], item) for item in value]
+                    clauses.append(f"{column} IN (SELECT value FROM json_each(?))")
+                    params.append(json.dumps(values, ensure_ascii=False))
+                    continue
+                value = _coerce_filter_value(coercers[column], value)
+            except (TypeError, ValueError) as e:
+                errors.append(f"{column}: {e}")
+                continue
+            if value is None:
+                clauses.append(f"{column} IS NULL")
+            else:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        if errors:
+            raise WritePlanError(errors)
+        return "WHERE " + " AND ".join(clauses), params
+
+    # 전체 삭제/수정은 허용하지 않음
+    raise ValueError("ids or filter is required")
+
+
+def _coerce_filter_value(convert, value: Any) -> Any:
+    if isinstance(value, (dict, list)):
+        raise ValueError(f"스칼라 값이 아닙니다: {json.dumps(value, ensure_ascii=False)}")
+    return convert(value)
+
+
+def bulk_delete(conn: sqlite3.Connection, board: BoardEntry, where: str, params: List[Any]) -> int:
+    cursor = conn.execute(f"DELETE FROM {board.physical_table_name} {where}", params)
+    return cursor.rowcount
+
+
+def build_set(board: BoardEntry, data: Dict[str, Any]) -> Tuple[str, List[Any]]:
+    """수정할 값 → SET 절 (쓰기 계획으로 컬럼 검증 + 형 변환, updated_at 갱신)"""
+    values = get_write_plan(board).coerce(data) if data else {}
+    if not values:
+        raise ValueError("set is required")
+    assignments = [f"{column} = ?" for column in values]
+    assignments.append("updated_at = CURRENT_TIMESTAMP")
+    return "SET " + ", ".join(assignments), list(values.values())
+
+
+def bulk_update(
+    conn: sqlite3.Connection,
+    board: BoardEntry,
+    set_sql: str,
+    set_params: List[Any],
+    where: str,
+    params: List[Any],
+) -> int:
+    cursor = conn.execute(f"UPDATE {board.physical_table_name} {set_sql} {where}", set_params + params)
+    return cursor.rowcount
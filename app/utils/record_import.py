@@ -0,0 +1,221 @@
+# record_import.py
+"""
+모듈 설명:
+    - 레코드 대량 가져오기 (CSV / JSONL)
+주요 기능:
+    - 업로드 파일을 한 줄씩 읽어 처리 (파일 전체를 메모리에 올리지 않음)
+    - 헤더(키)를 table 메타데이터의 컬럼명(col*) 또는 라벨로 매핑
+    - data_type 별 값 변환 / INSERT 문은 보드 쓰기 계획(app.utils.write_plan) 사용
+    - chunk 단위 executemany → writer 큐의 트랜잭션 1개씩 (실패 시 해당 chunk만 행 단위로 재시도)
+    - 행 단위 오류는 기록하고 나머지 행은 계속 처리
+
+작성자: 김도영
+작성일: 2026-10-18
+버전: 1.0
+"""
+import codecs
+import csv
+import json
+import sqlite3
+import time
+from dataclasses import dataclass, field
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple
+
+from starlette.concurrency import run_in_threadpool
+
+from app.core.board_registry import BoardEntry
+from app.core.db_writer import DBWriter
+from app.core.logger import get_logger
+from app.utils.write_plan import get_write_plan
+
+logger = get_logger(__name__)
+
+IMPORT_FORMATS = ("csv", "jsonl")
+MAX_REPORTED_ERRORS = 100
+# 헤더에 있어도 무시하는 시스템 컬럼 (내보내기 파일을 다시 가져올 때)
+IGNORED_HEADERS = {"id", "created_at", "updated_at", "생성일", "수정일"}
+
+
+def detect_format(filename: Optional[str], requested: Optional[str] = None) -> Optional[str]:
+    """format 파라미터 우선, 없으면 확장자로 판단"""
+    if requested:
+        requested = requested.lower()
+        return requested if requested in IMPORT_FORMATS else None
+    suffix = (filename or "").rsplit(".", 1)[-1].lower()
+    if suffix in ("jsonl", "ndjson"):
+        return "jsonl"
+    if suffix in ("csv", "txt"):
+        return "csv"
+    return None
+
+
+def iter_source_rows(fileobj: BinaryIO, fmt: str) -> Iterator[Tuple[int, Any]]:
+    """(줄 번호, dict) 스트림. JSONL 파싱 오류는 (줄 번호, ValueError)로 전달"""
+    text = codecs.getreader("utf-8-sig")(fileobj)
+    if fmt == "csv":
+        reader = csv.DictReader(text)
+        for row in reader:
+            yield reader.line_num, row
+        return
+
+    for line_no, line in enumerate(text, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            row = json.loads(line)
+        except json.JSONDecodeError as e:
+            yield line_no, ValueError(f"JSON 파싱 실패: {e.msg}")
+            continue
+        if not isinstance(row, dict):
+            yield line_no, ValueError("JSON 객체가 아닙니다")
+            continue
+        yield line_no, row
+
+
+class ImportPlan:
+    """보드 1개에 대한 가져오기 계획 (컬럼 매핑, 변환 함수, INSERT 문)"""
+
+    def __init__(self, board: BoardEntry):
+        write_plan = get_write_plan(board)
+        self.columns: List[str] = list(write_plan.columns)
+        self._coercers = write_plan.coercers
+        self.insert_sql = write_plan.insert_sql
+        self._lookup: Dict[str, str] = {}
+        for col in board.columns:
+            name = col.get("name")
+            if not name:
+                continue
+            self._lookup[name.casefold()] = name
+            if col.get("label"):
+                self._lookup.setdefault(str(col["label"]).strip().casefold(), name)
+        self.unknown_headers: List[str] = []
+        self._seen_headers: Dict[str, Optional[str]] = {}
+
+    def column_for(self, header: Any) -> Optional[str]:
+        """헤더 → 컬럼명 (컬럼명 또는 라벨, 대소문자/앞뒤 공백 무시)"""
+        key = str(header)
+        if key not in self._seen_headers:
+            normalized = key.strip().casefold()
+            column = self._lookup.get(normalized)
+            if column is None and normalized not in IGNORED_HEADERS:
+                self.unknown_headers.append(key)
+            self._seen_headers[key] = column
+        return self._seen_headers[key]
+
+    def prepare(self, row: Dict[str, Any]) -> Tuple[Optional[tuple], List[str]]:
+        """행 → INSERT 파라미터. 변환 실패가 있으면 (None, 오류 목록)"""
+        values: Dict[str, Any] = {}
+        errors: List[str] = []
+        for header, raw in row.items():
+            if header is None:
+                # CSV에서 헤더보다 값이 많은 경우
+                errors.append("헤더보다 값이 많습니다")
+                continue
+            column = self.column_for(header)
+            if column is None:
+                continue
+            try:
+                values[column] = self._coercers[column](raw)
+            except (TypeError, ValueError) as e:
+                errors.append(f"{header}: {e}")
+        if errors:
+            return None, errors
+        if not any(v is not None for v in values.values()):
+            return None, ["빈 행입니다"]
+        return tuple(values.get(column) for column in self.columns), []
+
+
+@dataclass
+class ImportResult:
+    total_rows: int = 0
+    inserted: int = 0
+    failed: int = 0
+    errors: List[Dict[str, Any]] = field(default_factory=list)
+
+    def add_error(self, line: int, message: str) -> None:
+        self.failed += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append({"line": line, "error": message})
+
+
+def prepare_chunk(
+    rows: Iterator[Tuple[int, Any]],
+    plan: ImportPlan,
+    chunk_size: int,
+    result: ImportResult,
+) -> Tuple[List[Tuple[int, tuple]], bool]:
+    """원본 행을 chunk_size 만큼 읽어 변환 (워커 스레드에서 실행). (chunk, 끝 여부)"""
+    chunk: List[Tuple[int, tuple]] = []
+    for line_no, row in rows:
+        result.total_rows += 1
+        if isinstance(row, Exception):
+            result.add_error(line_no, str(row))
+            continue
+        params, errors = plan.prepare(row)
+        if errors:
+            result.add_error(line_no, "; ".join(errors))
+            continue
+        chunk.append((line_no, params))
+        if len(chunk) >= chunk_size:
+            return chunk, False
+    return chunk, True
+
+
+def insert_chunk(
+    conn: sqlite3.Connection,
+    plan: ImportPlan,
+    chunk: List[Tuple[int, tuple]],
+) -> Tuple[int, List[Tuple[int, str]]]:
+    """chunk를 executemany로 삽입 (writer 트랜잭션 안). 제약 위반 시 행 단위로 재시도"""
+    conn.execute("SAVEPOINT import_chunk")
+    try:
+        conn.executemany(plan.insert_sql, [params for _, params in chunk])
+        conn.execute("RELEASE import_chunk")
+        return len(chunk), []
+    except sqlite3.DatabaseError:
+        conn.execute("ROLLBACK TO import_chunk")
+        conn.execute("RELEASE import_chunk")
+
+    inserted, errors = 0, []
+    for line_no, params in chunk:
+        try:
+            conn.execute(plan.insert_sql, params)
+            inserted += 1
+        except sqlite3.DatabaseError as e:
+            errors.append((line_no, str(e)))
+    return inserted, errors
+
+
+async def run_import(writer: DBWriter, board: BoardEntry, fileobj: BinaryIO, fmt: str, chunk_size: int) -> Dict[str, Any]:
+    """파일 읽기/변환은 워커 스레드, 삽입은 writer 큐 (chunk마다 트랜잭션 1개)"""
+    plan = ImportPlan(board)
+    result = ImportResult()
+    rows = iter_source_rows(fileobj, fmt)
+    started = time.perf_counter()
+
+    done = False
+    while not done:
+        chunk, done = await run_in_threadpool(prepare_chunk, rows, plan, chunk_size, result)
+        if not chunk:
+            continue
+        inserted, errors = await writer.call(lambda conn, chunk=chunk: insert_chunk(conn, plan, chunk))
+        result.inserted += inserted
+        for line_no, message in errors:
+            result.add_error(line_no, message)
+
+    elapsed = time.perf_counter() - started
+    logger.info(
+        f"[RECORD-IMPORT] board_id={board.board_id}, rows={result.total_rows}, "
+        f"inserted={result.inserted}, failed={result.failed}, {elapsed:.3f}s"
+    )
+    return {
+        "format": fmt,
+        "total_rows": result.total_rows,
+        "inserted": result.inserted,
+        "failed": result.failed,
+        "errors": result.errors,
+        "unknown_headers": plan.unknown_headers,
+        "elapsed_s": round(elapsed, 3),
+        "rows_per_sec": round(result.total_rows / elapsed, 1) if elapsed > 0 else None,
+    }
@@ -0,0 +1,309 @@
+# record_query.py
+"""
+모듈 설명:
+    - 기록물 목록 쿼리 빌더 (list 메타데이터 기반)
+주요 기능:
+    - pagination.page_size / default_sort / search.simple_fields 를 SQL로 적용
+    - ORDER BY 컬럼은 보드 컬럼 + 시스템 컬럼 화이트리스트로만 허용
+    - 검색은 파라미터 바인딩된 LIKE (와일드카드 escape)
+    - LIMIT/OFFSET 페이지 + 전체 건수
+    - keyset(cursor) 페이지: after/before 토큰 = (정렬 키 전체의 값, id), OFFSET/COUNT 없음
+
+작성자: 김도영
+작성일: 2026-10-18
+버전: 1.0
+"""
+import base64
+import binascii
+import json
+import math
+import sqlite3
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from app.core.board_registry import BoardEntry
+from app.utils.board_stats import record_count
+
+SYSTEM_COLUMNS = ("id", "created_at", "updated_at")
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 200
+
+
+@dataclass(frozen=True)
+class ListQuery:
+    """검증이 끝난 목록 조회 조건"""
+    page: int
+    page_size: int
+    sort: Tuple[Tuple[str, str], ...]  # ((컬럼, "ASC"|"DESC"), ...)
+    search: Optional[str]
+    search_fields: Tuple[str, ...]
+
+    @property
+    def offset(self) -> int:
+        return (self.page - 1) * self.page_size
+
+    @property
+    def sort_column(self) -> str:
+        return self.sort[0][0]
+
+    @property
+    def sort_order(self) -> str:
+        return self.sort[0][1].lower()
+
+
+def allowed_columns(board: BoardEntry) -> set:
+    """ORDER BY / WHERE 에 쓸 수 있는 컬럼 화이트리스트"""
+    return {col.get("name") for col in board.columns if col.get("name")} | set(SYSTEM_COLUMNS)
+
+
+def _normalize_order(order: Optional[str], default: str = "DESC") -> str:
+    order = (order or default).upper()
+    return order if order in ("ASC", "DESC") else default
+
+
+def default_sort(board: BoardEntry) -> Tuple[Tuple[str, str], ...]:
+    """list 메타데이터의 default_sort (구버전 sort 키도 지원), 없으면 id DESC"""
+    list_meta = board.list_meta or {}
+    allowed = allowed_columns(board)
+
+    entries = list_meta.get("default_sort") or ()
+    if not entries and list_meta.get("sort"):
+        entries = (list_meta["sort"],)
+
+    sort = tuple(
+        (entry.get("column"), _normalize_order(entry.get("order")))
+        for entry in entries
+        if isinstance(entry, dict) and entry.get("column") in allowed
+    )
+    return sort or (("id", "DESC"),)
+
+
+def search_fields(board: BoardEntry) -> Tuple[str, ...]:
+    """search.simple_fields 중 실제 존재하는 컬럼"""
+    search = (board.list_meta or {}).get("search") or {}
+    if search.get("enabled") is False:
+        return ()
+    allowed = allowed_columns(board)
+    fields = search.get("simple_fields") or search.get("searchable_columns") or ()
+    return tuple(f for f in fields if f in allowed)
+
+
+def resolve_list_query(
+    board: BoardEntry,
+    page: int = 1,
+    page_size: Optional[int] = None,
+    sort: Optional[str] = None,
+    order: Optional[str] = None,
+    q: Optional[str] = None,
+) -> ListQuery:
+    """요청 파라미터 + list 메타데이터 → ListQuery"""
+    pagination = (board.list_meta or {}).get("pagination") or {}
+    if not page_size:
+        page_size = pagination.get("page_size") or DEFAULT_PAGE_SIZE
+    page_size = max(1, min(int(page_size), MAX_PAGE_SIZE))
+
+    if sort and sort in allowed_columns(board):
+        sort_spec = ((sort, _normalize_order(order)),)
+    else:
+        sort_spec = default_sort(board)
+        if order:
+            # 정렬 방향만 바꾸는 경우 (첫 번째 정렬 기준에 적용)
+            sort_spec = ((sort_spec[0][0], _normalize_order(order)),) + sort_spec[1:]
+
+    fields = search_fields(board)
+    q = (q or "").strip() or None
+
+    return ListQuery(
+        page=max(1, int(page or 1)),
+        page_size=page_size,
+        sort=sort_spec,
+        search=q if fields else None,
+        search_fields=fields,
+    )
+
+
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def build_where(lq: ListQuery) -> Tuple[str, List[Any]]:
+    if not lq.search:
+        return "", []
+    pattern = f"%{_escape_like(lq.search)}%"
+    clause = " OR ".join(f"{field} LIKE ? ESCAPE '\\'" for field in lq.search_fields)
+    return f"WHERE ({clause})", [pattern] * len(lq.search_fields)
+
+
+def build_order_by(sort: Sequence[Tuple[str, str]]) -> str:
+    """ORDER BY 절 (id를 마지막 tie-breaker로 추가해 페이지 경계를 안정화)"""
+    parts = [f"{column} {direction}" for column, direction in sort]
+    if not any(column == "id" for column, _ in sort):
+        parts.append(f"id {sort[0][1]}")
+    return "ORDER BY " + ", ".join(parts)
+
+
+def sort_keys(sort: Sequence[Tuple[str, str]]) -> List[Tuple[str, str]]:
+    """ORDER BY 와 같은 순서의 정렬 키 전체 (id tie-breaker 포함, id 이후 키는 의미 없으므로 제외)"""
+    keys: List[Tuple[str, str]] = []
+    for column, direction in sort:
+        keys.append((column, direction))
+        if column == "id":
+            return keys
+    keys.append(("id", sort[0][1]))
+    return keys
+
+
+def encode_cursor(lq: ListQuery, record: Dict[str, Any]) -> str:
+    """레코드 위치 → 불투명 cursor 토큰 (정렬 키/방향 전체 + 각 키의 값)"""
+    keys = sort_keys(lq.sort)
+    payload = {
+        "s": [[column, direction] for column, direction in keys],
+        "v": [record.get(column) for column, _ in keys],
+    }
+    raw = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(lq: ListQuery, token: str) -> List[Any]:
+    """cursor 토큰 → 정렬 키 값 목록. 형식 오류나 정렬 조건 불일치 시 ValueError"""
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        payload = json.loads(raw.decode("utf-8"))
+        keys = [(column, direction) for column, direction in payload["s"]]
+        values = list(payload["v"])
+    except (binascii.Error, UnicodeDecodeError, ValueError, KeyError, TypeError):
+        raise ValueError("Invalid cursor")
+
+    if keys != sort_keys(lq.sort) or len(values) != len(keys):
+        raise ValueError("Cursor does not match current sort")
+    return values
+
+
+def _beyond(column: str, value: Any, ascending: bool) -> Optional[Tuple[str, List[Any]]]:
+    """읽는 방향으로 value 다음에 오는 값 조건 (SQLite는 NULL을 가장 작은 값으로 정렬). 없으면 None"""
+    if ascending:
+        if value is None:
+            return f"{column} IS NOT NULL", []
+        return f"{column} > ?", [value]
+    if value is None:
+        return None
+    return f"({column} < ? OR {column} IS NULL)", [value]
+
+
+def _seek_condition(keys: List[Tuple[str, str]], values: List[Any], forward: bool) -> Tuple[str, List[Any]]:
+    """정렬 키 전체 기준 cursor 다음 위치 조건 (사전식 비교: 앞 키가 같고 i 번째 키가 뒤)"""
+    clauses: List[str] = []
+    params: List[Any] = []
+    for i, (column, direction) in enumerate(keys):
+        beyond = _beyond(column, values[i], (direction == "ASC") == forward)
+        if beyond is not None:
+            equal = [f"{c} IS NULL" if v is None else f"{c} = ?" for (c, _), v in zip(keys[:i], values[:i])]
+            clauses.append(" AND ".join(equal + [beyond[0]]))
+            params.extend(v for v in values[:i] if v is not None)
+            params.extend(beyond[1])
+    if not clauses:
+        return "0", []
+    return "(" + " OR ".join(f"({clause})" for clause in clauses) + ")", params
+
+
+def fetch_record_keyset(
+    conn: sqlite3.Connection,
+    board: BoardEntry,
+    lq: ListQuery,
+    after: Optional[str] = None,
+    before: Optional[str] = None,
+) -> Dict[str, Any]:
+    """keyset 페이지 조회 (워커 스레드에서 실행)
+
+    OFFSET 페이지와 같은 정렬 키 전체(+ id) 로 위치를 찾으므로 깊은 페이지도 인덱스 탐색 비용만 든다.
+    """
+    table = board.physical_table_name
+    backward = before is not None and after is None
+
+    where, params = build_where(lq)
+    conditions = [where[len("WHERE "):]] if where else []
+
+    token = before if backward else after
+    if token:
+        # before는 역방향으로 읽은 뒤 뒤집는다
+        clause, seek_params = _seek_condition(sort_keys(lq.sort), decode_cursor(lq, token), forward=not backward)
+        conditions.append(clause)
+        params = params + seek_params
+
+    flip = {"ASC": "DESC", "DESC": "ASC"}
+    order_by = build_order_by(
+        tuple((column, flip[direction]) for column, direction in lq.sort) if backward else lq.sort
+    )
+    where_sql = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+    cursor = conn.cursor()
+    cursor.execute(
+        f"SELECT * FROM {table} {where_sql} {order_by} LIMIT ?",
+        params + [lq.page_size + 1]
+    )
+    records = [dict(row) for row in cursor.fetchall()]
+    has_more = len(records) > lq.page_size
+    records = records[:lq.page_size]
+    if backward:
+        records.reverse()
+
+    if backward:
+        next_cursor = encode_cursor(lq, records[-1]) if records else before
+        prev_cursor = encode_cursor(lq, records[0]) if records and has_more else None
+    else:
+        next_cursor = encode_cursor(lq, records[-1]) if records and has_more else None
+        prev_cursor = encode_cursor(lq, records[0]) if records and after else None
+
+    return {
+        "records": records,
+        "page_size": lq.page_size,
+        "sort": lq.sort_column,
+        "order": lq.sort_order,
+        "q": lq.search or "",
+        "search_fields": list(lq.search_fields),
+        "next_cursor": next_cursor,
+        "prev_cursor": prev_cursor,
+    }
+
+
+def list_query_sql(board: BoardEntry, lq: ListQuery, page: Optional[int] = None) -> Tuple[str, List[Any]]:
+    """목록 페이지 SELECT 문 + 파라미터 (checker의 EXPLAIN 에서도 사용)"""
+    where, params = build_where(lq)
+    offset = ((page or lq.page) - 1) * lq.page_size
+    sql = f"SELECT * FROM {board.physical_table_name} {where} {build_order_by(lq.sort)} LIMIT ? OFFSET ?"
+    return sql, params + [lq.page_size, offset]
+
+
+def fetch_record_page(conn: sqlite3.Connection, board: BoardEntry, lq: ListQuery) -> Dict[str, Any]:
+    """목록 1페이지 + 전체 건수 조회 (워커 스레드에서 실행)"""
+    table = board.physical_table_name
+    where, params = build_where(lq)
+    cursor = conn.cursor()
+
+    if where:
+        cursor.execute(f"SELECT COUNT(*) FROM {table} {where}", params)
+        total_count = cursor.fetchone()[0]
+    else:
+        # 검색 조건이 없으면 트리거로 유지되는 카운터 사용 (전체 스캔 없음)
+        total_count = record_count(conn, board.board_id, table)
+    total_pages = max(1, math.ceil(total_count / lq.page_size))
+    page = min(lq.page, total_pages)
+
+    cursor.execute(*list_query_sql(board, lq, page))
+    records = [dict(row) for row in cursor.fetchall()]
+
+    # 다음 페이지는 cursor로도 이어서 읽을 수 있도록 함께 제공
+    next_cursor = encode_cursor(lq, records[-1]) if records and page < total_pages else None
+
+    return {
+        "records": records,
+        "next_cursor": next_cursor,
+        "total_count": total_count,
+        "total_pages": total_pages,
+        "page": page,
+        "page_size": lq.page_size,
+        "sort": lq.sort_column,
+        "order": lq.sort_order,
+        "q": lq.search or "",
+        "search_fields": list(lq.search_fields),
+    }
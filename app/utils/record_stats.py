@@ -0,0 +1,356 @@
+# record_stats.py
+"""
+모듈 설명:
+    - 보드 레코드 집계 (수치 컬럼 통계 + 날짜 컬럼 기준 기간별 집계)
+주요 기능:
+    - integer/real 컬럼별 count/min/max/avg/sum 을 SQL 집계 1번으로 계산
+    - ymd/datetime 컬럼 기준 day/week/month 버킷 집계 (GROUP BY)
+    - 선택 기능: 일별 요약 테이블({table}_stats, list 메타데이터 stats.summary_date_column)
+        · INSERT 는 트리거에서 증분 UPSERT, UPDATE/DELETE 는 해당 날짜 1일분만 재계산
+        · 검색어가 없으면 요약 테이블에서 집계 → 물리 테이블 전체를 다시 읽지 않음
+
+작성자: 김도영
+작성일: 2026-10-18
+버전: 1.0
+"""
+import sqlite3
+from typing import Any, Dict, List, Optional
+
+from app.core.board_registry import BoardEntry
+from app.core.logger import get_logger
+from app.utils.record_query import ListQuery, build_where
+
+logger = get_logger(__name__)
+
+NUMERIC_DATA_TYPES = ("integer", "real")
+DATE_DATA_TYPES = ("ymd", "datetime")
+BUCKETS = ("day", "week", "month")
+
+# 날짜 값이 없는 레코드는 day = '' 요약 행에 집계
+# "YYYY-MM-DD" 하루 구간의 상한 ("YYYY-MM-DD HH:MM:SS" < "YYYY-MM-DD 99")
+DAY_UPPER_SUFFIX = " 99"
+
+
+def date_columns(board: BoardEntry) -> List[str]:
+    return [
+        col["name"] for col in board.columns
+        if col.get("name") and col.get("data_type") in DATE_DATA_TYPES
+    ]
+
+
+def _numeric_types(board: BoardEntry) -> Dict[str, str]:
+    return {
+        col["name"]: col["data_type"] for col in board.columns
+        if col.get("name") and col.get("data_type") in NUMERIC_DATA_TYPES
+    }
+
+
+def _value(column: str, data_type: str, prefix: str = "") -> str:
+    """집계할 값 식 - real 컬럼은 TEXT 친화도로 저장될 수 있어 문자열 비교가 되지 않도록 CAST"""
+    if data_type == "real":
+        return f"CAST({prefix}{column} AS REAL)"
+    return f"{prefix}{column}"
+
+
+def summary_date_column(board: BoardEntry) -> Optional[str]:
+    """요약 테이블 기준 날짜 컬럼 (설정되지 않았거나 날짜 컬럼이 아니면 None)"""
+    stats = (board.list_meta or {}).get("stats") or {}
+    column = stats.get("summary_date_column")
+    return column if column in date_columns(board) else None
+
+
+def summary_table_name(table: str) -> str:
+    return f"{table}_stats"
+
+
+def _trigger_names(table: str) -> List[str]:
+    return [f"{table}_st_ai", f"{table}_st_au", f"{table}_st_ad"]
+
+
+def bucket_expr(bucket: str, day_expr: str) -> str:
+    """'YYYY-MM-DD' 식 → 버킷 키 식 (week 는 월요일 날짜)"""
+    if bucket == "month":
+        return f"substr({day_expr}, 1, 7)"
+    if bucket == "week":
+        return f"date({day_expr}, '-6 days', 'weekday 1')"
+    return day_expr
+
+
+# ============================================================================
+# 요약 테이블 DDL / 트리거
+# ============================================================================
+
+def _summary_ddl(table: str, columns: List[str]) -> str:
+    parts = ["day TEXT PRIMARY KEY", "n INTEGER NOT NULL"]
+    for c in columns:
+        parts += [f"{c}_n INTEGER NOT NULL", f"{c}_sum REAL NOT NULL", f"{c}_min", f"{c}_max"]
+    return f"CREATE TABLE {summary_table_name(table)} ({', '.join(parts)}) WITHOUT ROWID"
+
+
+def _summary_columns(columns: List[str]) -> str:
+    return ", ".join(["day", "n"] + [f"{c}_{k}" for c in columns for k in ("n", "sum", "min", "max")])
+
+
+def _row_aggregates(types: Dict[str, str]) -> str:
+    """물리 테이블 행 → (n, c_n, c_sum, c_min, c_max ...) 집계 식"""
+    parts = ["count(*)"]
+    for c, data_type in types.items():
+        v = _value(c, data_type)
+        parts += [f"count({v})", f"total({v})", f"min({v})", f"max({v})"]
+    return ", ".join(parts)
+
+
+def _recompute_day_sql(table: str, date_column: str, types: Dict[str, str], day: str) -> str:
+    """하루분 요약 행 재계산 (날짜 컬럼 인덱스로 구간 탐색)"""
+    summary = summary_table_name(table)
+    target = _summary_columns(list(types))
+    aggregates = _row_aggregates(types)
+    return (
+        f"DELETE FROM {summary} WHERE day = {day}; "
+        f"INSERT INTO {summary} ({target}) SELECT {day}, {aggregates} FROM {table} "
+        f"WHERE {day} <> '' AND {date_column} BETWEEN {day} AND {day} || '{DAY_UPPER_SUFFIX}' HAVING count(*) > 0; "
+        f"INSERT INTO {summary} ({target}) SELECT {day}, {aggregates} FROM {table} "
+        f"WHERE {day} = '' AND {date_column} IS NULL HAVING count(*) > 0;"
+    )
+
+
+def _trigger_sql(board: BoardEntry) -> Dict[str, str]:
+    """요약 테이블 + 트리거 DDL (이름 → SQL). 요약 기능이 꺼져 있으면 빈 dict"""
+    date_column = summary_date_column(board)
+    if date_column is None:
+        return {}
+
+    table = board.physical_table_name
+    summary = summary_table_name(table)
+    types = _numeric_types(board)
+    columns = list(types)
+    ai, au, ad = _trigger_names(table)
+    new_day = f"coalesce(substr(new.{date_column}, 1, 10), '')"
+    old_day = f"coalesce(substr(old.{date_column}, 1, 10), '')"
+
+    # INSERT: 해당 날짜 행에 증분 반영 (min/max 는 NULL 을 건너뛰도록 coalesce)
+    values = [new_day, "1"]
+    updates = ["n = n + 1"]
+    for c, data_type in types.items():
+        v = _value(c, data_type, "new.")
+        values += [f"new.{c} IS NOT NULL", f"coalesce({v}, 0)", v, v]
+        updates += [
+            f"{c}_n = {c}_n + excluded.{c}_n",
+            f"{c}_sum = {c}_sum + excluded.{c}_sum",
+            f"{c}_min = min(coalesce({c}_min, excluded.{c}_min), coalesce(excluded.{c}_min, {c}_min))",
+            f"{c}_max = max(coalesce({c}_max, excluded.{c}_max), coalesce(excluded.{c}_max, {c}_max))",
+        ]
+    upsert = (
+        f"INSERT INTO {summary} ({_summary_columns(columns)}) VALUES ({', '.join(values)}) "
+        f"ON CONFLICT(day) DO UPDATE SET {', '.join(updates)};"
+    )
+    watched = ", ".join([date_column] + columns)
+    return {
+        summary: _summary_ddl(table, columns),
+        ai: f"CREATE TRIGGER {ai} AFTER INSERT ON {table} BEGIN {upsert} END",
+        # UPDATE/DELETE: min/max 는 감산할 수 없으므로 영향받은 날짜만 다시 집계
+        au: (
+            f"CREATE TRIGGER {au} AFTER UPDATE OF {watched} ON {table} BEGIN "
+            f"{_recompute_day_sql(table, date_column, types, old_day)} "
+            f"{_recompute_day_sql(table, date_column, types, new_day)} END"
+        ),
+        ad: (
+            f"CREATE TRIGGER {ad} AFTER DELETE ON {table} BEGIN "
+            f"{_recompute_day_sql(table, date_column, types, old_day)} END"
+        ),
+    }
+
+
+def _existing_objects(conn: sqlite3.Connection, table: str) -> Dict[str, str]:
+    names = [summary_table_name(table)] + _trigger_names(table)
+    cursor = conn.cursor()
+    cursor.execute(
+        f"SELECT name, sql FROM sqlite_master WHERE name IN ({', '.join('?' * len(names))})",
+        names
+    )
+    return {name: sql for name, sql in cursor.fetchall()}
+
+
+def drop_summary(conn: sqlite3.Connection, table: str) -> None:
+    """요약 테이블 + 트리거 삭제 (커밋은 호출자)"""
+    cursor = conn.cursor()
+    for name in _trigger_names(table):
+        cursor.execute(f"DROP TRIGGER IF EXISTS {name}")
+    cursor.execute(f"DROP TABLE IF EXISTS {summary_table_name(table)}")
+
+
+def rebuild_summary(conn: sqlite3.Connection, board: BoardEntry) -> int:
+    """요약 테이블을 물리 테이블에서 다시 계산 (커밋은 호출자). 요약 행(일) 수 반환"""
+    table = board.physical_table_name
+    date_column = summary_date_column(board)
+    types = _numeric_types(board)
+    day = f"coalesce(substr({date_column}, 1, 10), '')"
+
+    cursor = conn.cursor()
+    cursor.execute(f"DELETE FROM {summary_table_name(table)}")
+    cursor.execute(
+        f"INSERT INTO {summary_table_name(table)} ({_summary_columns(list(types))}) "
+        f"SELECT {day}, {_row_aggregates(types)} FROM {table} GROUP BY 1"
+    )
+    return cursor.rowcount
+
+
+def reconcile_summary(conn: sqlite3.Connection, board: BoardEntry) -> Dict[str, Any]:
+    """메타데이터에 맞춰 요약 테이블/트리거 생성·재생성·삭제 (DDL 이 바뀌면 재계산)"""
+    table = board.physical_table_name
+    cursor = conn.cursor()
+    cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (table,))
+    if cursor.fetchone() is None:
+        return {"action": "none"}
+
+    expected = _trigger_sql(board)
+    existing = _existing_objects(conn, table)
+    if existing == expected:
+        return {"action": "none"}
+
+    try:
+        drop_summary(conn, table)
+        if not expected:
+            conn.commit()
+            logger.info(f"[RECORD-STATS] summary dropped: board_id={board.board_id}")
+            return {"action": "dropped"}
+        for sql in expected.values():
+            cursor.execute(sql)
+        days = rebuild_summary(conn, board)
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    logger.info(f"[RECORD-STATS] summary rebuilt: board_id={board.board_id}, days={days}")
+    return {"action": "rebuilt", "days": days}
+
+
+def summary_available(conn: sqlite3.Connection, board: BoardEntry) -> bool:
+    if summary_date_column(board) is None:
+        return False
+    cursor = conn.cursor()
+    cursor.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?",
+        (summary_table_name(board.physical_table_name),)
+    )
+    return cursor.fetchone() is not None
+
+
+# ============================================================================
+# 집계 조회
+# ============================================================================
+
+def _summary_aggregates(columns: List[str]) -> str:
+    """요약 행 → 물리 테이블 집계와 같은 모양의 재집계 식"""
+    parts = ["total(n)"]
+    for c in columns:
+        parts += [f"total({c}_n)", f"total({c}_sum)", f"min({c}_min)", f"max({c}_max)"]
+    return ", ".join(parts)
+
+
+def _format_aggregates(row, columns: List[str], integer_columns: set) -> Dict[str, Any]:
+    """(n, c_n, c_sum, c_min, c_max ...) → {count, columns: {c: {count, min, max, avg, sum}}}"""
+    result: Dict[str, Any] = {"count": int(row[0] or 0), "columns": {}}
+    for i, c in enumerate(columns):
+        count, total, low, high = row[1 + i * 4: 5 + i * 4]
+        count = int(count or 0)
+        if c in integer_columns:
+            total = int(total)
+        result["columns"][c] = {
+            "count": count,
+            "min": low,
+            "max": high,
+            "avg": total / count if count else None,
+            "sum": total if count else None,
+        }
+    return result
+
+
+def compute_stats(
+    conn: sqlite3.Connection,
+    board: BoardEntry,
+    lq: ListQuery,
+    date_column: Optional[str] = None,
+    bucket: str = "day",
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+) -> Dict[str, Any]:
+    """수치 컬럼 통계 + (날짜 컬럼이 있으면) 버킷별 집계
+
+    start/end 는 'YYYY-MM-DD' 날짜 범위 (date_column 기준, 양 끝 포함).
+    검색어가 없고 date_column 이 요약 기준 컬럼이면 요약 테이블에서 계산한다.
+    """
+    table = board.physical_table_name
+    types = _numeric_types(board)
+    columns = list(types)
+    integer_columns = {c for c, data_type in types.items() if data_type == "integer"}
+    date_column = date_column or summary_date_column(board) or next(iter(date_columns(board)), None)
+    if date_column is not None and date_column not in date_columns(board):
+        raise ValueError(f"Not a date column: {date_column}")
+    if bucket not in BUCKETS:
+        raise ValueError(f"Unsupported bucket: {bucket}")
+    if (start or end) and date_column is None:
+        raise ValueError("start/end requires a date column")
+
+    use_summary = (
+        not lq.search
+        and date_column is not None
+        and date_column == summary_date_column(board)
+        and summary_available(conn, board)
+    )
+
+    conditions: List[str] = []
+    params: List[Any] = []
+    if use_summary:
+        source = summary_table_name(table)
+        aggregates = _summary_aggregates(columns)
+        day = "day"
+        series_condition = "day <> ''"
+        if start:
+            conditions.append("day >= ?")
+            params.append(start)
+        if end:
+            conditions.append("day <= ?")
+            params.append(end)
+    else:
+        source = table
+        aggregates = _row_aggregates(types)
+        where, where_params = build_where(lq)
+        if where:
+            conditions.append(where[len("WHERE "):])
+            params.extend(where_params)
+        day = f"substr({date_column}, 1, 10)" if date_column else None
+        series_condition = f"{date_column} IS NOT NULL" if date_column else None
+        if start:
+            conditions.append(f"{date_column} >= ?")
+            params.append(start)
+        if end:
+            conditions.append(f"{date_column} <= ?")
+            params.append(end + DAY_UPPER_SUFFIX)
+
+    where_sql = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+    cursor = conn.cursor()
+    cursor.execute(f"SELECT {aggregates} FROM {source} {where_sql}", params)
+    result: Dict[str, Any] = _format_aggregates(cursor.fetchone(), columns, integer_columns)
+    result["source"] = "summary" if use_summary else "table"
+
+    if date_column is None:
+        result["series"] = None
+        return result
+
+    key = bucket_expr(bucket, day)
+    series_where = " AND ".join(conditions + [series_condition])
+    cursor.execute(
+        f"SELECT {key} AS bucket, {aggregates} FROM {source} WHERE {series_where} "
+        f"GROUP BY bucket ORDER BY bucket",
+        params
+    )
+    result["series"] = {
+        "date_column": date_column,
+        "bucket": bucket,
+        "buckets": [
+            {"bucket": row[0], **_format_aggregates(tuple(row)[1:], columns, integer_columns)}
+            for row in cursor.fetchall()
+        ],
+    }
+    return result
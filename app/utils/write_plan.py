@@ -0,0 +1,93 @@
+# write_plan.py
+"""
+모듈 설명:
+    - 보드별 레코드 쓰기 계획 (컴파일 후 캐시)
+주요 기능:
+    - table 메타데이터에서 1회 생성: 컬럼 화이트리스트, data_type 별 변환 함수, 고정 INSERT/UPDATE 문
+    - UPDATE 는 컬럼마다 CASE 플래그를 두어 부분 수정도 항상 같은 SQL 문 (sqlite statement cache hit)
+    - 알 수 없는 컬럼 / 변환 실패는 SQLite 에 보내기 전에 WritePlanError
+    - BoardRegistry 항목이 바뀌면 (메타데이터 변경 → invalidate) 다시 컴파일
+
+작성자: 김도영
+작성일: 2026-10-18
+버전: 1.0
+"""
+import threading
+from typing import Any, Callable, Dict, List, Tuple
+
+from app.core.board_registry import BoardEntry
+from app.utils.coerce import get_coercer
+from app.utils.record_query import SYSTEM_COLUMNS
+
+
+class WritePlanError(ValueError):
+    """쓰기 값 검증 실패 (알 수 없는 컬럼, 형 변환 실패)"""
+
+    def __init__(self, errors: List[str]):
+        super().__init__("; ".join(errors))
+        self.errors = errors
+
+
+class WritePlan:
+    """보드 1개의 컴파일된 쓰기 계획"""
+
+    def __init__(self, board: BoardEntry):
+        table = board.physical_table_name
+        self.columns: Tuple[str, ...] = tuple(col["name"] for col in board.columns if col.get("name"))
+        self.coercers: Dict[str, Callable[[Any], Any]] = {
+            col["name"]: get_coercer(col.get("data_type", "string"))
+            for col in board.columns if col.get("name")
+        }
+
+        placeholders = ", ".join("?" * len(self.columns))
+        self.insert_sql = f"INSERT INTO {table} ({', '.join(self.columns)}) VALUES ({placeholders})"
+
+        # SET colN = CASE WHEN ?(수정 여부) THEN ?(값) ELSE colN END
+        assignments = [f"{c} = CASE WHEN ? THEN ? ELSE {c} END" for c in self.columns]
+        assignments.append("updated_at = CURRENT_TIMESTAMP")
+        self.update_sql = f"UPDATE {table} SET {', '.join(assignments)} WHERE id = ?"
+
+    def coerce(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """입력 dict 검증 + 변환 (시스템 컬럼은 무시)"""
+        values: Dict[str, Any] = {}
+        errors: List[str] = []
+        for key, raw in data.items():
+            if key in SYSTEM_COLUMNS:
+                continue
+            convert = self.coercers.get(key)
+            if convert is None:
+                errors.append(f"Unknown column: {key}")
+                continue
+            try:
+                values[key] = convert(raw)
+            except (TypeError, ValueError) as e:
+                errors.append(f"{key}: {e}")
+        if errors:
+            raise WritePlanError(errors)
+        return values
+
+    def insert_params(self, values: Dict[str, Any]) -> tuple:
+        return tuple(values.get(c) for c in self.columns)
+
+    def update_params(self, values: Dict[str, Any], record_id: int) -> tuple:
+        params: List[Any] = []
+        for c in self.columns:
+            params.extend((c in values, values.get(c)))
+        params.append(record_id)
+        return tuple(params)
+
+
+_plans: Dict[int, Tuple[BoardEntry, WritePlan]] = {}
+_lock = threading.Lock()
+
+
+def get_write_plan(board: BoardEntry) -> WritePlan:
+    """registry 항목(BoardEntry)별로 1회 컴파일. 항목이 교체되면 새로 컴파일"""
+    with _lock:
+        cached = _plans.get(board.board_id)
+        if cached is not None and cached[0] is board:
+            return cached[1]
+    plan = WritePlan(board)
+    with _lock:
+        _plans[board.board_id] = (board, plan)
+    return plan
@@ -30,6 +30,40 @@ def db_connection():
     except Exception as e:
         pytest.fail(f"Failed to initialize test DB from SQL file: {e}")
     
+    # 전역 레지스트리는 DB 마다 새로 채움 (다른 테스트의 in-memory DB 항목이 남지 않도록)
+    from app.core.board_registry import board_registry
+    board_registry.clear()
+
     yield conn
     
+    board_registry.clear()
     conn.close()
+
+
+@pytest.fixture
+def board_entry():
+    """테스트용 BoardEntry 팩토리 (registry / meta_data 를 거치지 않음)
+
+    board_entry(columns, list_meta=None, conn=None, board_id=1, name="Mock")
+    - columns: 컬럼 정의 dict 목록 (컬럼명 문자열만 줘도 됨, data_type 생략 시 string)
+    - conn 을 주면 물리 테이블 table_<board_id> 도 생성 (id, 컬럼, created_at, updated_at)
+    """
+    from app.core.board_registry import BoardEntry, freeze
+    from app.utils.db_manager import map_sqlite_type
+
+    def make(columns, list_meta=None, conn=None, board_id=1, name="Mock"):
+        columns = [{"name": col} if isinstance(col, str) else col for col in columns]
+        table = f"table_{board_id}"
+        if conn is not None:
+            ddl = ", ".join(f"{col['name']} {map_sqlite_type(col.get('data_type', 'string'))}" for col in columns)
+            conn.execute(
+                f"CREATE TABLE {table} (id INTEGER PRIMARY KEY AUTOINCREMENT, {ddl}, "
+                f"created_at DATETIME DEFAULT CURRENT_TIMESTAMP, updated_at DATETIME DEFAULT CURRENT_TIMESTAMP)"
+            )
+        return BoardEntry(
+            info=freeze({"id": board_id, "name": name, "physical_table_name": table}),
+            table_meta=freeze({"columns": columns}),
+            list_meta=freeze(list_meta) if list_meta is not None else None,
+        )
+
+    return make
@@ -0,0 +1,45 @@
+import asyncio
+
+from app.core.async_db import AsyncDB
+from app.core.db_pool import ConnectionPool
+
+
+def test_async_db_fetch_and_execute(tmp_path):
+    pool = ConnectionPool(str(tmp_path / "async.db"), size=2, timeout=1)
+    db = AsyncDB(pool)
+
+    async def scenario():
+        await db.execute("CREATE TABLE t (id INTEGER PRIMARY KEY, v TEXT)")
+        result = await db.execute("INSERT INTO t (v) VALUES (?)", ("a",))
+        assert result.lastrowid == 1
+        assert result.rowcount == 1
+
+        assert await db.fetch_one("SELECT * FROM t WHERE id = ?", (1,)) == {"id": 1, "v": "a"}
+        assert await db.fetch_one("SELECT * FROM t WHERE id = ?", (2,)) is None
+        assert await db.fetch_all("SELECT v FROM t") == [{"v": "a"}]
+        assert await db.fetch_value("SELECT COUNT(*) FROM t") == 1
+
+    asyncio.run(scenario())
+    db.shutdown()
+    pool.close()
+
+
+def test_async_db_transaction_rolls_back(tmp_path):
+    pool = ConnectionPool(str(tmp_path / "async.db"), size=2, timeout=1)
+    db = AsyncDB(pool)
+
+    def failing(conn):
+        conn.execute("INSERT INTO t (v) VALUES ('x')")
+        raise ValueError("boom")
+
+    async def scenario():
+        await db.execute("CREATE TABLE t (id INTEGER PRIMARY KEY, v TEXT)")
+        try:
+            await db.transaction(failing)
+        except ValueError:
+            pass
+        assert await db.fetch_value("SELECT COUNT(*) FROM t") == 0
+
+    asyncio.run(scenario())
+    db.shutdown()
+    pool.close()
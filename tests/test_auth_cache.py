@@ -0,0 +1,45 @@
+from datetime import datetime, timedelta
+
+from app.core.auth_cache import AuthCache
+from app.core.security import create_access_token
+from app.schemas.user import User
+
+
+def _user(username="admin"):
+    now = datetime.now()
+    return User(id=1, username=username, created_at=now, updated_at=now)
+
+
+def test_verify_token_is_cached_until_exp():
+    cache = AuthCache(user_ttl=60)
+    token = create_access_token({"sub": "admin"}, expires_delta=timedelta(minutes=5))
+
+    assert cache.verify_token(token) == "admin"
+    assert cache.verify_token(token) == "admin"
+    assert cache.stats()["token_misses"] == 1
+    assert cache.stats()["token_hits"] == 1
+
+    assert cache.verify_token("not-a-jwt") is None
+
+
+def test_expired_token_is_rejected():
+    cache = AuthCache(user_ttl=60)
+    token = create_access_token({"sub": "admin"}, expires_delta=timedelta(seconds=-1))
+    assert cache.verify_token(token) is None
+
+
+def test_user_cache_ttl_and_invalidation():
+    cache = AuthCache(user_ttl=60)
+    token = create_access_token({"sub": "admin"})
+    cache.verify_token(token)
+    cache.put_user(_user())
+
+    assert cache.get_user("admin").username == "admin"
+
+    cache.invalidate_user("admin")
+    assert cache.get_user("admin") is None
+    assert cache.stats()["tokens"] == 0
+
+    expired = AuthCache(user_ttl=0)
+    expired.put_user(_user())
+    assert expired.get_user("admin") is None
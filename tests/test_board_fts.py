@@ -0,0 +1,54 @@
+from app.utils.board_fts import index_records, reconcile_fts, search_fts
+from app.utils.html_text import strip_html
+
+
+COLUMNS = [
+    {"name": "col1", "data_type": "string"},
+    {"name": "col2", "data_type": "text"},
+    {"name": "col3", "data_type": "integer"},
+]
+
+
+def _setup(conn, board_entry):
+    board = board_entry(COLUMNS, {"search": {"enabled": True, "fulltext": True}}, conn=conn)
+    conn.execute("INSERT INTO table_1 (col1, col2, col3) VALUES ('기존 일기', '<p>오늘은 <b>혈압을</b> 쟀다</p>', 1)")
+    conn.commit()
+    return board
+
+
+def test_strip_html():
+    assert strip_html("<p>a &amp; b</p><p>c<br>d</p>") == "a & b c d"
+    assert strip_html("plain") == "plain"
+    assert strip_html(None) is None
+
+
+def test_fts_rebuilds_existing_rows_and_follows_triggers(db_connection, board_entry):
+    board = _setup(db_connection, board_entry)
+    assert reconcile_fts(db_connection, board) == {"action": "rebuilt", "rows": 1}
+
+    results = search_fts(db_connection, board, "혈압")
+    assert [r["id"] for r in results] == [1]
+    assert "<mark>혈압을</mark>" in results[0]["snippet"]
+    assert "<p>" not in results[0]["snippet"]
+
+    # 트리거는 내장 SQL 만 사용 (앱 함수가 등록되지 않은 커넥션에서도 쓰기 가능) → 대기열에 기록
+    db_connection.execute("INSERT INTO table_1 (col1, col2) VALUES ('혈압 기록', '혈압 혈압 <script>x</script>')")
+    db_connection.execute("UPDATE table_1 SET col2 = '운동' WHERE id = 1")
+    pending = db_connection.execute("SELECT board_id, record_id FROM search_pending ORDER BY record_id").fetchall()
+    assert [tuple(row) for row in pending] == [(1, 1), (1, 2)]
+    index_records(db_connection, "table_1", [1, 2])
+    assert [r["id"] for r in search_fts(db_connection, board, "혈압")] == [2]
+    db_connection.execute("DELETE FROM table_1 WHERE id = 2")
+    assert search_fts(db_connection, board, "혈압") == []
+
+    # 이미 최신이면 아무것도 하지 않고, 끄면 삭제
+    assert reconcile_fts(db_connection, board) == {"action": "none"}
+    disabled = board_entry(COLUMNS, {"search": {"enabled": True, "fulltext": False}})
+    assert reconcile_fts(db_connection, disabled) == {"action": "dropped"}
+
+
+def test_search_query_is_quoted(db_connection, board_entry):
+    board = _setup(db_connection, board_entry)
+    reconcile_fts(db_connection, board)
+    assert search_fts(db_connection, board, 'col1:"  OR NEAR(') == []
+    assert search_fts(db_connection, board, "   ") == []
@@ -0,0 +1,30 @@
+from app.utils.board_indexes import explain_list_query, list_managed_indexes, reconcile_indexes
+
+
+COLUMNS = ["col1", "col2", {"name": "col3", "data_type": "integer"}]
+
+
+def test_reconcile_creates_and_drops_managed_indexes(db_connection, board_entry):
+    board = board_entry(COLUMNS, {
+        "default_sort": [{"column": "col2", "order": "desc"}],
+        "search": {"advanced_fields": [
+            {"name": "col1", "search_type": "text"},
+            {"name": "col3", "search_type": "select"},
+        ]},
+    }, conn=db_connection)
+    db_connection.execute("CREATE INDEX my_own_index ON table_1 (col1)")
+    result = reconcile_indexes(db_connection, board)
+    assert result == {"created": ["ix_table_1_auto_col2", "ix_table_1_auto_col3"], "dropped": []}
+    assert "ix_table_1_auto_col2" in " ".join(explain_list_query(db_connection, board)["plan"])
+
+    result = reconcile_indexes(db_connection, board_entry(COLUMNS, {"default_sort": [{"column": "col3", "order": "asc"}]}))
+    assert result == {"created": [], "dropped": ["ix_table_1_auto_col2"]}
+    assert [idx["column"] for idx in list_managed_indexes(db_connection, "table_1")] == ["col3"]
+
+    # 규칙 밖의 인덱스는 건드리지 않음
+    names = [r[0] for r in db_connection.execute("SELECT name FROM sqlite_master WHERE type = 'index'")]
+    assert "my_own_index" in names
+
+
+def test_reconcile_skips_missing_table(db_connection, board_entry):
+    assert reconcile_indexes(db_connection, board_entry(COLUMNS, {})) == {"created": [], "dropped": []}
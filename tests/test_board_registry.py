@@ -0,0 +1,60 @@
+import json
+
+import pytest
+
+from app.core.board_registry import BoardRegistry, board_registry
+from app.utils.db_manager import DBManager
+
+
+def _insert_board(conn):
+    cursor = conn.cursor()
+    cursor.execute("INSERT INTO boards (name, physical_table_name) VALUES ('Mock', 'table_1')")
+    board_id = cursor.lastrowid
+    table_meta = {"columns": [{"name": "col1", "label": "제목", "data_type": "string"}]}
+    cursor.execute(
+        "INSERT INTO meta_data (board_id, name, meta, schema) VALUES (?, ?, ?, ?)",
+        (board_id, "table", json.dumps(table_meta), "v1")
+    )
+    conn.commit()
+    return board_id
+
+
+def test_registry_loads_lazily_and_counts_hits(db_connection):
+    board_id = _insert_board(db_connection)
+    registry = BoardRegistry()
+
+    entry = registry.get(db_connection, board_id)
+    assert entry.info["name"] == "Mock"
+    assert entry.columns[0]["name"] == "col1"
+    assert entry.list_meta is None
+
+    assert registry.get(db_connection, board_id) is entry
+    assert registry.stats()["misses"] == 1
+    assert registry.stats()["hits"] == 1
+
+    assert registry.get(db_connection, 99999) is None
+
+
+def test_registry_entries_are_immutable(db_connection):
+    board_id = _insert_board(db_connection)
+    entry = BoardRegistry().get(db_connection, board_id)
+
+    with pytest.raises(TypeError):
+        entry.table_meta["columns"] = []
+    with pytest.raises(TypeError):
+        entry.columns[0]["label"] = "changed"
+    assert json.loads(json.dumps(entry.table_meta)) == {
+        "columns": [{"name": "col1", "label": "제목", "data_type": "string"}]
+    }
+
+
+def test_save_metadata_invalidates_registry(db_connection):
+    board_id = _insert_board(db_connection)
+    entry = board_registry.get(db_connection, board_id)
+    assert entry.list_meta is None
+
+    DBManager(db_connection).save_metadata(board_id, "list", {"pagination": {"page_size": 5}})
+
+    entry = board_registry.get(db_connection, board_id)
+    assert entry.list_meta["pagination"]["page_size"] == 5
+    board_registry.invalidate(board_id)
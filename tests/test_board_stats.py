@@ -0,0 +1,57 @@
+from app.utils.board_stats import backfill_counters, get_board_stats, install_counters, record_count
+
+
+def _create_board(conn, board_id, rows=0):
+    table = f"table_{board_id}"
+    conn.execute("INSERT INTO boards (id, name, physical_table_name) VALUES (?, ?, ?)", (board_id, "b", table))
+    conn.execute(
+        f"CREATE TABLE {table} (id INTEGER PRIMARY KEY AUTOINCREMENT, col1 TEXT, "
+        f"created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP, updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP)"
+    )
+    conn.executemany(f"INSERT INTO {table} (col1) VALUES (?)", [(str(i),) for i in range(rows)])
+    return table
+
+
+def test_triggers_maintain_counts(db_connection):
+    table = _create_board(db_connection, 1)
+    install_counters(db_connection, 1, table)
+    assert get_board_stats(db_connection, 1)["row_count"] == 0
+
+    db_connection.executemany(f"INSERT INTO {table} (col1) VALUES (?)", [("a",), ("b",), ("c",)])
+    db_connection.execute(f"UPDATE {table} SET col1 = 'z' WHERE id = 1")
+    db_connection.execute(f"DELETE FROM {table} WHERE id = 2")
+
+    stats = get_board_stats(db_connection, 1)
+    assert stats["row_count"] == 2
+    assert stats["last_insert_at"] is not None and stats["last_update_at"] is not None
+    assert record_count(db_connection, 1, table) == 2
+
+
+def test_backfill_existing_boards(db_connection):
+    table = _create_board(db_connection, 2, rows=5)
+    # 카운터가 없으면 COUNT(*) 로 대체
+    assert record_count(db_connection, 2, table) == 5
+
+    assert backfill_counters(db_connection) == [2]
+    assert get_board_stats(db_connection, 2)["row_count"] == 5
+    assert backfill_counters(db_connection) == []
+
+    db_connection.execute(f"INSERT INTO {table} (col1) VALUES ('x')")
+    assert record_count(db_connection, 2, table) == 6
+
+
+def test_data_version_bumps_on_writes_and_metadata(db_connection):
+    table = _create_board(db_connection, 3)
+    install_counters(db_connection, 3, table)
+    versions = [get_board_stats(db_connection, 3)["data_version"]]
+
+    db_connection.execute(f"INSERT INTO {table} (col1) VALUES ('a')")
+    versions.append(get_board_stats(db_connection, 3)["data_version"])
+    db_connection.execute(
+        "INSERT INTO meta_data (board_id, name, meta, schema) VALUES (3, 'list', '{}', 'v1')"
+    )
+    versions.append(get_board_stats(db_connection, 3)["data_version"])
+    db_connection.execute("UPDATE boards SET name = 'renamed' WHERE id = 3")
+    versions.append(get_board_stats(db_connection, 3)["data_version"])
+
+    assert versions == sorted(set(versions))
@@ -0,0 +1,14 @@
+import pytest
+
+from app.utils.coerce import get_coercer
+
+
+def test_numbers_accept_separators_and_reject_garbage_in_korean():
+    to_int, to_real = get_coercer("integer"), get_coercer("real")
+    assert (to_int("1,200"), to_int("3.0"), to_real("1,234.5"), to_real(" ")) == (1200, 3, 1234.5, None)
+
+    for coerce, value in ((to_int, "xx"), (to_real, "xx"), (to_real, "nan"), (to_real, "inf"), (to_real, float("inf"))):
+        with pytest.raises(ValueError, match="^숫자가 아닙니다: "):
+            coerce(value)
+    with pytest.raises(ValueError, match="^정수가 아닙니다: 1.5$"):
+        to_int("1.5")
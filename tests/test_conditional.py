@@ -0,0 +1,39 @@
+from email.utils import formatdate
+
+from starlette.requests import Request
+
+from app.utils.conditional import etag_matches, make_etag, not_modified_since
+
+
+def _request(if_none_match=None, if_modified_since=None):
+    headers = [(b"if-none-match", if_none_match.encode())] if if_none_match else []
+    if if_modified_since:
+        headers.append((b"if-modified-since", if_modified_since.encode()))
+    return Request({"type": "http", "method": "GET", "path": "/", "query_string": b"", "headers": headers})
+
+
+def test_make_etag_depends_on_version_and_parts():
+    etag = make_etag(1, 5, "/records/api/1/", "page=2")
+    assert etag.startswith('W/"1.5.')
+    assert etag == make_etag(1, 5, "/records/api/1/", "page=2")
+    assert etag != make_etag(1, 6, "/records/api/1/", "page=2")
+    assert etag != make_etag(1, 5, "/records/api/1/", "page=3")
+
+
+def test_etag_matches_weak_comparison():
+    etag = make_etag(1, 5)
+    assert etag_matches(_request(etag), etag)
+    assert etag_matches(_request(f'"other", {etag.removeprefix("W/")}'), etag)
+    assert etag_matches(_request("*"), etag)
+    assert not etag_matches(_request(make_etag(1, 6)), etag)
+    assert not etag_matches(_request(), etag)
+    assert not etag_matches(_request(etag), None)
+
+
+def test_not_modified_since():
+    mtime = 1_700_000_000.5
+    assert not_modified_since(_request(if_modified_since=formatdate(mtime, usegmt=True)), mtime)
+    assert not not_modified_since(_request(if_modified_since=formatdate(mtime - 60, usegmt=True)), mtime)
+    assert not not_modified_since(_request(if_modified_since="garbage"), mtime)
+    # If-None-Match 가 있으면 ETag 비교가 우선
+    assert not not_modified_since(_request('"x"', formatdate(mtime, usegmt=True)), mtime)
@@ -0,0 +1,53 @@
+import threading
+
+import pytest
+
+from app.core.db_pool import ConnectionPool
+
+
+def test_pool_reuses_tuned_connection(tmp_path):
+    pool = ConnectionPool(str(tmp_path / "pool.db"), size=2, timeout=1)
+
+    conn = pool.acquire()
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+    assert conn.execute("PRAGMA temp_store").fetchone()[0] == 2  # MEMORY
+    assert conn.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+    pool.release(conn)
+
+    # 반납된 커넥션이 재사용되어야 함
+    assert pool.acquire() is conn
+    pool.release(conn)
+
+    stats = pool.stats()
+    assert stats["created"] == 1
+    assert stats["checkouts"] == 2
+    pool.close()
+
+
+def test_pool_rolls_back_on_release(tmp_path):
+    pool = ConnectionPool(str(tmp_path / "pool.db"), size=1, timeout=1)
+
+    with pool.connection() as conn:
+        conn.execute("CREATE TABLE t (v INTEGER)")
+        conn.commit()
+        conn.execute("INSERT INTO t VALUES (1)")  # 커밋하지 않음
+
+    with pool.connection() as conn:
+        assert conn.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 0
+    pool.close()
+
+
+def test_pool_waits_then_times_out(tmp_path):
+    pool = ConnectionPool(str(tmp_path / "pool.db"), size=1, timeout=0.2)
+    conn = pool.acquire()
+
+    with pytest.raises(TimeoutError):
+        pool.acquire()
+
+    # 다른 스레드가 반납하면 대기 중인 checkout이 성공
+    threading.Timer(0.05, pool.release, args=(conn,)).start()
+    assert pool.acquire() is conn
+    assert pool.stats()["wait_max_ms"] > 0
+    pool.release(conn)
+    pool.close()
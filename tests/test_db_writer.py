@@ -0,0 +1,90 @@
+import asyncio
+import sqlite3
+
+import pytest
+
+from app.core.db_pool import create_connection
+from app.core.db_writer import DBWriter
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = str(tmp_path / "writer.db")
+    conn = create_connection(path)
+    conn.execute("CREATE TABLE t (id INTEGER PRIMARY KEY AUTOINCREMENT, v INTEGER UNIQUE)")
+    conn.commit()
+    conn.close()
+    return path
+
+
+def test_writer_groups_burst_into_few_commits(db_path):
+    writer = DBWriter(db_path, batch_size=32, commit_latency_ms=5)
+
+    async def scenario():
+        await writer.start()
+        results = await asyncio.gather(
+            *[writer.execute("INSERT INTO t (v) VALUES (?)", (i,)) for i in range(100)]
+        )
+        await writer.stop()
+        return results
+
+    results = asyncio.run(scenario())
+
+    assert sorted(r.lastrowid for r in results) == list(range(1, 101))
+    stats = writer.stats()
+    assert stats["intents"] == 100
+    assert stats["batches"] < 100
+    assert stats["max_batch"] <= 32
+
+
+def test_writer_failure_is_isolated(db_path):
+    writer = DBWriter(db_path, batch_size=8, commit_latency_ms=5)
+
+    async def scenario():
+        await writer.start()
+        results = await asyncio.gather(
+            writer.execute("INSERT INTO t (v) VALUES (1)"),
+            writer.execute("INSERT INTO t (v) VALUES (1)"),  # UNIQUE 위반
+            writer.execute("INSERT INTO t (v) VALUES (2)"),
+            return_exceptions=True,
+        )
+        await writer.stop()
+        return results
+
+    ok1, failed, ok2 = asyncio.run(scenario())
+
+    assert isinstance(failed, sqlite3.IntegrityError)
+    assert ok1.rowcount == 1 and ok2.rowcount == 1
+
+    conn = sqlite3.connect(db_path)
+    assert conn.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 2
+    conn.close()
+
+
+def test_commit_hook_runs_in_batch_and_failure_keeps_writes(db_path):
+    writer = DBWriter(db_path, batch_size=8, commit_latency_ms=5)
+    seen = []
+
+    def record_count(conn):
+        seen.append(conn.execute("SELECT COUNT(*) FROM t").fetchone()[0])
+        conn.execute("INSERT INTO t (v) VALUES (100)")
+
+    def broken(conn):
+        conn.execute("INSERT INTO t (v) VALUES (200)")
+        raise RuntimeError("hook failed")
+
+    writer.add_commit_hook(record_count)
+    writer.add_commit_hook(broken)
+
+    async def scenario():
+        await writer.start()
+        await writer.execute("INSERT INTO t (v) VALUES (1)")
+        await writer.stop()
+
+    asyncio.run(scenario())
+
+    # hook 은 같은 트랜잭션에서 쓰기 결과를 보고, 실패한 hook 의 변경만 롤백
+    assert seen == [1]
+    conn = sqlite3.connect(db_path)
+    assert [row[0] for row in conn.execute("SELECT v FROM t ORDER BY v")] == [1, 100]
+    conn.close()
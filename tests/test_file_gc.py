@@ -0,0 +1,87 @@
+import os
+import time
+
+from app.utils.file_gc import collect_garbage
+from app.utils.file_store import derivative_path, ensure_schema, failure_marker_path
+
+
+def _age(path, hours=48):
+    old = time.time() - hours * 3600
+    os.utime(path, (old, old))
+
+
+def test_collect_garbage_reclaims_orphans(db_connection, tmp_path):
+    ensure_schema(db_connection)
+    files_dir = tmp_path / "files"
+    blob_dir = files_dir / "blobs" / "aa"
+    blob_dir.mkdir(parents=True)
+
+    db_connection.execute("INSERT INTO boards (id, name, physical_table_name) VALUES (1, 'b', 'table_1')")
+    db_connection.execute("CREATE TABLE table_1 (id INTEGER PRIMARY KEY AUTOINCREMENT, col1 TEXT)")
+    db_connection.execute("INSERT INTO table_1 (id, col1) VALUES (1, 'x')")
+    for file_id, name in ((1, "kept"), (2, "deleted_record"), (3, "deleted_board"), (4, "never_linked")):
+        (blob_dir / name).write_bytes(b"x" * 10)
+        _age(blob_dir / name)
+        db_connection.execute(
+            "INSERT INTO files (id, base_folder, physical_name, logical_name, size, mime, updated_at) "
+            "VALUES (?, 'blobs/aa', ?, ?, 10, 'image/png', datetime('now', '-2 days'))",
+            (file_id, name, name)
+        )
+    db_connection.executemany(
+        "INSERT INTO file_match (board_id, table_id, file_id) VALUES (?, ?, ?)",
+        [(1, 1, 1), (1, 99, 2), (7, 1, 3)]
+    )
+    # 원본이 남는 썸네일은 유지, DB 행 없는 파일 / 오래된 임시 파일은 삭제
+    derivative_path(blob_dir / "kept", "thumb").write_bytes(b"t")
+    derivative_path(blob_dir / "never_linked", "thumb").write_bytes(b"tt")
+    failure_marker_path(blob_dir / "never_linked").touch()
+    (blob_dir / "stray").write_bytes(b"s" * 5)
+    _age(blob_dir / "stray")
+    (files_dir / ".incoming").mkdir()
+    (files_dir / ".incoming" / "abc.part").write_bytes(b"p" * 3)
+    _age(files_dir / ".incoming" / "abc.part")
+    # 유예 시간 이내 파일은 건드리지 않음
+    (blob_dir / "fresh").write_bytes(b"f")
+    db_connection.commit()
+
+    # 기본: 연결 없는 files 행(never_linked)은 남김
+    dry = collect_garbage(db_connection, files_dir, grace_seconds=3600, dry_run=True)
+    assert (dry["matches"], dry["files"], dry["blobs"]) == (2, 0, 1)
+    assert len(list(blob_dir.iterdir())) == 9
+
+    dry = collect_garbage(db_connection, files_dir, grace_seconds=3600, dry_run=True, include_unmatched=True)
+    assert (dry["matches"], dry["files"]) == (2, 1)
+
+    result = collect_garbage(db_connection, files_dir, grace_seconds=3600, batch_size=1, include_unmatched=True)
+
+    assert (result["matches"], result["files"], result["blobs"], result["temp"]) == (2, 3, 4, 1)
+    assert not failure_marker_path(blob_dir / "never_linked").exists()
+    assert result["bytes_freed"] == 3 * 10 + 2 + 5 + 3
+    assert sorted(p.name for p in blob_dir.iterdir()) == ["fresh", "kept", "kept.thumb.jpg"]
+    assert [row[0] for row in db_connection.execute("SELECT id FROM files")] == [1]
+    assert collect_garbage(db_connection, files_dir, grace_seconds=3600)["bytes_freed"] == 0
+
+
+def test_collect_garbage_keeps_blob_shared_with_other_rows(db_connection, tmp_path):
+    ensure_schema(db_connection)
+    files_dir = tmp_path / "files"
+    blob_dir = files_dir / "blobs" / "aa"
+    blob_dir.mkdir(parents=True)
+    (blob_dir / "shared").write_bytes(b"x" * 10)
+    _age(blob_dir / "shared")
+    db_connection.execute("INSERT INTO boards (id, name, physical_table_name) VALUES (1, 'b', 'table_1')")
+    db_connection.execute("CREATE TABLE table_1 (id INTEGER PRIMARY KEY AUTOINCREMENT, col1 TEXT)")
+    db_connection.execute("INSERT INTO table_1 (id, col1) VALUES (1, 'x')")
+    db_connection.executemany(
+        "INSERT INTO files (id, base_folder, physical_name, logical_name, size, mime, updated_at) "
+        "VALUES (?, 'blobs/aa', 'shared', ?, 10, 'image/png', datetime('now', '-2 days'))",
+        [(1, "linked.png"), (2, "unlinked.png")]
+    )
+    db_connection.execute("INSERT INTO file_match (board_id, table_id, file_id) VALUES (1, 1, 1)")
+    db_connection.commit()
+
+    result = collect_garbage(db_connection, files_dir, grace_seconds=3600, include_unmatched=True)
+
+    # 연결 없는 행만 삭제, 물리 파일은 남은 행이 참조
+    assert (result["files"], result["blobs"], result["bytes_freed"]) == (1, 0, 0)
+    assert (blob_dir / "shared").exists()
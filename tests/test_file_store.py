@@ -0,0 +1,88 @@
+import hashlib
+import io
+
+import pytest
+
+from app.utils.file_store import (UploadTooLargeError, dedup_existing, ensure_schema, receive_stream, release_file,
+                                  store_blobs, store_stream, unlink_if_unreferenced)
+
+
+def test_store_stream_hashes_in_chunks(tmp_path):
+    data = b"0123456789" * 1000
+    dest = tmp_path / "2026" / "10" / "abc"
+
+    stored = store_stream(io.BytesIO(data), dest, max_bytes=len(data), chunk_size=4096)
+
+    assert stored == {"size": len(data), "sha256": hashlib.sha256(data).hexdigest()}
+    assert dest.read_bytes() == data
+    assert [p.name for p in dest.parent.iterdir()] == ["abc"]
+
+
+def test_store_stream_aborts_over_max_size(tmp_path):
+    dest = tmp_path / "big"
+    with pytest.raises(UploadTooLargeError):
+        store_stream(io.BytesIO(b"x" * 10000), dest, max_bytes=5000, chunk_size=1024)
+
+    # 임시 파일도, 최종 파일도 남지 않음
+    assert list(tmp_path.iterdir()) == []
+
+
+def _receive(tmp_path, data, name="a.bin"):
+    item = receive_stream(io.BytesIO(data), tmp_path / ".incoming")
+    item.update(logical_name=name, mime="application/octet-stream")
+    return item
+
+
+def test_identical_uploads_share_one_blob(db_connection, tmp_path):
+    ensure_schema(db_connection)
+    files_dir = tmp_path / "files"
+    first = store_blobs(db_connection, files_dir, [_receive(tmp_path, b"same"), _receive(tmp_path, b"other")])
+    again = store_blobs(db_connection, files_dir, [_receive(tmp_path, b"same", "copy.bin")])
+
+    # 업로드마다 행(파일명 유지), 물리 파일은 공유
+    assert again[0]["id"] != first[0]["id"] and again[0]["deduplicated"]
+    assert again[0]["physical_name"] == first[0]["physical_name"]
+    names = db_connection.execute("SELECT logical_name FROM files ORDER BY id").fetchall()
+    assert [row[0] for row in names] == ["a.bin", "a.bin", "copy.bin"]
+    assert len([p for p in (files_dir / "blobs").rglob("*") if p.is_file()]) == 2
+    assert list((tmp_path / ".incoming").iterdir()) == []
+
+    # 한 업로드만 삭제 → 그 행의 file_match 만 삭제, 파일 유지 → 마지막 참조 삭제 후 unlink
+    db_connection.execute("INSERT INTO file_match (board_id, table_id, file_id) VALUES (1, 1, ?)", (first[0]["id"],))
+    db_connection.execute("INSERT INTO file_match (board_id, table_id, file_id) VALUES (1, 2, ?)", (again[0]["id"],))
+    released = release_file(db_connection, first[0]["id"])
+    assert released["ref_count"] == 1
+    assert [row[0] for row in db_connection.execute("SELECT file_id FROM file_match")] == [again[0]["id"]]
+    assert unlink_if_unreferenced(db_connection, files_dir, released["base_folder"], released["physical_name"]) == 0
+    released = release_file(db_connection, again[0]["id"])
+    assert released["ref_count"] == 0
+    assert unlink_if_unreferenced(db_connection, files_dir, released["base_folder"], released["physical_name"]) == 4
+    assert release_file(db_connection, first[0]["id"]) is None
+
+
+def test_ensure_schema_replaces_unique_hash_index(db_connection):
+    db_connection.execute("CREATE UNIQUE INDEX idx_files_content_hash ON files(content_hash)")
+    ensure_schema(db_connection)
+    indexes = db_connection.execute("PRAGMA index_list(files)").fetchall()
+    assert [(row[1], row[2]) for row in indexes if row[1] == "idx_files_content_hash"] == [("idx_files_content_hash", 0)]
+
+
+def test_dedup_existing_shares_legacy_blobs(db_connection, tmp_path):
+    files_dir = tmp_path / "files"
+    (files_dir / "2026" / "10").mkdir(parents=True)
+    for name, data in (("a", b"dup"), ("b", b"dup"), ("c", b"solo")):
+        (files_dir / "2026" / "10" / name).write_bytes(data)
+    db_connection.executemany(
+        "INSERT INTO files (id, base_folder, physical_name, logical_name, size, mime) VALUES (?, '2026/10', ?, ?, 3, 'x')",
+        [(1, "a", "a.txt"), (2, "b", "b.txt"), (3, "c", "c.txt")]
+    )
+    db_connection.execute("INSERT INTO file_match (board_id, table_id, file_id) VALUES (1, 1, 2)")
+
+    result = dedup_existing(db_connection, files_dir)
+
+    assert (result["hashed"], result["groups"], result["relinked_rows"], result["bytes_freed"]) == (3, 1, 1, 3)
+    rows = db_connection.execute("SELECT id, physical_name, logical_name FROM files ORDER BY id").fetchall()
+    assert [tuple(row) for row in rows] == [(1, "a", "a.txt"), (2, "a", "b.txt"), (3, "c", "c.txt")]
+    assert db_connection.execute("SELECT file_id FROM file_match").fetchone()[0] == 2
+    assert not (files_dir / "2026" / "10" / "b").exists()
+    assert dedup_existing(db_connection, files_dir)["hashed"] == 0
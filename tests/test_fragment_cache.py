@@ -0,0 +1,29 @@
+from app.core.fragment_cache import FragmentCache
+
+
+def test_lru_bounded_by_bytes():
+    cache = FragmentCache(max_bytes=10)
+    cache.put(("t", 1, 1, "a"), "aaaa")
+    cache.put(("t", 2, 1, "b"), "bbbb")
+    assert cache.get(("t", 1, 1, "a")) == "aaaa"
+    cache.put(("t", 3, 1, "c"), "cccc")  # 가장 오래 안 쓴 board 2 항목 제거
+
+    assert cache.get(("t", 2, 1, "b")) is None
+    stats = cache.stats()
+    assert stats["bytes"] == 8 and stats["evictions"] == 1
+    assert stats["hits"] == 1 and stats["misses"] == 1 and stats["hit_rate"] == 0.5
+
+
+def test_new_version_drops_old_entries():
+    cache = FragmentCache()
+    cache.put(("t", 1, 5, "p1"), "old1")
+    cache.put(("t", 1, 5, "p2"), "old2")
+    cache.put(("t", 1, 6, "p1"), "new1")
+    assert cache.stats()["entries"] == 1
+
+    # 이전 버전으로 늦게 렌더링된 결과는 저장하지 않음
+    cache.put(("t", 1, 5, "p2"), "stale")
+    assert cache.get(("t", 1, 5, "p2")) is None
+
+    cache.invalidate_board(1)
+    assert cache.stats()["entries"] == 0 and cache.stats()["bytes"] == 0
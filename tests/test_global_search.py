@@ -0,0 +1,93 @@
+import json
+import sqlite3
+from pathlib import Path
+
+from app.core.board_registry import BoardRegistry
+from app.utils.global_search import rebuild_all, reconcile_global_search, remove_board, search_global, sync_pending
+
+DDL_PATH = Path(__file__).parent.parent / "app/resources/sqls/autoboard_ddl.sql"
+
+
+def _insert_board(conn, name, table):
+    cursor = conn.cursor()
+    cursor.execute("INSERT INTO boards (name, physical_table_name) VALUES (?, ?)", (name, table))
+    board_id = cursor.lastrowid
+    columns = [{"name": "col1", "data_type": "string"}, {"name": "col2", "data_type": "text"},
+               {"name": "col3", "data_type": "integer"}]
+    cursor.execute(
+        "INSERT INTO meta_data (board_id, name, meta, schema) VALUES (?, 'table', ?, 'v1')",
+        (board_id, json.dumps({"columns": columns}))
+    )
+    cursor.execute(f"CREATE TABLE {table} (id INTEGER PRIMARY KEY AUTOINCREMENT, col1 TEXT, col2 TEXT, col3 INTEGER)")
+    conn.commit()
+    return board_id
+
+
+def test_global_search_spans_boards_and_tracks_changes(db_connection):
+    diary = _insert_board(db_connection, "일기", "table_1")
+    movie = _insert_board(db_connection, "영화", "table_2")
+    db_connection.execute("INSERT INTO table_1 (col1, col2) VALUES ('산책', '<p>공원에서 <b>산책</b>했다</p>')")
+    db_connection.commit()
+
+    registry = BoardRegistry()
+    assert reconcile_global_search(db_connection, registry.get(db_connection, diary)) == {"action": "reindexed", "rows": 1}
+    assert reconcile_global_search(db_connection, registry.get(db_connection, movie)) == {"action": "reindexed", "rows": 0}
+    assert reconcile_global_search(db_connection, registry.get(db_connection, diary)) == {"action": "none"}
+
+    # 트리거가 대기열에 기록 → sync_pending 으로 증분 반영
+    db_connection.execute("INSERT INTO table_2 (col1, col2) VALUES ('산책하는 영화', '좋았다')")
+    assert search_global(db_connection, "산책하는") == []
+    assert sync_pending(db_connection, registry) == 1
+    results = search_global(db_connection, "산책")
+    assert {(r["board_name"], r["record_id"]) for r in results} == {("일기", 1), ("영화", 1)}
+    assert all("<mark>" in r["title"] for r in results)
+    assert "<p>" not in results[0]["snippet"] + results[1]["snippet"]
+
+    db_connection.execute("UPDATE table_1 SET col1 = '독서', col2 = '책' WHERE id = 1")
+    sync_pending(db_connection, registry)
+    assert [r["board_id"] for r in search_global(db_connection, "산책")] == [movie]
+
+    db_connection.execute("DELETE FROM table_2 WHERE id = 1")
+    assert search_global(db_connection, "산책") == []
+
+    remove_board(db_connection, diary)
+    assert search_global(db_connection, "독서") == []
+    assert rebuild_all(db_connection) == {diary: 1, movie: 0}
+    assert [r["board_id"] for r in search_global(db_connection, "독서")] == [diary]
+
+
+def test_plain_connection_can_write_board_tables(tmp_path):
+    # 트리거가 앱 전용 SQL 함수를 쓰지 않음 → sqlite3 CLI / 백업 스크립트 등 일반 커넥션도 쓰기 가능
+    db_path = tmp_path / "plain.db"
+    conn = sqlite3.connect(db_path)
+    conn.executescript(open(DDL_PATH, encoding="utf-8").read())
+    board_id = _insert_board(conn, "일기", "table_1")
+    registry = BoardRegistry()
+    reconcile_global_search(conn, registry.get(conn, board_id))
+    conn.close()
+
+    other = sqlite3.connect(db_path)
+    other.execute("INSERT INTO table_1 (col1, col2) VALUES ('외부 입력', '<p>백업에서 <i>복원</i></p>')")
+    other.commit()
+    other.close()
+
+    conn = sqlite3.connect(db_path)
+    assert sync_pending(conn, registry) == 1
+    results = search_global(conn, "복원")
+    assert [r["record_id"] for r in results] == [1] and "<i>" not in results[0]["snippet"]
+    conn.close()
+
+
+def test_board_created_in_step1_is_searchable_right_away(db_connection):
+    from app.routes.board import _save_step1
+
+    board_id = _save_step1(db_connection, {"name": "생물", "columns": [{"label": "이름", "data_type": "string"}]})
+    triggers = {row[0] for row in db_connection.execute(
+        "SELECT name FROM sqlite_master WHERE type = 'trigger' AND tbl_name = 'table_1'"
+    )}
+    assert {"table_1_gs_ai", "table_1_gs_au", "table_1_gs_ad"} <= triggers
+
+    # Step 2 저장 / 재시작 전에도 새 레코드가 통합 검색에 반영
+    db_connection.execute("INSERT INTO table_1 (col1) VALUES ('zebrafish')")
+    assert sync_pending(db_connection) == 1
+    assert [hit["board_id"] for hit in search_global(db_connection, "zebrafish")] == [board_id]
@@ -0,0 +1,68 @@
+import asyncio
+import hashlib
+
+import pytest
+from starlette.requests import Request
+
+from app.utils.file_store import UploadTooLargeError
+from app.utils.multipart_upload import MultipartUploadError, receive_multipart
+
+BOUNDARY = "testboundary"
+
+
+def _body(parts):
+    body = b""
+    for name, filename, data in parts:
+        disposition = f'form-data; name="{name}"' + (f'; filename="{filename}"' if filename else "")
+        body += f"--{BOUNDARY}\r\nContent-Disposition: {disposition}\r\n".encode()
+        if filename:
+            body += b"Content-Type: text/plain\r\n"
+        body += b"\r\n" + data + b"\r\n"
+    return body + f"--{BOUNDARY}--\r\n".encode()
+
+
+def _request(body, chunk_size=1000):
+    chunks = [body[i:i + chunk_size] for i in range(0, len(body), chunk_size)]
+    sent = []
+
+    async def receive():
+        chunk = chunks[len(sent)]
+        sent.append(chunk)
+        return {"type": "http.request", "body": chunk, "more_body": len(sent) < len(chunks)}
+
+    scope = {
+        "type": "http", "method": "POST", "path": "/",
+        "headers": [(b"content-type", f"multipart/form-data; boundary={BOUNDARY}".encode())],
+    }
+    return Request(scope, receive), sent, len(chunks)
+
+
+def test_receive_multipart_streams_files(tmp_path):
+    first, second = b"a" * 5000, "한글".encode() * 10
+    request, _, _ = _request(_body([("files", "a.txt", first), ("note", None, b"x"), ("files", "b.txt", second)]))
+
+    received = asyncio.run(receive_multipart(request, "files", tmp_path, max_bytes=10000, chunk_size=1024))
+
+    assert [(r["logical_name"], r["mime"], r["size"]) for r in received] == [
+        ("a.txt", "text/plain", 5000), ("b.txt", "text/plain", len(second))
+    ]
+    assert received[0]["sha256"] == hashlib.sha256(first).hexdigest()
+    assert received[1]["path"].read_bytes() == second
+
+
+def test_receive_multipart_stops_reading_over_max_size(tmp_path):
+    request, sent, total = _request(_body([("files", "big.bin", b"x" * 100_000)]))
+
+    with pytest.raises(UploadTooLargeError):
+        asyncio.run(receive_multipart(request, "files", tmp_path, max_bytes=5000, chunk_size=1024))
+
+    # 나머지 본문은 읽지 않고 중단, 임시 파일도 남지 않음
+    assert len(sent) < total // 10
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_receive_multipart_rejects_truncated_body(tmp_path):
+    request, _, _ = _request(_body([("files", "a.txt", b"data" * 100)])[:-22])
+    with pytest.raises(MultipartUploadError):
+        asyncio.run(receive_multipart(request, "files", tmp_path))
+    assert list(tmp_path.iterdir()) == []
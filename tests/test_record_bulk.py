@@ -0,0 +1,48 @@
+import pytest
+
+from app.utils.record_bulk import build_set, build_target, bulk_delete, bulk_update
+from app.utils.write_plan import WritePlanError
+
+
+def _board(conn, board_entry):
+    board = board_entry(["col1", {"name": "col2", "data_type": "integer"}], conn=conn)
+    conn.executemany("INSERT INTO table_1 (col1, col2) VALUES (?, ?)", [(f"r{i}", i % 3) for i in range(9)])
+    return board
+
+
+def test_bulk_update_and_delete(db_connection, board_entry):
+    board = _board(db_connection, board_entry)
+
+    set_sql, set_params = build_set(board, {"col1": "done"})
+    where, params = build_target(board, filters={"col2": [0, 1]})
+    assert bulk_update(db_connection, board, set_sql, set_params, where, params) == 6
+
+    where, params = build_target(board, ids=[1, 2, 3, 999])
+    assert bulk_delete(db_connection, board, where, params) == 3
+    assert db_connection.execute("SELECT COUNT(*) FROM table_1 WHERE col1 = 'done'").fetchone()[0] == 4
+
+
+def test_bulk_rejects_unsafe_targets(db_connection, board_entry):
+    board = _board(db_connection, board_entry)
+    with pytest.raises(ValueError):
+        build_target(board)
+    with pytest.raises(ValueError):
+        build_target(board, filters={"col1; DROP TABLE table_1": 1})
+    with pytest.raises(ValueError):
+        build_set(board, {"id": 5})
+
+
+def test_bulk_filter_values_are_coerced_like_writes(db_connection, board_entry):
+    board = board_entry(
+        [{"name": "flag", "data_type": "boolean"}, {"name": "day", "data_type": "ymd"}], conn=db_connection
+    )
+    db_connection.executemany(
+        "INSERT INTO table_1 (flag, day) VALUES (?, ?)", [(1, "2026-10-18"), (0, "2026-10-18"), (1, "2026-10-19")]
+    )
+
+    where, params = build_target(board, filters={"flag": "true", "day": ["2026/10/18", "20261019"]})
+    assert bulk_delete(db_connection, board, where, params) == 2
+
+    with pytest.raises(WritePlanError) as error:
+        build_target(board, filters={"flag": {"$gt": 0}, "day": "어제", "nope": 1})
+    assert len(error.value.errors) == 3
@@ -0,0 +1,37 @@
+import csv
+import io
+import json
+
+from app.utils import record_export
+from app.utils.record_export import iter_export
+from app.utils.record_query import resolve_list_query
+
+
+def test_export_streams_batches_with_label_headers(tmp_path, monkeypatch, board_entry):
+    import sqlite3
+    db_path = str(tmp_path / "export.db")
+    conn = sqlite3.connect(db_path)
+    conn.execute(
+        "CREATE TABLE table_1 (id INTEGER PRIMARY KEY, col1 TEXT, col2 INTEGER, "
+        "created_at TEXT DEFAULT '2026-01-01', updated_at TEXT DEFAULT '2026-01-02')"
+    )
+    conn.executemany("INSERT INTO table_1 (col1, col2) VALUES (?, ?)", [(f"r{i}", i) for i in range(5)])
+    conn.commit()
+    conn.close()
+    monkeypatch.setattr(record_export, "create_connection", lambda: sqlite3.connect(db_path))
+
+    board = board_entry([
+        {"name": "col1", "label": "제목", "data_type": "string"},
+        {"name": "col2", "label": "제목", "data_type": "integer"},
+    ])
+    lq = resolve_list_query(board, sort="id", order="asc")
+
+    chunks = list(iter_export(board, lq, "csv", batch_size=2))
+    assert len(chunks) == 3
+    rows = list(csv.reader(io.StringIO(b"".join(chunks).decode("utf-8-sig"))))
+    assert rows[0] == ["id", "제목", "col2", "생성일", "수정일"]
+    assert rows[1] == ["1", "r0", "0", "2026-01-01", "2026-01-02"]
+    assert len(rows) == 6
+
+    lines = b"".join(iter_export(board, lq, "jsonl")).decode("utf-8").splitlines()
+    assert json.loads(lines[-1]) == {"id": 5, "제목": "r4", "col2": 4, "생성일": "2026-01-01", "수정일": "2026-01-02"}
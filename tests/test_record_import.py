@@ -0,0 +1,66 @@
+import io
+import json
+
+import pytest
+
+from app.utils.coerce import get_coercer
+from app.utils.record_import import ImportPlan, ImportResult, insert_chunk, iter_source_rows, prepare_chunk
+
+
+COLUMNS = [
+    {"name": "col1", "label": "제목", "data_type": "string"},
+    {"name": "col2", "label": "날짜", "data_type": "ymd"},
+    {"name": "col3", "label": "수량", "data_type": "integer"},
+    {"name": "col4", "label": "완료", "data_type": "boolean"},
+]
+
+
+def test_coercers():
+    assert get_coercer("integer")("1,234") == 1234
+    assert get_coercer("integer")("") is None
+    assert get_coercer("real")("3.5") == 3.5
+    assert get_coercer("boolean")("예") == 1
+    assert get_coercer("ymd")("2024.01.05") == "2024-01-05"
+    assert get_coercer("datetime")("2024-01-05T10:30") == "2024-01-05 10:30:00"
+    with pytest.raises(ValueError):
+        get_coercer("integer")("1.5")
+    with pytest.raises(ValueError):
+        get_coercer("ymd")("어제")
+
+
+def test_csv_rows_map_labels_and_report_errors(db_connection, board_entry):
+    board = board_entry(COLUMNS, conn=db_connection)
+    data = "﻿제목,날짜,col3,완료,비고\n첫째,2024/01/02,10,yes,x\n둘째,잘못된날짜,5,no,\n셋째,,\"1,000\",0,\n"
+    plan = ImportPlan(board)
+    result = ImportResult()
+    rows = iter_source_rows(io.BytesIO(data.encode("utf-8")), "csv")
+
+    chunk, done = prepare_chunk(rows, plan, 2, result)
+    assert not done and [line for line, _ in chunk] == [2, 4]
+    assert insert_chunk(db_connection, plan, chunk) == (2, [])
+    assert prepare_chunk(rows, plan, 2, result) == ([], True)
+
+    assert result.total_rows == 3
+    assert result.errors == [{"line": 3, "error": "날짜: 날짜 형식이 아닙니다: 잘못된날짜"}]
+    assert plan.unknown_headers == ["비고"]
+    assert [tuple(r) for r in db_connection.execute("SELECT col1, col2, col3, col4 FROM table_1 ORDER BY id")] == [
+        ("첫째", "2024-01-02", 10, 1), ("셋째", None, 1000, 0)
+    ]
+
+
+def test_jsonl_bad_lines_and_constraint_fallback(db_connection, board_entry):
+    # col1 NOT NULL → 제약 위반 행만 따로 실패
+    board = board_entry(COLUMNS)
+    db_connection.execute(
+        "CREATE TABLE table_1 (id INTEGER PRIMARY KEY, col1 TEXT NOT NULL, col2 TEXT, col3 INTEGER, col4 INTEGER)"
+    )
+    lines = [json.dumps({"col1": "a", "수량": 1}), "{broken", json.dumps({"col3": 2}), "[1]"]
+    plan = ImportPlan(board)
+    result = ImportResult()
+    rows = iter_source_rows(io.BytesIO("\n".join(lines).encode("utf-8")), "jsonl")
+
+    chunk, done = prepare_chunk(rows, plan, 100, result)
+    assert done and len(chunk) == 2
+    inserted, errors = insert_chunk(db_connection, plan, chunk)
+    assert inserted == 1 and [line for line, _ in errors] == [3]
+    assert [e["line"] for e in result.errors] == [2, 4]
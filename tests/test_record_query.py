@@ -0,0 +1,109 @@
+import pytest
+
+from app.utils.record_query import fetch_record_keyset, fetch_record_page, resolve_list_query
+
+COLUMNS = ["col1", {"name": "col2", "data_type": "integer"}]
+
+
+def _board(conn, board_entry, list_meta):
+    board = board_entry(COLUMNS, list_meta, conn=conn)
+    conn.executemany(
+        "INSERT INTO table_1 (col1, col2) VALUES (?, ?)",
+        [(f"item {i}", i % 3) for i in range(7)] + [("100%_done", 9)]
+    )
+    return board
+
+
+def test_list_meta_drives_page_size_sort_and_search(db_connection, board_entry):
+    board = _board(db_connection, board_entry, {
+        "pagination": {"page_size": 3},
+        "default_sort": [{"column": "col2", "order": "asc"}],
+        "search": {"enabled": True, "simple_fields": ["col1"]},
+    })
+
+    lq = resolve_list_query(board, page=3)
+    result = fetch_record_page(db_connection, board, lq)
+    assert (result["total_count"], result["total_pages"], result["page"]) == (8, 3, 3)
+    assert result["sort"] == "col2" and result["order"] == "asc"
+    assert [r["col2"] for r in result["records"]] == [2, 9]
+
+    # 와일드카드 문자는 escape 되어 문자 그대로 검색
+    result = fetch_record_page(db_connection, board, resolve_list_query(board, q="%_"))
+    assert [r["col1"] for r in result["records"]] == ["100%_done"]
+
+
+def test_unknown_sort_column_falls_back_to_default(db_connection, board_entry):
+    board = _board(db_connection, board_entry, {})
+
+    lq = resolve_list_query(board, sort="col1; DROP TABLE table_1", page=99, page_size=1000)
+    assert lq.sort == (("id", "DESC"),)
+    assert lq.page_size == 200
+    assert lq.search is None
+
+    result = fetch_record_page(db_connection, board, lq)
+    assert result["page"] == 1
+    assert result["records"][0]["id"] == 8
+
+
+def test_keyset_pages_match_offset_pages(db_connection, board_entry):
+    board = _board(db_connection, board_entry, {"default_sort": [{"column": "col2", "order": "desc"}]})
+    lq = resolve_list_query(board, page_size=3)
+    expected = [r["id"] for p in (1, 2, 3)
+                for r in fetch_record_page(db_connection, board, resolve_list_query(board, page=p, page_size=3))["records"]]
+
+    seen, after = [], None
+    while True:
+        result = fetch_record_keyset(db_connection, board, lq, after=after)
+        seen += [r["id"] for r in result["records"]]
+        if not result["next_cursor"]:
+            break
+        after = result["next_cursor"]
+    assert seen == expected
+
+    # 마지막 페이지에서 before 로 되돌아가기
+    back = fetch_record_keyset(db_connection, board, lq, before=result["prev_cursor"])
+    assert [r["id"] for r in back["records"]] == expected[3:6]
+
+
+def test_keyset_rejects_foreign_cursor(db_connection, board_entry):
+    board = _board(db_connection, board_entry, {})
+    lq = resolve_list_query(board, page_size=2)
+    token = fetch_record_keyset(db_connection, board, lq)["next_cursor"]
+
+    other = resolve_list_query(board, page_size=2, sort="col1", order="asc")
+    with pytest.raises(ValueError):
+        fetch_record_keyset(db_connection, board, other, after=token)
+    with pytest.raises(ValueError):
+        fetch_record_keyset(db_connection, board, lq, after="not-a-cursor")
+
+
+def test_keyset_follows_multi_column_sort_with_nulls(db_connection, board_entry):
+    board = _board(db_connection, board_entry, {"default_sort": [
+        {"column": "col2", "order": "asc"}, {"column": "col1", "order": "desc"}
+    ]})
+    # 첫 번째 키가 같은 행이 많고, 두 키 모두 NULL 인 행도 섞음
+    db_connection.executemany(
+        "INSERT INTO table_1 (col1, col2) VALUES (?, ?)",
+        [(None, 1), ("item 1", None), (None, None), ("item 4", 1)]
+    )
+    lq = resolve_list_query(board, page_size=3)
+    pages = [fetch_record_page(db_connection, board, resolve_list_query(board, page=p, page_size=3))["records"]
+             for p in (1, 2, 3, 4)]
+    expected = [r["id"] for page in pages for r in page]
+
+    seen, after, result = [], None, None
+    while True:
+        result = fetch_record_keyset(db_connection, board, lq, after=after)
+        seen += [r["id"] for r in result["records"]]
+        if not result["next_cursor"]:
+            break
+        after = result["next_cursor"]
+    assert seen == expected
+
+    # offset 페이지가 준 cursor 로 이어 읽어도 같은 순서
+    first = fetch_record_page(db_connection, board, lq)
+    assert [r["id"] for r in fetch_record_keyset(db_connection, board, lq, after=first["next_cursor"])["records"]] \
+        == expected[3:6]
+
+    back = fetch_record_keyset(db_connection, board, lq, before=result["prev_cursor"])
+    assert [r["id"] for r in back["records"]] == expected[6:9]
@@ -0,0 +1,75 @@
+from app.utils.record_query import resolve_list_query
+from app.utils.record_stats import compute_stats, reconcile_summary, summary_table_name
+
+COLUMNS = [
+    {"name": "col1", "label": "메모", "data_type": "string"},
+    {"name": "col2", "label": "수축기", "data_type": "integer"},
+    {"name": "col3", "label": "측정일", "data_type": "datetime"},
+]
+
+
+def _board(board_entry, stats=None):
+    return board_entry(COLUMNS, {"search": {"simple_fields": ["col1"]}, "stats": stats or {}}, name="혈압")
+
+
+def _setup(conn, board_entry):
+    board_entry(COLUMNS, conn=conn)
+    rows = [
+        ("아침", 120, "2026-10-05 08:00:00"),
+        ("저녁", 130, "2026-10-05 20:00:00"),
+        ("아침", 140, "2026-10-06 08:00:00"),
+        ("아침", None, "2026-11-01 08:00:00"),
+        ("미기록", 110, None),
+    ]
+    conn.executemany("INSERT INTO table_1 (col1, col2, col3) VALUES (?, ?, ?)", rows)
+    conn.commit()
+
+
+def test_table_aggregates_and_buckets(db_connection, board_entry):
+    _setup(db_connection, board_entry)
+    board = _board(board_entry)
+
+    result = compute_stats(db_connection, board, resolve_list_query(board), bucket="month")
+    assert result["source"] == "table"
+    assert result["count"] == 5
+    assert result["columns"]["col2"] == {"count": 4, "min": 110, "max": 140, "avg": 125.0, "sum": 500}
+    assert [(b["bucket"], b["count"]) for b in result["series"]["buckets"]] == [("2026-10", 3), ("2026-11", 1)]
+
+    week = compute_stats(db_connection, board, resolve_list_query(board), bucket="week")
+    assert [b["bucket"] for b in week["series"]["buckets"]] == ["2026-10-05", "2026-10-26"]
+
+    filtered = compute_stats(db_connection, board, resolve_list_query(board, q="저녁"))
+    assert filtered["count"] == 1 and filtered["columns"]["col2"]["sum"] == 130
+
+
+def test_summary_table_matches_table_scan(db_connection, board_entry):
+    _setup(db_connection, board_entry)
+    board = _board(board_entry, {"summary_date_column": "col3"})
+    assert reconcile_summary(db_connection, board)["action"] == "rebuilt"
+    assert reconcile_summary(db_connection, board)["action"] == "none"
+
+    # 트리거로 증분 유지 (INSERT 증분, UPDATE/DELETE 는 해당 날짜 재계산)
+    db_connection.execute("INSERT INTO table_1 (col1, col2, col3) VALUES ('점심', 100, '2026-10-05 12:00:00')")
+    db_connection.execute("UPDATE table_1 SET col3 = '2026-10-07 08:00:00' WHERE col2 = 140")
+    db_connection.execute("DELETE FROM table_1 WHERE col2 = 120")
+    db_connection.commit()
+
+    lq = resolve_list_query(board)
+    summary = compute_stats(db_connection, board, lq, bucket="day")
+    assert summary["source"] == "summary"
+
+    db_connection.execute(f"DROP TABLE {summary_table_name('table_1')}")
+    scanned = compute_stats(db_connection, board, lq, bucket="day")
+    assert scanned["source"] == "table"
+    for key in ("count", "columns"):
+        assert summary[key] == scanned[key]
+    assert summary["series"]["buckets"] == scanned["series"]["buckets"]
+    assert [b["bucket"] for b in summary["series"]["buckets"]] == ["2026-10-05", "2026-10-07", "2026-11-01"]
+
+
+def test_summary_dropped_when_disabled(db_connection, board_entry):
+    _setup(db_connection, board_entry)
+    reconcile_summary(db_connection, _board(board_entry, {"summary_date_column": "col3"}))
+    assert reconcile_summary(db_connection, _board(board_entry))["action"] == "dropped"
+    names = [r[0] for r in db_connection.execute("SELECT name FROM sqlite_master WHERE name LIKE 'table_1_st%'")]
+    assert names == []
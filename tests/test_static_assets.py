@@ -0,0 +1,69 @@
+import gzip
+
+from starlette.applications import Starlette
+from starlette.routing import Mount
+from starlette.testclient import TestClient
+
+from app.core.static_assets import FingerprintedStaticFiles, StaticAssetManifest, _accepts_gzip
+
+
+def _client(tmp_path, **manifest_kwargs):
+    static_dir = tmp_path / "static"
+    (static_dir / "js").mkdir(parents=True)
+    (static_dir / "js" / "app.js").write_text("console.log('x');\n" * 200, encoding="utf-8")
+    (static_dir / "js" / "tiny.js").write_text("1;", encoding="utf-8")
+    manifest = StaticAssetManifest(static_dir, gzip_min_size=256, **manifest_kwargs).build()
+    app = Starlette(routes=[Mount("/static", FingerprintedStaticFiles(manifest=manifest))])
+    return manifest, TestClient(app)
+
+
+def test_fingerprinted_url_is_immutable_and_gzipped(tmp_path):
+    manifest, client = _client(tmp_path)
+    url = manifest.url("js/app.js")
+    assert url.startswith("/static/js/app.") and url.endswith(".js") and url != "/static/js/app.js"
+
+    response = client.get(url, headers={"Accept-Encoding": "gzip"})
+    assert response.status_code == 200
+    assert "immutable" in response.headers["cache-control"]
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert response.text.startswith("console.log")
+
+    raw = client.get(url, headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in raw.headers
+    assert raw.content == (tmp_path / "static" / "js" / "app.js").read_bytes()
+    assert raw.headers["etag"] != response.headers["etag"]
+
+    again = client.get(url, headers={"Accept-Encoding": "gzip", "If-None-Match": response.headers["etag"]})
+    assert again.status_code == 304
+
+
+def test_logical_name_revalidates_and_small_files_stay_plain(tmp_path):
+    manifest, client = _client(tmp_path)
+    response = client.get("/static/js/app.js", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["cache-control"] == "no-cache"
+
+    tiny = client.get(manifest.url("js/tiny.js"), headers={"Accept-Encoding": "gzip"})
+    assert tiny.text == "1;" and "content-encoding" not in tiny.headers
+    assert manifest.url("js/missing.js") == "/static/js/missing.js"
+    assert client.get("/static/js/missing.js").status_code == 404
+
+
+def test_auto_refresh_rehashes_changed_file(tmp_path):
+    manifest, client = _client(tmp_path, auto_refresh=True)
+    old_url = manifest.url("js/app.js")
+    path = tmp_path / "static" / "js" / "app.js"
+    path.write_text("changed();\n" * 100, encoding="utf-8")
+
+    new_url = manifest.url("js/app.js")
+    assert new_url != old_url
+    body = client.get(new_url, headers={"Accept-Encoding": "gzip"}).content
+    assert body.startswith(b"changed();")
+    assert gzip.decompress(manifest.get("js/app.js").gzip_body) == path.read_bytes()
+
+
+def test_accepts_gzip():
+    assert _accepts_gzip("gzip, deflate, br")
+    assert _accepts_gzip("br;q=1.0, gzip;q=0.8")
+    assert not _accepts_gzip("gzip;q=0")
+    assert not _accepts_gzip("identity")
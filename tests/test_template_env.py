@@ -0,0 +1,24 @@
+from app.core.template_env import compile_report, create_environment, precompile_templates
+
+
+def test_precompile_writes_bytecode_cache(tmp_path):
+    template_dir = tmp_path / "templates"
+    (template_dir / "record").mkdir(parents=True)
+    (template_dir / "base.html").write_text("<b>{% block content %}{% endblock %}</b>", encoding="utf-8")
+    (template_dir / "record" / "page.html").write_text(
+        '{% extends "base.html" %}{% block content %}{{ name }}{% endblock %}', encoding="utf-8"
+    )
+    (template_dir / "broken.html").write_text("{% if %}", encoding="utf-8")
+    cache_dir = tmp_path / "cache"
+
+    env = create_environment(template_dir, cache_dir, auto_reload=False)
+    timings = precompile_templates(env)
+
+    assert set(timings) == {"base.html", "record/page.html"}
+    assert list(cache_dir.iterdir())
+    stats = compile_report.stats()
+    assert stats["templates"] == 2 and "broken.html" in stats["errors"] and stats["auto_reload"] is False
+
+    # 새 Environment 도 디스크 bytecode 로 로드
+    env2 = create_environment(template_dir, cache_dir, auto_reload=False)
+    assert env2.get_template("record/page.html").render(name="<x>") == "<b>&lt;x&gt;</b>"
@@ -0,0 +1,61 @@
+import asyncio
+
+import pytest
+
+from app.core.thumbnailer import Thumbnailer, is_image
+from app.utils.file_store import derivative_path, failure_marker_path
+
+
+def test_is_image():
+    assert is_image("image/jpeg") and is_image("IMAGE/PNG")
+    assert not is_image("image/svg+xml") and not is_image("application/pdf") and not is_image(None)
+
+
+def test_ensure_generates_thumb_and_preview(tmp_path):
+    Image = pytest.importorskip("PIL.Image")
+    original = tmp_path / "blob"
+    Image.new("RGBA", (800, 400), (255, 0, 0, 128)).save(original, "PNG")
+    thumbnailer = Thumbnailer(thumb_size=64, preview_size=200)
+
+    async def scenario():
+        # 동시 요청은 생성 작업 1개를 공유
+        return await asyncio.gather(
+            thumbnailer.ensure(original, "thumb"), thumbnailer.ensure(original, "preview")
+        )
+
+    thumb, preview = asyncio.run(scenario())
+    assert thumb == derivative_path(original, "thumb")
+    with Image.open(thumb) as image:
+        assert image.size == (64, 64) and image.format == "JPEG"
+    with Image.open(preview) as image:
+        assert image.size == (200, 100)
+    assert thumbnailer.stats()["generated"] == 1
+
+
+def test_enqueue_is_bounded(tmp_path):
+    pytest.importorskip("PIL")
+    thumbnailer = Thumbnailer(queue_size=1)
+
+    async def scenario():
+        await thumbnailer.start()
+        # 워커가 꺼내기 전에 두 번 등록 → 하나는 버려짐 (요청 시 생성)
+        accepted = [thumbnailer.enqueue(tmp_path / "a"), thumbnailer.enqueue(tmp_path / "b")]
+        await thumbnailer.stop()
+        return accepted
+
+    assert asyncio.run(scenario()) == [True, False]
+    assert thumbnailer.stats()["dropped"] == 1
+
+
+def test_not_an_image_returns_none(tmp_path):
+    pytest.importorskip("PIL")
+    original = tmp_path / "blob"
+    original.write_bytes(b"not an image")
+    thumbnailer = Thumbnailer()
+    assert asyncio.run(thumbnailer.ensure(original, "thumb")) is None
+    assert failure_marker_path(original).exists()
+
+    # 실패는 기억 → 다시 디코딩하지 않음
+    assert asyncio.run(thumbnailer.ensure(original, "preview")) is None
+    stats = thumbnailer.stats()
+    assert (stats["failed"], stats["skipped"], stats["lazy"]) == (1, 1, 1)
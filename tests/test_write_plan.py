@@ -0,0 +1,36 @@
+import pytest
+
+from app.utils.write_plan import WritePlanError, get_write_plan
+
+
+COLUMNS = [
+    {"name": "col1", "data_type": "string"},
+    {"name": "col2", "data_type": "integer"},
+    {"name": "col3", "data_type": "ymd"},
+]
+
+
+def test_plan_is_cached_per_registry_entry(board_entry):
+    board = board_entry(COLUMNS, board_id=7)
+    assert get_write_plan(board) is get_write_plan(board)
+    # invalidate 후 새 항목이 오면 다시 컴파일
+    assert get_write_plan(board_entry(COLUMNS, board_id=7)) is not get_write_plan(board)
+
+
+def test_partial_updates_share_one_statement(db_connection, board_entry):
+    plan = get_write_plan(board_entry(COLUMNS, conn=db_connection, board_id=7))
+
+    values = plan.coerce({"col1": "a", "col2": "12", "col3": "2024/1/5", "id": 99})
+    assert values == {"col1": "a", "col2": 12, "col3": "2024-01-05"}
+    db_connection.execute(plan.insert_sql, plan.insert_params(values))
+
+    db_connection.execute(plan.update_sql, plan.update_params(plan.coerce({"col2": 13}), 1))
+    db_connection.execute(plan.update_sql, plan.update_params(plan.coerce({"col1": None}), 1))
+    assert tuple(db_connection.execute("SELECT col1, col2, col3 FROM table_7").fetchone()) == (None, 13, "2024-01-05")
+
+
+def test_unknown_columns_and_bad_values_are_rejected(board_entry):
+    plan = get_write_plan(board_entry(COLUMNS, board_id=7))
+    with pytest.raises(WritePlanError) as exc:
+        plan.coerce({"col9": 1, "col2": "abc", "col1); DROP TABLE x; --": 1})
+    assert len(exc.value.errors) == 3
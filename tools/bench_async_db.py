@@ -0,0 +1,107 @@
+# bench_async_db.py
+"""
+모듈 설명:
+    - AsyncDB 벤치마크: 느린 쿼리 1개와 빠른 요청 N개를 동시에 실행
+주요 기능:
+    - blocking : async 핸들러에서 cursor.execute를 직접 호출 (기존 방식)
+    - async_db : AsyncDB 워커 스레드에서 실행
+    - 빠른 요청의 지연시간(예정 도착 시각 → 응답)을 비교해 느린 쿼리 뒤에 줄서지 않는지 확인
+
+실행:
+    python tools/bench_async_db.py [--fast 20] [--slow-rows 3000000]
+
+작성자: 김도영
+작성일: 2026-10-18
+버전: 1.0
+"""
+import argparse
+import asyncio
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from app.core.async_db import AsyncDB
+from app.core.db_pool import ConnectionPool
+
+SLOW_SQL = """
+    WITH RECURSIVE n(x) AS (SELECT 1 UNION ALL SELECT x + 1 FROM n WHERE x < ?)
+    SELECT SUM(x % 7) FROM n
+"""
+FAST_SQL = "SELECT COUNT(*) FROM boards"
+ARRIVAL_DELAY = 0.005  # 빠른 요청은 느린 쿼리 시작 직후 도착
+
+
+def report(name: str, latencies: list, elapsed: float) -> None:
+    ms = sorted(x * 1000 for x in latencies)
+    print(
+        f"{name:<10} fast={len(ms):>3}  "
+        f"p50={statistics.median(ms):8.2f}ms  max={ms[-1]:8.2f}ms  total={elapsed * 1000:8.1f}ms"
+    )
+
+
+async def bench_blocking(pool: ConnectionPool, fast: int, slow_rows: int) -> None:
+    latencies = []
+    started = time.perf_counter()
+    arrived = started + ARRIVAL_DELAY
+
+    async def slow_handler():
+        with pool.connection() as conn:
+            conn.execute(SLOW_SQL, (slow_rows,)).fetchone()
+
+    async def fast_handler():
+        await asyncio.sleep(ARRIVAL_DELAY)
+        with pool.connection() as conn:
+            conn.execute(FAST_SQL).fetchone()
+        latencies.append(time.perf_counter() - arrived)
+
+    await asyncio.gather(slow_handler(), *[fast_handler() for _ in range(fast)])
+    report("blocking", latencies, time.perf_counter() - started)
+
+
+async def bench_async_db(db: AsyncDB, fast: int, slow_rows: int) -> None:
+    latencies = []
+    started = time.perf_counter()
+    arrived = started + ARRIVAL_DELAY
+
+    async def fast_handler():
+        await asyncio.sleep(ARRIVAL_DELAY)
+        await db.fetch_value(FAST_SQL)
+        latencies.append(time.perf_counter() - arrived)
+
+    await asyncio.gather(
+        db.fetch_value(SLOW_SQL, (slow_rows,)),
+        *[fast_handler() for _ in range(fast)],
+    )
+    report("async_db", latencies, time.perf_counter() - started)
+
+
+async def main(fast: int, slow_rows: int, workers: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        pool = ConnectionPool(str(Path(tmp) / "bench.db"), size=workers, timeout=30)
+        with pool.connection() as conn:
+            conn.execute("CREATE TABLE boards (id INTEGER PRIMARY KEY, name TEXT)")
+            conn.execute("INSERT INTO boards (name) VALUES ('bench')")
+            conn.commit()
+
+        await bench_blocking(pool, fast, slow_rows)
+
+        db = AsyncDB(pool)
+        await bench_async_db(db, fast, slow_rows)
+
+        db.shutdown()
+        pool.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="AsyncDB concurrency benchmark")
+    parser.add_argument("--fast", type=int, default=20, help="동시 빠른 요청 수")
+    parser.add_argument("--slow-rows", type=int, default=3_000_000, help="느린 쿼리 반복 수")
+    parser.add_argument("--workers", type=int, default=4, help="풀/워커 크기")
+    args = parser.parse_args()
+    asyncio.run(main(args.fast, args.slow_rows, args.workers))
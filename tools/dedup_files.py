@@ -0,0 +1,54 @@
+# dedup_files.py
+"""
+모듈 설명:
+    - 첨부 파일 중복 제거 마이그레이션 CLI (1회성)
+주요 기능:
+    - content_hash 가 없는 files 행의 물리 파일 SHA-256 계산
+    - 같은 내용의 행이 물리 파일 1개를 공유하도록 변경 (행 / 파일명 / file_match 유지) 후 중복 물리 파일 삭제
+    - --dry-run 으로 대상만 집계
+
+실행:
+    python tools/dedup_files.py [--dry-run] [--db ./data/db/autoboard.db] [--files-dir ./data/files]
+
+작성자: 김도영
+작성일: 2026-10-18
+버전: 1.0
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from app.core.config import settings
+from app.core.db_pool import create_connection
+from app.utils.file_store import dedup_existing
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="첨부 파일 중복 제거 (내용 해시 기준)")
+    parser.add_argument("--dry-run", action="store_true", help="변경 없이 대상만 출력")
+    parser.add_argument("--db", help="DB 경로 (기본: settings.DB_PATH)")
+    parser.add_argument("--files-dir", help="첨부 파일 디렉토리 (기본: settings.FILES_DIR)")
+    args = parser.parse_args()
+
+    files_dir = Path(args.files_dir) if args.files_dir else settings.FILES_DIR
+    conn = create_connection(args.db)
+    try:
+        started = time.perf_counter()
+        result = dedup_existing(conn, files_dir, dry_run=args.dry_run)
+        if result["missing"]:
+            print(f"물리 파일 없음 (files.id): {result['missing']}")
+        print(f"{'[dry-run] ' if args.dry_run else ''}해시 계산={result['hashed']}, "
+              f"중복 그룹={result['groups']}, 공유로 바뀐 행={result['relinked_rows']}, "
+              f"해제={result['bytes_freed']}B, {time.perf_counter() - started:.2f}s")
+        return 0
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
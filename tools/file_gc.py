@@ -0,0 +1,64 @@
+# file_gc.py
+"""
+모듈 설명:
+    - 고아 첨부 파일 정리 CLI
+주요 기능:
+    - 없는 보드 / 레코드를 가리키는 file_match, DB 행이 없는 물리 파일 삭제
+    - 연결(file_match)이 없는 files 행은 --include-unmatched 일 때만 삭제
+    - 서버 실행 중에도 사용 가능 (작은 배치마다 커밋)
+    - --dry-run 으로 삭제 대상과 확보될 바이트 수만 출력
+
+실행:
+    python tools/file_gc.py [--dry-run] [--include-unmatched] [--grace-hours 24] [--batch-size 200] [--db ./data/db/autoboard.db]
+
+작성자: 김도영
+작성일: 2026-10-18
+버전: 1.0
+"""
+import argparse
+import sys
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from app.core.config import settings
+from app.core.db_pool import create_connection
+from app.utils.file_gc import collect_garbage
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="고아 첨부 파일 정리")
+    parser.add_argument("--dry-run", action="store_true", help="삭제하지 않고 대상만 집계")
+    parser.add_argument("--include-unmatched", action="store_true", default=settings.FILE_GC_UNMATCHED,
+                        help="file_match 가 없는 files 행도 삭제 (기본: FILE_GC_UNMATCHED)")
+    parser.add_argument("--grace-hours", type=float, default=settings.FILE_GC_GRACE_HOURS,
+                        help="이보다 최근 파일은 제외 (기본: FILE_GC_GRACE_HOURS)")
+    parser.add_argument("--batch-size", type=int, default=settings.FILE_GC_BATCH_SIZE, help="트랜잭션당 삭제 건수")
+    parser.add_argument("--db", help="DB 경로 (기본: settings.DB_PATH)")
+    parser.add_argument("--files-dir", help="첨부 파일 디렉토리 (기본: settings.FILES_DIR)")
+    args = parser.parse_args()
+
+    conn = create_connection(args.db)
+    try:
+        result = collect_garbage(
+            conn,
+            files_dir=Path(args.files_dir) if args.files_dir else settings.FILES_DIR,
+            grace_seconds=args.grace_hours * 3600,
+            batch_size=args.batch_size,
+            dry_run=args.dry_run,
+            include_unmatched=args.include_unmatched,
+        )
+    finally:
+        conn.close()
+
+    print(f"{'[dry-run] ' if args.dry_run else ''}file_match={result['matches']}, files={result['files']}, "
+          f"물리 파일={result['blobs']}, 썸네일={result['derived']}, 임시 파일={result['temp']}")
+    print(f"해제: {result['bytes_freed']}B ({result['bytes_freed'] / 1024 / 1024:.2f}MB), "
+          f"batches={result['batches']}, {result['elapsed_s']}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
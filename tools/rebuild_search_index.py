@@ -0,0 +1,65 @@
+# rebuild_search_index.py
+"""
+모듈 설명:
+    - 통합 검색 색인(search_index) 재구성 CLI
+주요 기능:
+    - 모든 보드(또는 --board 로 지정한 보드)의 통합 검색 트리거 재생성 + 기존 레코드 재색인
+    - 서버 실행 중에도 사용 가능 (id 구간별로 짧게 커밋)
+
+실행:
+    python tools/rebuild_search_index.py [--board 3] [--db ./data/db/autoboard.db]
+
+작성자: 김도영
+작성일: 2026-10-18
+버전: 1.0
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from app.core.board_registry import board_registry
+from app.core.db_pool import create_connection
+from app.utils.global_search import SEARCH_INDEX, rebuild_all, reconcile_global_search
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="통합 검색 색인 재구성")
+    parser.add_argument("--board", type=int, help="재색인할 보드 id (생략 시 전체)")
+    parser.add_argument("--db", help="DB 경로 (기본: settings.DB_PATH)")
+    args = parser.parse_args()
+
+    conn = create_connection(args.db)
+    try:
+        exists = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = ?", (SEARCH_INDEX,)
+        ).fetchone()
+        if not exists:
+            print(f"{SEARCH_INDEX} 테이블이 없습니다. 서버를 한 번 실행해 스키마를 초기화하세요.")
+            return 1
+
+        started = time.perf_counter()
+        if args.board:
+            board = board_registry.get(conn, args.board)
+            if board is None:
+                print(f"보드를 찾을 수 없습니다: {args.board}")
+                return 1
+            result = {args.board: reconcile_global_search(conn, board, force=True).get("rows", 0)}
+        else:
+            result = rebuild_all(conn)
+
+        for board_id, rows in result.items():
+            print(f"board {board_id}: {rows} rows")
+        print(f"완료: boards={len(result)}, rows={sum(result.values())}, "
+              f"{time.perf_counter() - started:.2f}s")
+        return 0
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())